@@ -0,0 +1,151 @@
+"""Throughput benchmarks for parsing, metrics and report rendering.
+
+Written in AirSpeed Velocity style (``time_*`` methods with ``params`` and
+``setup``), so asv can collect them, and also runnable on their own from
+the repo root:
+
+    python -m benchmarks.bench_renderers
+"""
+
+import tempfile
+import timeit
+from pathlib import Path
+
+from src.processor import (
+    parse_items,
+    calculate_metrics,
+    group_by_status,
+    group_by_priority,
+    group_by_assignee,
+)
+from src.renderers.html_renderer import HTMLRenderer
+from src.renderers.md_renderer import MarkdownRenderer
+from src.renderers.csv_renderer import CSVRenderer
+from src.renderers.json_renderer import JSONRenderer
+
+STATUSES = ("Backlog", "Todo", "Pending", "In Progress", "In Review", "Done")
+PRIORITIES = ("P🔥", "P0", "P1", "P2")
+
+
+def generate_raw_items(n: int) -> list:
+    """
+    Build ``n`` raw items in the gh item-list format.
+
+    Args:
+        n: Number of items
+
+    Returns:
+        List of raw item dictionaries
+    """
+    return [
+        {
+            "id": f"PVTI_{i}",
+            "title": f"تسک شماره {i}",
+            "status": STATUSES[i % len(STATUSES)],
+            "priority": PRIORITIES[i % len(PRIORITIES)],
+            "assignees": [f"user{i % 7}"],
+            "estimate (Hrs)": float(i % 10 + 1),
+            "labels": ["bench"],
+            "content": {
+                "url": f"https://github.com/test/repo/issues/{i}",
+                "repository": "test/repo",
+                "number": i
+            }
+        }
+        for i in range(n)
+    ]
+
+
+class ProcessingSuite:
+    """Parsing, metric calculation and grouping over scaled inputs."""
+
+    params = [100, 1000, 10000]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.raw_items = generate_raw_items(n)
+        self.items = parse_items(self.raw_items)
+
+    def time_parse_items(self, n):
+        parse_items(self.raw_items)
+
+    def time_calculate_metrics(self, n):
+        calculate_metrics(self.items)
+
+    def time_group_by_status(self, n):
+        group_by_status(self.items)
+
+    def time_group_by_priority(self, n):
+        group_by_priority(self.items)
+
+    def time_group_by_assignee(self, n):
+        group_by_assignee(self.items)
+
+
+class RendererSuite:
+    """Report rendering for every output format over scaled inputs."""
+
+    params = [100, 1000, 10000]
+    param_names = ['n']
+
+    def setup(self, n):
+        # Inputs and renderers are prepared outside the timed methods
+        self.items = parse_items(generate_raw_items(n))
+        self.metrics = calculate_metrics(self.items)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tmp_dir.name)
+        self.renderers = {
+            'html': HTMLRenderer(),
+            'md': MarkdownRenderer(),
+            'csv': CSVRenderer(),
+            'json': JSONRenderer()
+        }
+        # Load the Jinja2 template before timing
+        self.renderers['html'].template
+
+    def teardown(self, n):
+        self.tmp_dir.cleanup()
+
+    def _render(self, format_type):
+        self.renderers[format_type].render(
+            items=self.items,
+            metrics=self.metrics,
+            output_path=str(self.output_dir / f"report.{format_type}"),
+            project_name="Benchmark",
+            owner="BenchOrg",
+            project_number=1
+        )
+
+    def time_html(self, n):
+        self._render('html')
+
+    def time_markdown(self, n):
+        self._render('md')
+
+    def time_csv(self, n):
+        self._render('csv')
+
+    def time_json(self, n):
+        self._render('json')
+
+
+def main(repeat: int = 5) -> None:
+    """Run every suite without asv and print the best time per benchmark."""
+    for suite_class in (ProcessingSuite, RendererSuite):
+        for n in suite_class.params:
+            suite = suite_class()
+            suite.setup(n)
+            try:
+                for name in sorted(dir(suite)):
+                    if not name.startswith('time_'):
+                        continue
+                    method = getattr(suite, name)
+                    best = min(timeit.repeat(lambda: method(n), number=1, repeat=repeat))
+                    print(f"{suite_class.__name__}.{name}[n={n}]: {best * 1000:.2f} ms")
+            finally:
+                if hasattr(suite, 'teardown'):
+                    suite.teardown(n)
+
+
+if __name__ == '__main__':
+    main()
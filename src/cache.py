@@ -0,0 +1,134 @@
+"""On-disk cache for GitHub CLI responses shared between runs."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+CACHE_DIR = Path.home() / '.cache' / 'andropay-tpm'
+
+# Token variables gh prefers over its stored login
+_GH_TOKEN_VARS = ('GH_TOKEN', 'GITHUB_TOKEN', 'GH_ENTERPRISE_TOKEN', 'GITHUB_ENTERPRISE_TOKEN')
+
+
+def _gh_config_dir() -> Path:
+    """Locate the gh config directory the way gh itself does."""
+    if os.environ.get('GH_CONFIG_DIR'):
+        return Path(os.environ['GH_CONFIG_DIR'])
+    if os.environ.get('XDG_CONFIG_HOME'):
+        return Path(os.environ['XDG_CONFIG_HOME']) / 'gh'
+    if os.name == 'nt' and os.environ.get('AppData'):
+        return Path(os.environ['AppData']) / 'GitHub CLI'
+    return Path.home() / '.config' / 'gh'
+
+
+def _gh_user(host: str) -> str:
+    """
+    Read the active gh login for ``host`` from hosts.yml.
+
+    Only the host's direct ``user:`` entry is needed, so the file is scanned
+    line by line rather than pulling in a YAML parser.
+
+    Args:
+        host: GitHub host, e.g. github.com
+        
+    Returns:
+        The login name, or an empty string if it cannot be determined
+    """
+    try:
+        lines = (_gh_config_dir() / 'hosts.yml').read_text(encoding='utf-8').splitlines()
+    except OSError:
+        return ''
+
+    in_host = False
+    child_indent = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        indent = len(line) - len(line.lstrip())
+        if indent == 0:
+            in_host = stripped.rstrip(':').strip('"\'') == host
+            child_indent = None
+        elif in_host:
+            if child_indent is None:
+                child_indent = indent
+            if indent == child_indent and stripped.startswith('user:'):
+                return stripped[len('user:'):].strip().strip('"\'')
+    return ''
+
+
+def gh_account() -> str:
+    """
+    Identify the gh account whose credentials a gh call will use.
+
+    Combines the host, the stored login and a digest of any token set in
+    the environment, so cached responses are never shared between accounts.
+
+    Returns:
+        An opaque identity string; no network call or gh process is involved
+    """
+    host = os.environ.get('GH_HOST') or 'github.com'
+    token = next((os.environ[name] for name in _GH_TOKEN_VARS if os.environ.get(name)), '')
+    token_digest = hashlib.sha256(token.encode('utf-8')).hexdigest() if token else ''
+    return '\0'.join((host, _gh_user(host), token_digest))
+
+
+def get_or_fetch(
+    key: str,
+    ttl_seconds: float,
+    fetch: Callable[[], bytes],
+    cache_dir: Optional[Path] = None
+) -> bytes:
+    """
+    Return cached bytes for ``key`` if fresh, otherwise fetch and store them.
+
+    Entries are files named after a hash of the key, aged by their mtime.
+    The directory is private to the user (0700) and entries are written
+    0600, since they can hold private project data. A failed fetch stores
+    nothing, and a cache directory that cannot be read or written only
+    costs the speedup, never the fetch.
+
+    Args:
+        key: Cache key, e.g. the gh command line
+        ttl_seconds: Maximum entry age; 0 or less disables the cache
+        fetch: Callable producing fresh bytes on a miss
+        cache_dir: Directory holding entries (default: CACHE_DIR)
+
+    Returns:
+        Cached or freshly fetched bytes
+    """
+    if ttl_seconds <= 0:
+        return fetch()
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else CACHE_DIR
+    path = cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    try:
+        if time.time() - path.stat().st_mtime < ttl_seconds:
+            return path.read_bytes()
+    except OSError:
+        pass
+
+    data = fetch()
+
+    # Write to a temp file and rename so a concurrent run never reads a
+    # half-written entry; a directory left group/world-accessible by an
+    # older run is tightened first, and nothing is written if that fails
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if cache_dir.stat().st_mode & 0o077:
+            os.chmod(cache_dir, 0o700)
+        fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+    return data
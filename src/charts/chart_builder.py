@@ -1,7 +1,67 @@
 """Chart generation using Plotly."""
 
+import functools
 import json
-from typing import Dict
+from bisect import bisect_right
+from typing import BinaryIO, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+from src.config import WORKLOAD_THRESHOLDS
+
+
+PRIORITY_COLORS = {
+    'P🔥': '#ef4444',  # Red
+    'P0': '#f97316',   # Orange
+    'P1': '#eab308',   # Yellow
+    'P2': '#3b82f6'    # Blue
+}
+DEFAULT_PRIORITY_COLOR = '#6b7280'  # Gray
+
+# Hex colors for the WORKLOAD_THRESHOLDS buckets
+WORKLOAD_COLORS = ('#22c55e', '#eab308', '#ef4444')
+
+PLANNED_UNPLANNED_LABELS = ('برنامه‌ریزی شده', 'برنامه‌ریزی نشده')
+PLANNED_UNPLANNED_COLORS = ('#22c55e', '#ef4444')  # Green, Red
+
+
+def _dumps(chart_config: dict) -> bytes:
+    """
+    Serialize chart configuration to UTF-8 encoded JSON.
+    
+    Uses orjson when available; it emits UTF-8 natively, so Persian labels
+    stay readable without an ``ensure_ascii`` flag.
+    
+    Args:
+        chart_config: Plotly chart configuration
+        
+    Returns:
+        UTF-8 encoded JSON of the configuration
+    """
+    if orjson is not None:
+        return orjson.dumps(chart_config)
+    return json.dumps(chart_config, ensure_ascii=False).encode('utf-8')
+
+
+def _split_items(data: Dict[str, int]) -> Tuple[tuple, tuple]:
+    """
+    Split a label-to-count mapping into parallel label and value tuples.
+    
+    Tuples keep the result hashable so it can be used as a cache key.
+    
+    Args:
+        data: Dictionary mapping labels to counts
+        
+    Returns:
+        Tuple of (labels, values) in the dictionary's order
+    """
+    if not data:
+        return (), ()
+    labels, values = zip(*data.items())
+    return labels, values
 
 
 class ChartBuilder:
@@ -15,6 +75,49 @@ class ChartBuilder:
                 'size': 14
             }
         }
+        font = self.rtl_config['font']
+        
+        # Layouts never change between calls, so build them once and only
+        # inject the per-call data traces
+        self._status_pie_layout = {
+            'title': {'text': 'توزیع وضعیت', 'font': font},
+            'font': font,
+            'showlegend': True
+        }
+        self._status_bar_layout = {
+            'title': {'text': 'توزیع وضعیت (نمودار میله‌ای)', 'font': font},
+            'font': font,
+            'xaxis': {'title': 'وضعیت'},
+            'yaxis': {'title': 'تعداد'}
+        }
+        self._priority_layout = {
+            'title': {'text': 'توزیع اولویت', 'font': font},
+            'font': font,
+            'xaxis': {'title': 'تعداد'},
+            'yaxis': {'title': 'اولویت'}
+        }
+        self._planned_unplanned_layout = {
+            'title': {'text': 'برنامه‌ریزی شده در مقابل برنامه‌ریزی نشده', 'font': font},
+            'font': font,
+            'showlegend': True
+        }
+        self._team_workload_layout = {
+            'title': {'text': 'بار کاری تیم', 'font': font},
+            'font': font,
+            'xaxis': {'title': 'تعداد آیتم‌های فعال'},
+            'yaxis': {'title': 'عضو تیم'}
+        }
+        
+        # Identical chart data always yields identical JSON, so repeated
+        # renders of unchanged metrics skip building and serializing
+        self._render_bytes = functools.lru_cache(maxsize=128)(self._render_uncached)
+        
+        # Empty projects are common early on; answer those without hashing
+        # or touching the cache
+        self._empty_charts = {
+            chart_type: self._render_uncached(chart_type, (), ()).decode('utf-8')
+            for chart_type in ('status_pie', 'status_bar', 'priority', 'team_workload')
+        }
     
     def get_rtl_config(self) -> dict:
         """
@@ -35,25 +138,23 @@ class ChartBuilder:
         Returns:
             JSON string of Plotly chart configuration
         """
-        chart_config = {
+        if not data:
+            return self._empty_charts['status_pie']
+        return self._render('status_pie', *_split_items(data))
+    
+    def _build_status_pie_chart(self, labels: tuple, values: tuple) -> dict:
+        """Build status pie chart configuration."""
+        return {
             'data': [{
                 'type': 'pie',
-                'labels': list(data.keys()),
-                'values': list(data.values()),
+                'labels': labels,
+                'values': values,
                 'textinfo': 'label+percent',
                 'hoverinfo': 'label+value+percent',
                 'direction': 'clockwise'
             }],
-            'layout': {
-                'title': {
-                    'text': 'توزیع وضعیت',
-                    'font': self.rtl_config['font']
-                },
-                'font': self.rtl_config['font'],
-                'showlegend': True
-            }
+            'layout': self._status_pie_layout
         }
-        return json.dumps(chart_config, ensure_ascii=False)
     
     def create_status_bar_chart(self, data: Dict[str, int]) -> str:
         """
@@ -65,24 +166,21 @@ class ChartBuilder:
         Returns:
             JSON string of Plotly chart configuration
         """
-        chart_config = {
+        if not data:
+            return self._empty_charts['status_bar']
+        return self._render('status_bar', *_split_items(data))
+    
+    def _build_status_bar_chart(self, labels: tuple, values: tuple) -> dict:
+        """Build status bar chart configuration."""
+        return {
             'data': [{
                 'type': 'bar',
-                'x': list(data.keys()),
-                'y': list(data.values()),
+                'x': labels,
+                'y': values,
                 'hoverinfo': 'x+y'
             }],
-            'layout': {
-                'title': {
-                    'text': 'توزیع وضعیت (نمودار میله‌ای)',
-                    'font': self.rtl_config['font']
-                },
-                'font': self.rtl_config['font'],
-                'xaxis': {'title': 'وضعیت'},
-                'yaxis': {'title': 'تعداد'}
-            }
+            'layout': self._status_bar_layout
         }
-        return json.dumps(chart_config, ensure_ascii=False)
     
     def create_priority_chart(self, data: Dict[str, int]) -> str:
         """
@@ -94,19 +192,15 @@ class ChartBuilder:
         Returns:
             JSON string of Plotly chart configuration
         """
-        # Define priority colors
-        priority_colors = {
-            'P🔥': '#ef4444',  # Red
-            'P0': '#f97316',   # Orange
-            'P1': '#eab308',   # Yellow
-            'P2': '#3b82f6'    # Blue
-        }
-        
-        labels = list(data.keys())
-        values = list(data.values())
-        colors = [priority_colors.get(label, '#6b7280') for label in labels]
+        if not data:
+            return self._empty_charts['priority']
+        return self._render('priority', *_split_items(data))
+    
+    def _build_priority_chart(self, labels: tuple, values: tuple) -> dict:
+        """Build priority bar chart configuration."""
+        colors = [PRIORITY_COLORS.get(label, DEFAULT_PRIORITY_COLOR) for label in labels]
         
-        chart_config = {
+        return {
             'data': [{
                 'type': 'bar',
                 'orientation': 'h',
@@ -117,17 +211,8 @@ class ChartBuilder:
                 },
                 'hoverinfo': 'y+x'
             }],
-            'layout': {
-                'title': {
-                    'text': 'توزیع اولویت',
-                    'font': self.rtl_config['font']
-                },
-                'font': self.rtl_config['font'],
-                'xaxis': {'title': 'تعداد'},
-                'yaxis': {'title': 'اولویت'}
-            }
+            'layout': self._priority_layout
         }
-        return json.dumps(chart_config, ensure_ascii=False)
     
     def create_planned_vs_unplanned_chart(self, planned_count: int, unplanned_count: int) -> str:
         """
@@ -140,27 +225,23 @@ class ChartBuilder:
         Returns:
             JSON string of Plotly chart configuration
         """
-        chart_config = {
+        return self._render('planned_vs_unplanned', planned_count, unplanned_count)
+    
+    def _build_planned_vs_unplanned_chart(self, planned_count: int, unplanned_count: int) -> dict:
+        """Build planned vs unplanned pie chart configuration."""
+        return {
             'data': [{
                 'type': 'pie',
-                'labels': ['برنامه‌ریزی شده', 'برنامه‌ریزی نشده'],
+                'labels': PLANNED_UNPLANNED_LABELS,
                 'values': [planned_count, unplanned_count],
                 'marker': {
-                    'colors': ['#22c55e', '#ef4444']  # Green, Red
+                    'colors': PLANNED_UNPLANNED_COLORS
                 },
                 'textinfo': 'label+percent',
                 'hoverinfo': 'label+value+percent'
             }],
-            'layout': {
-                'title': {
-                    'text': 'برنامه‌ریزی شده در مقابل برنامه‌ریزی نشده',
-                    'font': self.rtl_config['font']
-                },
-                'font': self.rtl_config['font'],
-                'showlegend': True
-            }
+            'layout': self._planned_unplanned_layout
         }
-        return json.dumps(chart_config, ensure_ascii=False)
     
     def create_team_workload_chart(self, data: Dict[str, int]) -> str:
         """
@@ -172,20 +253,19 @@ class ChartBuilder:
         Returns:
             JSON string of Plotly chart configuration
         """
+        if not data:
+            return self._empty_charts['team_workload']
+        return self._render('team_workload', *_split_items(data))
+    
+    def _build_team_workload_chart(self, labels: tuple, values: tuple) -> dict:
+        """Build team workload bar chart configuration."""
         # Apply color coding based on workload
-        labels = list(data.keys())
-        values = list(data.values())
-        colors = []
-        
-        for count in values:
-            if count > 10:
-                colors.append('#ef4444')  # Red
-            elif count >= 6:
-                colors.append('#eab308')  # Yellow
-            else:
-                colors.append('#22c55e')  # Green
-        
-        chart_config = {
+        colors = [
+            WORKLOAD_COLORS[bisect_right(WORKLOAD_THRESHOLDS, count)]
+            for count in values
+        ]
+        
+        return {
             'data': [{
                 'type': 'bar',
                 'orientation': 'h',
@@ -196,14 +276,79 @@ class ChartBuilder:
                 },
                 'hoverinfo': 'y+x'
             }],
-            'layout': {
-                'title': {
-                    'text': 'بار کاری تیم',
-                    'font': self.rtl_config['font']
-                },
-                'font': self.rtl_config['font'],
-                'xaxis': {'title': 'تعداد آیتم‌های فعال'},
-                'yaxis': {'title': 'عضو تیم'}
-            }
+            'layout': self._team_workload_layout
         }
-        return json.dumps(chart_config, ensure_ascii=False)
+    
+    def write_status_pie_chart(self, data: Dict[str, int], fp: BinaryIO) -> None:
+        """
+        Write status pie chart JSON to a binary stream.
+        
+        Args:
+            data: Dictionary mapping status names to counts
+            fp: Binary file-like object to write UTF-8 JSON to
+        """
+        fp.write(self._render_bytes('status_pie', *_split_items(data)))
+    
+    def write_status_bar_chart(self, data: Dict[str, int], fp: BinaryIO) -> None:
+        """
+        Write status bar chart JSON to a binary stream.
+        
+        Args:
+            data: Dictionary mapping status names to counts
+            fp: Binary file-like object to write UTF-8 JSON to
+        """
+        fp.write(self._render_bytes('status_bar', *_split_items(data)))
+    
+    def write_priority_chart(self, data: Dict[str, int], fp: BinaryIO) -> None:
+        """
+        Write priority chart JSON to a binary stream.
+        
+        Args:
+            data: Dictionary mapping priority levels to counts
+            fp: Binary file-like object to write UTF-8 JSON to
+        """
+        fp.write(self._render_bytes('priority', *_split_items(data)))
+    
+    def write_planned_vs_unplanned_chart(
+        self,
+        planned_count: int,
+        unplanned_count: int,
+        fp: BinaryIO
+    ) -> None:
+        """
+        Write planned vs unplanned chart JSON to a binary stream.
+        
+        Args:
+            planned_count: Number of planned items
+            unplanned_count: Number of unplanned items
+            fp: Binary file-like object to write UTF-8 JSON to
+        """
+        fp.write(self._render_bytes('planned_vs_unplanned', planned_count, unplanned_count))
+    
+    def write_team_workload_chart(self, data: Dict[str, int], fp: BinaryIO) -> None:
+        """
+        Write team workload chart JSON to a binary stream.
+        
+        Args:
+            data: Dictionary mapping team member names to item counts
+            fp: Binary file-like object to write UTF-8 JSON to
+        """
+        fp.write(self._render_bytes('team_workload', *_split_items(data)))
+    
+    def _render(self, chart_type: str, *args) -> str:
+        """Return cached chart JSON decoded to a string."""
+        return self._render_bytes(chart_type, *args).decode('utf-8')
+    
+    def _render_uncached(self, chart_type: str, *args) -> bytes:
+        """
+        Build and serialize a chart configuration.
+        
+        Args:
+            chart_type: Chart name matching a ``_build_<chart_type>_chart`` method
+            *args: Hashable chart data passed to the builder
+            
+        Returns:
+            UTF-8 encoded JSON of the Plotly chart configuration
+        """
+        build_chart = getattr(self, f'_build_{chart_type}_chart')
+        return _dumps(build_chart(*args))
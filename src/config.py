@@ -1,17 +1,62 @@
 """Configuration management for GitHub Projects Reporter."""
 
+import functools
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 from argparse import Namespace
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# Raised for malformed config files by either parser (orjson's error subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+# Ordered for messages and CLI choices; the frozenset backs membership checks
+VALID_FORMATS = ("html", "md", "csv", "json")
+_VALID_FORMAT_SET = frozenset(VALID_FORMATS)
+
+# Workload buckets: < 6 green, 6-10 yellow, > 10 red (shared by the
+# processor's color names and the chart colors)
+WORKLOAD_THRESHOLDS = (6, 11)
+
+# Canonical validation messages, keyed by the field they check
+_VALIDATION_ERRORS = {
+    'owner': "owner cannot be empty",
+    'project_number': "project_number must be positive",
+    'format': f"format must be one of: {', '.join(VALID_FORMATS)}",
+    'output_directory': "output_directory cannot be empty"
+}
+
 
 class ConfigValidationError(Exception):
     """Raised when configuration validation fails."""
     pass
 
 
+@functools.lru_cache(maxsize=32)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Read and parse a config file, cached until the file changes.
+    
+    Args:
+        path: Absolute path to the config file
+        mtime_ns: File modification time; only used as part of the cache key
+        size: File size in bytes; only used as part of the cache key
+        
+    Returns:
+        Parsed config data
+    """
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 @dataclass
 class Config:
     """Configuration for the report generator."""
@@ -35,16 +80,16 @@ class Config:
         if config_path is None:
             config_path = "config.json"
         
-        config_file = Path(config_path)
-        
         # Use defaults if file doesn't exist
-        if not config_file.exists():
+        config_path = os.path.abspath(config_path)
+        try:
+            stat = os.stat(config_path)
+        except OSError:
             return cls()
         
         # Load from file
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_config_file(config_path, stat.st_mtime_ns, stat.st_size)
             
             return cls(
                 owner=data.get('owner', cls.owner),
@@ -52,16 +97,22 @@ class Config:
                 default_format=data.get('default_format', cls.default_format),
                 output_directory=data.get('output_directory', cls.output_directory)
             )
-        except (json.JSONDecodeError, IOError):
+        except (JSONDecodeError, IOError):
             # Return defaults if file is invalid
             return cls()
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop cached config files so the next load re-reads from disk."""
+        _read_config_file.cache_clear()
+    
     def merge_with_args(self, args: Namespace) -> 'Config':
         """
         Merge config with CLI arguments (args take precedence).
         
         Args:
-            args: Parsed command-line arguments
+            args: Parsed command-line arguments; must define owner,
+                project_number, format and output (as main's parser does)
             
         Returns:
             New Config instance with merged values
@@ -69,30 +120,37 @@ class Config:
         return Config(
             owner=args.owner if args.owner is not None else self.owner,
             project_number=args.project_number if args.project_number is not None else self.project_number,
-            default_format=args.format if hasattr(args, 'format') and args.format is not None else self.default_format,
-            output_directory=args.output if hasattr(args, 'output') and args.output is not None else self.output_directory
+            default_format=args.format if args.format is not None else self.default_format,
+            output_directory=args.output if args.output is not None else self.output_directory
         )
     
     def validate(self) -> None:
         """
         Validate configuration values.
         
+        All checks run before raising, so one error reports every problem.
+        
         Raises:
-            ConfigValidationError: If any validation fails
+            ConfigValidationError: If any validation fails; the message
+                joins every failure with "; "
         """
+        errors = []
+        
         # Validate owner
         if not self.owner or not self.owner.strip():
-            raise ConfigValidationError("owner cannot be empty")
+            errors.append(_VALIDATION_ERRORS['owner'])
         
-        # Validate project_number
-        if self.project_number <= 0:
-            raise ConfigValidationError("project_number must be positive")
+        # Validate project_number (a non-int from config.json fails too)
+        if not isinstance(self.project_number, int) or self.project_number <= 0:
+            errors.append(_VALIDATION_ERRORS['project_number'])
         
         # Validate format
-        valid_formats = ["html", "md", "csv", "json"]
-        if self.default_format not in valid_formats:
-            raise ConfigValidationError(f"format must be one of: {', '.join(valid_formats)}")
+        if self.default_format not in _VALID_FORMAT_SET:
+            errors.append(_VALIDATION_ERRORS['format'])
         
         # Validate output_directory
         if not self.output_directory or not self.output_directory.strip():
-            raise ConfigValidationError("output_directory cannot be empty")
+            errors.append(_VALIDATION_ERRORS['output_directory'])
+        
+        if errors:
+            raise ConfigValidationError("; ".join(errors))
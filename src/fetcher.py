@@ -1,8 +1,19 @@
 """GitHub data fetcher using GitHub CLI."""
 
+import functools
 import subprocess
 import json
-from typing import List, Dict
+from typing import List, Dict, Tuple
+
+from src import cache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# Raised for malformed gh output by either parser (orjson's error subclasses it)
+JSONDecodeError = json.JSONDecodeError
 
 
 class GitHubCLIError(Exception):
@@ -10,45 +21,108 @@ class GitHubCLIError(Exception):
     pass
 
 
+def _decode_output(output) -> str:
+    """
+    Decode gh CLI output for error messages.
+    
+    Args:
+        output: Raw bytes from gh, or an already decoded str
+        
+    Returns:
+        Text with undecodable bytes replaced
+    """
+    if isinstance(output, bytes):
+        return output.decode('utf-8', errors='replace')
+    return output
+
+
+def _parse_json(output: bytes):
+    """
+    Parse gh CLI JSON output straight from bytes.
+    
+    Args:
+        output: Raw UTF-8 stdout from gh (a str is accepted too)
+        
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(output)
+    return json.loads(output)
+
+
 class GitHubFetcher:
     """Fetches data from GitHub Projects using gh CLI."""
     
-    def __init__(self, owner: str, project_number: int):
+    def __init__(self, owner: str, project_number: int, cache_ttl: float = 0):
         """
         Initialize fetcher with project details.
         
         Args:
             owner: GitHub organization or user
             project_number: Project number
+            cache_ttl: Seconds to reuse gh output cached on disk by an
+                earlier run (default 0: always fetch)
         """
         self.owner = owner
         self.project_number = project_number
+        self.cache_ttl = cache_ttl
+        # Per-instance cache so repeated identical gh calls in one run are free
+        self._cached_gh_command = functools.lru_cache(maxsize=32)(self._load_gh_output)
+    
+    def clear_cache(self) -> None:
+        """Drop cached gh CLI results so the next call hits GitHub again."""
+        self._cached_gh_command.cache_clear()
     
-    def _run_gh_command(self, args: List[str]) -> str:
+    def _run_gh_command(self, args: List[str]) -> bytes:
         """
         Execute GitHub CLI command and return output.
         
+        Results are cached per fetcher, keyed on the command arguments,
+        and on disk between runs when ``cache_ttl`` is set.
+        
+        Args:
+            args: Command arguments for gh CLI
+            
+        Returns:
+            Command stdout as raw bytes
+            
+        Raises:
+            GitHubCLIError: If command fails or gh is not installed
+        """
+        return self._cached_gh_command(tuple(args))
+    
+    def _load_gh_output(self, args: Tuple[str, ...]) -> bytes:
+        """Run gh through the on-disk cache (a no-op when cache_ttl is 0)."""
+        return cache.get_or_fetch(
+            '\0'.join((cache.gh_account(), *args)),
+            self.cache_ttl,
+            lambda: self._execute_gh_command(args)
+        )
+    
+    def _execute_gh_command(self, args: Tuple[str, ...]) -> bytes:
+        """
+        Run the gh CLI without caching.
+        
         Args:
             args: Command arguments for gh CLI
             
         Returns:
-            Command stdout as string
+            Command stdout as raw bytes
             
         Raises:
             GitHubCLIError: If command fails or gh is not installed
         """
         try:
             result = subprocess.run(
-                ['gh'] + args,
+                ['gh', *args],
                 capture_output=True,
-                text=True,
-                check=False,
-                encoding='utf-8'  # Force UTF-8 encoding
+                check=False
             )
             
             if result.returncode != 0:
                 raise GitHubCLIError(
-                    f"GitHub CLI command failed: {result.stderr}"
+                    f"GitHub CLI command failed: {_decode_output(result.stderr)}"
                 )
             
             return result.stdout
@@ -72,7 +146,7 @@ class GitHubFetcher:
             '--owner', self.owner,
             '--format', 'json'
         ])
-        return json.loads(output)
+        return _parse_json(output)
     
     def fetch_project_items(self, limit: int = 100) -> List[Dict]:
         """
@@ -90,7 +164,7 @@ class GitHubFetcher:
             '--format', 'json',
             '--limit', str(limit)
         ])
-        data = json.loads(output)
+        data = _parse_json(output)
         return data.get('items', [])
     
     def fetch_project_fields(self) -> List[Dict]:
@@ -105,5 +179,5 @@ class GitHubFetcher:
             '--owner', self.owner,
             '--format', 'json'
         ])
-        data = json.loads(output)
+        data = _parse_json(output)
         return data.get('fields', [])
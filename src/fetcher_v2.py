@@ -1,54 +1,194 @@
 """GitHub data fetcher v2 using GraphQL API for timestamp support."""
 
+import functools
 import subprocess
 import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
+from src import cache
+from src.fetcher import GitHubCLIError, _decode_output
 
-class GitHubCLIError(Exception):
-    """Raised when GitHub CLI command fails."""
-    pass
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+# GitHub caps GraphQL connection pages at 100 nodes
+PAGE_SIZE = 100
+
+# Project metadata and fields are only requested (withMetadata) on the
+# first page of fetch_all; item pages reuse the same document
+PROJECT_QUERY = '''
+query($owner: String!, $number: Int!, $first: Int!, $after: String, $withMetadata: Boolean!) {
+  organization(login: $owner) {
+    projectV2(number: $number) {
+      id @include(if: $withMetadata)
+      number @include(if: $withMetadata)
+      title @include(if: $withMetadata)
+      url @include(if: $withMetadata)
+      fields(first: 50) @include(if: $withMetadata) {
+        nodes {
+          __typename
+          ... on ProjectV2FieldCommon {
+            id
+            name
+          }
+          ... on ProjectV2SingleSelectField {
+            options {
+              id
+              name
+            }
+          }
+        }
+      }
+      items(first: $first, after: $after) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        nodes {
+          id
+          createdAt
+          updatedAt
+          fieldValues(first: 20) {
+            nodes {
+              ... on ProjectV2ItemFieldSingleSelectValue {
+                name
+                field {
+                  ... on ProjectV2SingleSelectField {
+                    name
+                  }
+                }
+              }
+              ... on ProjectV2ItemFieldNumberValue {
+                number
+                field {
+                  ... on ProjectV2Field {
+                    name
+                  }
+                }
+              }
+            }
+          }
+          content {
+            ... on Issue {
+              number
+              title
+              url
+              repository {
+                nameWithOwner
+              }
+              createdAt
+              updatedAt
+              closedAt
+              assignees(first: 10) {
+                nodes {
+                  login
+                }
+              }
+              labels(first: 10) {
+                nodes {
+                  name
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+'''
+
+
+def _parse_json(output: bytes):
+    """
+    Parse gh CLI JSON output straight from bytes.
+    
+    Args:
+        output: Raw UTF-8 stdout from gh (a str is accepted too)
+        
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(output)
+    return json.loads(output)
 
 
 class GitHubFetcherV2:
     """Fetches data from GitHub Projects using GraphQL API with timestamp support."""
     
-    def __init__(self, owner: str, project_number: int):
+    def __init__(self, owner: str, project_number: int, cache_ttl: float = 0):
         """
         Initialize fetcher with project details.
         
         Args:
             owner: GitHub organization or user
             project_number: Project number
+            cache_ttl: Seconds to reuse gh output cached on disk by an
+                earlier run (default 0: always fetch)
         """
         self.owner = owner
         self.project_number = project_number
+        self.cache_ttl = cache_ttl
+        # Per-instance cache so repeated identical gh calls in one run are free
+        self._cached_gh_command = functools.lru_cache(maxsize=32)(self._load_gh_output)
+    
+    def clear_cache(self) -> None:
+        """Drop cached gh CLI results so the next call hits GitHub again."""
+        self._cached_gh_command.cache_clear()
     
-    def _run_gh_command(self, args: List[str]) -> str:
+    def _run_gh_command(self, args: List[str]) -> bytes:
         """
         Execute GitHub CLI command and return output.
         
+        Results are cached per fetcher, keyed on the command arguments,
+        and on disk between runs when ``cache_ttl`` is set.
+        
+        Args:
+            args: Command arguments for gh CLI
+            
+        Returns:
+            Command stdout as raw bytes
+            
+        Raises:
+            GitHubCLIError: If command fails or gh is not installed
+        """
+        return self._cached_gh_command(tuple(args))
+    
+    def _load_gh_output(self, args: Tuple[str, ...]) -> bytes:
+        """Run gh through the on-disk cache (a no-op when cache_ttl is 0)."""
+        return cache.get_or_fetch(
+            '\0'.join((cache.gh_account(), *args)),
+            self.cache_ttl,
+            lambda: self._execute_gh_command(args)
+        )
+    
+    def _execute_gh_command(self, args: Tuple[str, ...]) -> bytes:
+        """
+        Run the gh CLI without caching.
+        
         Args:
             args: Command arguments for gh CLI
             
         Returns:
-            Command stdout as string
+            Command stdout as raw bytes
             
         Raises:
             GitHubCLIError: If command fails or gh is not installed
         """
         try:
             result = subprocess.run(
-                ['gh'] + args,
+                ['gh', *args],
                 capture_output=True,
-                text=True,
-                check=False,
-                encoding='utf-8'
+                check=False
             )
             
             if result.returncode != 0:
                 raise GitHubCLIError(
-                    f"GitHub CLI command failed: {result.stderr}"
+                    f"GitHub CLI command failed: {_decode_output(result.stderr)}"
                 )
             
             return result.stdout
@@ -63,129 +203,162 @@ class GitHubFetcherV2:
         """
         Fetch project items with timestamp data using GraphQL.
         
+        Items are requested in pages of up to 100 and followed by cursor
+        until ``limit`` items are fetched or the project runs out.
+        
         Args:
             limit: Maximum number of items to fetch (default 100)
             
         Returns:
             List of project items with timestamp fields
         """
-        query = '''
-        query($owner: String!, $number: Int!, $limit: Int!) {
-          organization(login: $owner) {
-            projectV2(number: $number) {
-              items(first: $limit) {
-                nodes {
-                  id
-                  createdAt
-                  updatedAt
-                  fieldValues(first: 20) {
-                    nodes {
-                      ... on ProjectV2ItemFieldSingleSelectValue {
-                        name
-                        field {
-                          ... on ProjectV2SingleSelectField {
-                            name
-                          }
-                        }
-                      }
-                      ... on ProjectV2ItemFieldNumberValue {
-                        number
-                        field {
-                          ... on ProjectV2Field {
-                            name
-                          }
-                        }
-                      }
-                    }
-                  }
-                  content {
-                    ... on Issue {
-                      number
-                      title
-                      url
-                      repository {
-                        nameWithOwner
-                      }
-                      createdAt
-                      updatedAt
-                      closedAt
-                      assignees(first: 10) {
-                        nodes {
-                          login
-                        }
-                      }
-                      labels(first: 10) {
-                        nodes {
-                          name
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
+        _, nodes = self._fetch_project_pages(limit, with_metadata=False)
+        
+        # Transform GraphQL response to compatible format
+        return self._transform_nodes(nodes)
+    
+    def fetch_all(self, limit: int = 100) -> Tuple[Dict, List[Dict], List[Dict]]:
+        """
+        Fetch project details, items and fields in one GraphQL document.
+        
+        Metadata and fields ride along with the first items page, so small
+        projects need a single gh call instead of three.
+        
+        Args:
+            limit: Maximum number of items to fetch (default 100)
+            
+        Returns:
+            Tuple of (project details, items with timestamps, field definitions)
+        """
+        project, nodes = self._fetch_project_pages(limit, with_metadata=True)
+        
+        details = {
+            'id': project.get('id'),
+            'number': project.get('number'),
+            'title': project.get('title', ''),
+            'url': project.get('url', '')
         }
-        '''
+        fields = [
+            {
+                'id': field.get('id'),
+                'name': field.get('name', ''),
+                'type': field.get('__typename', ''),
+                **({'options': field['options']} if 'options' in field else {})
+            }
+            for field in (project.get('fields') or {}).get('nodes', [])
+            if field
+        ]
+        return details, self._transform_nodes(nodes), fields
+    
+    def _fetch_project_pages(self, limit: int, with_metadata: bool) -> Tuple[Dict, List[Dict]]:
+        """
+        Run the project query, following item cursors up to ``limit``.
         
-        output = self._run_gh_command([
-            'api', 'graphql',
-            '-f', f'query={query}',
-            '-F', f'owner={self.owner}',
-            '-F', f'number={self.project_number}',
-            '-F', f'limit={limit}'
-        ])
+        Args:
+            limit: Maximum number of item nodes to fetch
+            with_metadata: Also request project details and fields on the first page
+            
+        Returns:
+            Tuple of (projectV2 object from the first page, raw item nodes)
+        """
+        project = {}
+        nodes = []
+        cursor = None
+        while len(nodes) < limit:
+            include_metadata = with_metadata and cursor is None
+            args = [
+                'api', 'graphql',
+                '-f', f'query={PROJECT_QUERY}',
+                '-F', f'owner={self.owner}',
+                '-F', f'number={self.project_number}',
+                '-F', f'first={min(PAGE_SIZE, limit - len(nodes))}',
+                '-F', f'withMetadata={"true" if include_metadata else "false"}'
+            ]
+            # Omitting the cursor makes it null, which starts at the first page
+            if cursor:
+                args += ['-f', f'after={cursor}']
+            
+            data = _parse_json(self._run_gh_command(args))
+            # GitHub answers a non-org owner or unknown project with null roots
+            page_project = ((data.get('data') or {}).get('organization') or {}).get('projectV2')
+            if page_project is None:
+                raise GitHubCLIError(
+                    f"Project #{self.project_number} not found for organization '{self.owner}'"
+                )
+            if include_metadata:
+                project = page_project
+            page = page_project.get('items', {})
+            nodes.extend(page.get('nodes', []))
+            
+            page_info = page.get('pageInfo', {})
+            if not page_info.get('hasNextPage'):
+                break
+            cursor = page_info.get('endCursor')
         
-        data = json.loads(output)
+        return project, nodes
+    
+    def _transform_nodes(self, nodes: List[Dict]) -> List[Dict]:
+        """Convert GraphQL item nodes, dropping those without issue content."""
+        return [
+            item for item in (self._transform_node(node) for node in nodes)
+            if item is not None
+        ]
+    
+    def _transform_node(self, node: Dict) -> Optional[Dict]:
+        """
+        Convert a GraphQL project item node to the item-list dict format.
         
-        # Transform GraphQL response to compatible format
-        items = []
-        nodes = data.get('data', {}).get('organization', {}).get('projectV2', {}).get('items', {}).get('nodes', [])
+        Args:
+            node: ProjectV2 item node from the GraphQL response
+            
+        Returns:
+            Item dictionary with timestamp fields, or None for nodes
+            without issue content (e.g. draft items)
+        """
+        content = node.get('content')
+        if not content:
+            return None
         
-        for node in nodes:
-            content = node.get('content', {})
-            if not content:
+        # Extract field values
+        field_values = {}
+        for field_value in (node.get('fieldValues') or {}).get('nodes', []):
+            if not field_value:
                 continue
             
-            # Extract field values
-            field_values = {}
-            for field_value in node.get('fieldValues', {}).get('nodes', []):
-                if not field_value:
-                    continue
-                
-                field = field_value.get('field', {})
-                field_name = field.get('name', '')
-                
-                if 'name' in field_value:  # Single select
-                    field_values[field_name] = field_value['name']
-                elif 'number' in field_value:  # Number
-                    field_values[field_name] = field_value['number']
-            
-            # Build item with timestamps
-            item = {
-                'id': node.get('id'),
-                'title': content.get('title', ''),
-                'status': field_values.get('Status', 'Backlog'),
-                'priority': field_values.get('Priority', 'P2'),
-                'estimate (Hrs)': field_values.get('estimate (Hrs)'),
-                'labels': [label['name'] for label in content.get('labels', {}).get('nodes', [])],
-                'assignees': [assignee['login'] for assignee in content.get('assignees', {}).get('nodes', [])],
-                'repository': content.get('repository', {}).get('nameWithOwner', ''),
-                'content': {
-                    'number': content.get('number'),
-                    'title': content.get('title', ''),
-                    'url': content.get('url', ''),
-                    'repository': content.get('repository', {}).get('nameWithOwner', ''),
-                    'type': 'Issue'
-                },
-                # Timestamp fields
-                'project_created_at': node.get('createdAt'),
-                'project_updated_at': node.get('updatedAt'),
-                'issue_created_at': content.get('createdAt'),
-                'issue_updated_at': content.get('updatedAt'),
-                'issue_closed_at': content.get('closedAt')
-            }
+            field_name = (field_value.get('field') or {}).get('name', '')
             
-            items.append(item)
+            if 'name' in field_value:  # Single select
+                field_values[field_name] = field_value['name']
+            elif 'number' in field_value:  # Number
+                field_values[field_name] = field_value['number']
         
-        return items
+        # Resolve shared nested values once instead of per output key
+        title = content.get('title', '')
+        repository = (content.get('repository') or {}).get('nameWithOwner', '')
+        label_nodes = (content.get('labels') or {}).get('nodes', [])
+        assignee_nodes = (content.get('assignees') or {}).get('nodes', [])
+        
+        # Build item with timestamps
+        return {
+            'id': node.get('id'),
+            'title': title,
+            'status': field_values.get('Status', 'Backlog'),
+            'priority': field_values.get('Priority', 'P2'),
+            'estimate (Hrs)': field_values.get('estimate (Hrs)'),
+            'labels': [label['name'] for label in label_nodes],
+            'assignees': [assignee['login'] for assignee in assignee_nodes],
+            'repository': repository,
+            'content': {
+                'number': content.get('number'),
+                'title': title,
+                'url': content.get('url', ''),
+                'repository': repository,
+                'type': 'Issue'
+            },
+            # Timestamp fields
+            'project_created_at': node.get('createdAt'),
+            'project_updated_at': node.get('updatedAt'),
+            'issue_created_at': content.get('createdAt'),
+            'issue_updated_at': content.get('updatedAt'),
+            'issue_closed_at': content.get('closedAt')
+        }
@@ -2,16 +2,26 @@
 
 import sys
 import argparse
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
-from src.config import Config, ConfigValidationError
+from src.config import Config, ConfigValidationError, VALID_FORMATS
 from src.fetcher import GitHubFetcher, GitHubCLIError
 from src.processor import parse_items, calculate_metrics
-from src.snapshot import save_snapshot, load_latest_snapshot, compare_snapshots
-from src.renderers.html_renderer import HTMLRenderer
-from src.renderers.md_renderer import MarkdownRenderer
-from src.renderers.csv_renderer import CSVRenderer
-from src.renderers.json_renderer import JSONRenderer
+
+
+REPORT_TIMESTAMP_FORMAT = '%Y%m%d-%H%M%S'
+
+# Renderers are imported on demand so a run only pays for the one it uses
+# (the HTML renderer pulls in Jinja2)
+RENDERERS = {
+    'html': ('src.renderers.html_renderer', 'HTMLRenderer'),
+    'md': ('src.renderers.md_renderer', 'MarkdownRenderer'),
+    'csv': ('src.renderers.csv_renderer', 'CSVRenderer'),
+    'json': ('src.renderers.json_renderer', 'JSONRenderer')
+}
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
@@ -37,12 +47,16 @@ Examples:
 
   # Custom output location
   python -m src.main --output reports/my-report.html
+
+  # HTML then Markdown from one fetch
+  python -m src.main --cache-ttl 300
+  python -m src.main --format md --cache-ttl 300
         """
     )
     
     parser.add_argument(
         '--format',
-        choices=['html', 'md', 'csv', 'json'],
+        choices=VALID_FORMATS,
         help='Output format (default: from config or html)'
     )
     
@@ -75,6 +89,14 @@ Examples:
         help='Skip saving snapshot for weekly tracking'
     )
     
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=0,
+        metavar='SECONDS',
+        help='Reuse GitHub data fetched by a run in the last SECONDS (default: 0, off)'
+    )
+    
     return parser
 
 
@@ -88,17 +110,12 @@ def get_renderer(format_type: str):
     Returns:
         Renderer instance
     """
-    renderers = {
-        'html': HTMLRenderer,
-        'md': MarkdownRenderer,
-        'csv': CSVRenderer,
-        'json': JSONRenderer
-    }
-    
-    renderer_class = renderers.get(format_type)
-    if not renderer_class:
+    renderer_location = RENDERERS.get(format_type)
+    if not renderer_location:
         raise ValueError(f"Unknown format: {format_type}")
     
+    module_name, class_name = renderer_location
+    renderer_class = getattr(importlib.import_module(module_name), class_name)
     return renderer_class()
 
 
@@ -123,8 +140,7 @@ def main():
             output_dir = Path(config.output_directory)
             output_dir.mkdir(parents=True, exist_ok=True)
             # Add timestamp to filename
-            from datetime import datetime
-            timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            timestamp = datetime.now().strftime(REPORT_TIMESTAMP_FORMAT)
             output_path = str(output_dir / f"report-{timestamp}.{output_format}")
         
         # Fetch data from GitHub
@@ -132,14 +148,16 @@ def main():
         print(f"   Owner: {config.owner}")
         print(f"   Project: #{config.project_number}")
         
-        fetcher = GitHubFetcher(config.owner, config.project_number)
+        fetcher = GitHubFetcher(config.owner, config.project_number, cache_ttl=args.cache_ttl)
         
-        # Fetch project details
-        project_details = fetcher.fetch_project_details()
-        project_name = project_details.get('title', f'Project {config.project_number}')
+        # Details and items are independent gh calls, so run them in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            details_future = executor.submit(fetcher.fetch_project_details)
+            items_future = executor.submit(fetcher.fetch_project_items)
+            project_details = details_future.result()
+            raw_items = items_future.result()
         
-        # Fetch project items
-        raw_items = fetcher.fetch_project_items()
+        project_name = project_details.get('title', f'Project {config.project_number}')
         print(f"   Found {len(raw_items)} items")
         
         # Process data
@@ -153,24 +171,23 @@ def main():
         
         # Save snapshot for weekly tracking
         if not args.no_snapshot:
+            from src.snapshot import save_snapshot, load_snapshot_file, compare_snapshots
+            
             print("💾 Saving snapshot...")
             snapshot_path = save_snapshot(items)
             print(f"   Saved to: {snapshot_path}")
             
-            # Load and compare with previous snapshot
-            previous_items = load_latest_snapshot()
-            if previous_items and len(previous_items) > 0:
-                # Filter out the current snapshot we just saved
-                import os
+            # Compare with the previous snapshot. The newest file is the one
+            # just written from `items`, so it is not read back in
+            if items:
+                # Only the two newest files matter, so skip sorting the
+                # whole directory
+                import heapq
                 snapshots_dir = Path("snapshots")
-                snapshot_files = sorted(snapshots_dir.glob("snapshot-*.json"))
-                if len(snapshot_files) > 1:
+                newest_snapshots = heapq.nlargest(2, snapshots_dir.glob("snapshot-*.json"))
+                if len(newest_snapshots) > 1:
                     # Load the second most recent
-                    from src.snapshot import _deserialize_item
-                    import json
-                    with open(snapshot_files[-2], 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    previous_items = [_deserialize_item(item_data) for item_data in data["items"]]
+                    previous_items = load_snapshot_file(newest_snapshots[1])
                     
                     comparison = compare_snapshots(items, previous_items)
                     print(f"   📊 Changes since last snapshot:")
@@ -1,11 +1,11 @@
 """Data models for GitHub Projects Reporter."""
 
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-class Priority(Enum):
+class Priority(str, Enum):
     """Priority levels for project items."""
     
     FIRE = "P🔥"  # Unplanned urgent work
@@ -14,7 +14,7 @@ class Priority(Enum):
     P2 = "P2"     # Medium priority
 
 
-class Status(Enum):
+class Status(str, Enum):
     """Status values for project items."""
     
     BACKLOG = "Backlog"
@@ -26,7 +26,7 @@ class Status(Enum):
 
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectItem:
     """Represents a single item in the GitHub project."""
     
@@ -53,20 +53,20 @@ class ProjectItem:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectMetrics:
     """Calculated metrics for the project."""
     
-    total_items: int
-    total_estimate_hours: float
-    completion_percentage: float
-    planned_count: int
-    unplanned_count: int
-    unplanned_percentage: float
-    high_priority_not_started: int
-    items_by_status: dict
-    items_by_priority: dict
-    items_by_assignee: dict
+    total_items: int = 0
+    total_estimate_hours: float = 0.0
+    completion_percentage: float = 0.0
+    planned_count: int = 0
+    unplanned_count: int = 0
+    unplanned_percentage: float = 0.0
+    high_priority_not_started: int = 0
+    items_by_status: dict = field(default_factory=dict)
+    items_by_priority: dict = field(default_factory=dict)
+    items_by_assignee: dict = field(default_factory=dict)
     
     # Active work metrics (excluding Backlog)
     active_items: int = 0
@@ -81,3 +81,30 @@ class ProjectMetrics:
     unplanned_done_percentage: float = 0.0  # % of done tasks that were P🔥
     unplanned_done_count: int = 0  # Count of P🔥 tasks that are done
     active_unplanned_count: int = 0  # Count of P🔥 tasks in active work
+    
+    # Group sizes for charts and tables, derived from the groupings so the
+    # two can never disagree
+    @property
+    def status_counts(self) -> dict:
+        """Number of items per status."""
+        return {status: len(group) for status, group in self.items_by_status.items()}
+    
+    @property
+    def priority_counts(self) -> dict:
+        """Number of items per priority."""
+        return {priority: len(group) for priority, group in self.items_by_priority.items()}
+    
+    @property
+    def assignee_counts(self) -> dict:
+        """Number of items per assignee."""
+        return {assignee: len(group) for assignee, group in self.items_by_assignee.items()}
+    
+    @property
+    def assignee_active_counts(self) -> dict:
+        """Number of active (not Done) items per assignee, omitting idle assignees."""
+        counts = {}
+        for assignee, group in self.items_by_assignee.items():
+            active = sum(1 for item in group if item.is_active)
+            if active:
+                counts[assignee] = active
+        return counts
@@ -1,31 +1,14 @@
 """Data models v2 with timestamp support."""
 
-from enum import Enum
 from dataclasses import dataclass
 from typing import List, Optional
 
+# V2 items share the v1 enums and metrics class, so both flow through the
+# same processing and renderers
+from src.models import Priority, ProjectMetrics, Status
 
-class Priority(Enum):
-    """Priority levels for project items."""
-    
-    FIRE = "P🔥"
-    P0 = "P0"
-    P1 = "P1"
-    P2 = "P2"
-
-
-class Status(Enum):
-    """Status values for project items."""
-    
-    BACKLOG = "Backlog"
-    TODO = "Todo"
-    PENDING = "Pending"
-    IN_PROGRESS = "In Progress"
-    IN_REVIEW = "In Review"
-    DONE = "Done"
 
-
-@dataclass
+@dataclass(slots=True)
 class ProjectItemV2:
     """Project item with timestamp fields."""
     
@@ -56,29 +39,3 @@ class ProjectItemV2:
     def is_active(self) -> bool:
         """Check if item is active (not Done)."""
         return self.status != Status.DONE
-
-
-@dataclass
-class ProjectMetrics:
-    """Calculated metrics for the project."""
-    
-    total_items: int
-    total_estimate_hours: float
-    completion_percentage: float
-    planned_count: int
-    unplanned_count: int
-    unplanned_percentage: float
-    high_priority_not_started: int
-    items_by_status: dict
-    items_by_priority: dict
-    items_by_assignee: dict
-    active_items: int = 0
-    active_completion_percentage: float = 0.0
-    pending_items: int = 0
-    in_progress_items: int = 0
-    active_unplanned_percentage: float = 0.0
-    todo_items: int = 0
-    done_active_items: int = 0
-    unplanned_done_percentage: float = 0.0
-    unplanned_done_count: int = 0
-    active_unplanned_count: int = 0
@@ -1,7 +1,17 @@
 """Data processor for GitHub Projects data."""
 
+from bisect import bisect_right
+from collections import defaultdict
 from typing import List, Dict
-from src.models import ProjectItem, Priority, Status
+from src.config import WORKLOAD_THRESHOLDS
+from src.models import ProjectItem, ProjectMetrics, Priority, Status
+
+_STATUS_BY_VALUE = {status.value: status for status in Status}
+_PRIORITY_BY_VALUE = {priority.value: priority for priority in Priority}
+_NOT_STARTED_STATUSES = frozenset({Status.BACKLOG, Status.TODO})
+
+# Color names for the WORKLOAD_THRESHOLDS buckets
+_WORKLOAD_COLOR_NAMES = ("green", "yellow", "red")
 
 
 def parse_item(raw_item: Dict) -> ProjectItem:
@@ -14,40 +24,32 @@ def parse_item(raw_item: Dict) -> ProjectItem:
     Returns:
         ProjectItem instance
     """
-    # Extract content fields
-    content = raw_item.get('content', {})
-    
-    # Parse status with fallback
-    status_value = raw_item.get('status', 'Backlog')
-    try:
-        status = Status(status_value)
-    except ValueError:
-        status = Status.BACKLOG
-    
-    # Parse priority with fallback
-    priority_value = raw_item.get('priority', 'P2')
-    try:
-        priority = Priority(priority_value)
-    except ValueError:
-        # Handle corrupted P🔥 emoji (encoding issues)
+    get = raw_item.get
+    content = get('content') or {}
+    content_get = content.get
+    
+    status = _STATUS_BY_VALUE.get(get('status'), Status.BACKLOG)
+    
+    priority_value = get('priority', 'P2')
+    priority = _PRIORITY_BY_VALUE.get(priority_value)
+    if priority is None:
+        # Handle corrupted P🔥 emoji (encoding issues); default to P2 otherwise
         if priority_value and priority_value.startswith('P') and len(priority_value) > 2:
-            # Likely corrupted P🔥, treat as FIRE priority
             priority = Priority.FIRE
         else:
-            # Default to P2 for other invalid priorities
             priority = Priority.P2
     
     return ProjectItem(
-        id=raw_item.get('id', ''),
-        title=raw_item.get('title', ''),
+        id=get('id', ''),
+        title=get('title', ''),
         status=status,
         priority=priority,
-        assignees=raw_item.get('assignees', []),
-        estimate_hours=raw_item.get('estimate (Hrs)'),
-        labels=raw_item.get('labels', []),
-        url=content.get('url', ''),
-        repository=content.get('repository', ''),
-        issue_number=content.get('number')
+        assignees=get('assignees', []),
+        estimate_hours=get('estimate (Hrs)'),
+        labels=get('labels', []),
+        url=content_get('url', ''),
+        repository=content_get('repository', ''),
+        issue_number=content_get('number')
     )
 
 
@@ -61,98 +63,80 @@ def parse_items(raw_items: List[Dict]) -> List[ProjectItem]:
     Returns:
         List of ProjectItem instances
     """
-    return [parse_item(item) for item in raw_items]
-
-
-
-from src.models import ProjectMetrics, Priority, Status
+    return list(map(parse_item, raw_items))
 
 
 def calculate_metrics(items: List[ProjectItem]) -> ProjectMetrics:
     """
     Calculate all metrics for project items.
     
+    Also used by processor_v2, since ProjectItemV2 exposes the same fields.
+    
     Args:
-        items: List of ProjectItem objects
+        items: List of ProjectItem (or ProjectItemV2) objects
         
     Returns:
         ProjectMetrics with calculated statistics
     """
     if not items:
-        return ProjectMetrics(
-            total_items=0,
-            total_estimate_hours=0.0,
-            completion_percentage=0.0,
-            planned_count=0,
-            unplanned_count=0,
-            unplanned_percentage=0.0,
-            high_priority_not_started=0,
-            items_by_status={},
-            items_by_priority={},
-            items_by_assignee={},
-            active_items=0,
-            active_completion_percentage=0.0,
-            pending_items=0,
-            in_progress_items=0,
-            active_unplanned_percentage=0.0,
-            active_unplanned_count=0,
-            todo_items=0,
-            done_active_items=0,
-            unplanned_done_percentage=0.0,
-            unplanned_done_count=0
-        )
+        return ProjectMetrics()
     
     total_items = len(items)
     
-    # Calculate total estimate hours
-    total_estimate_hours = sum(
-        item.estimate_hours for item in items if item.estimate_hours is not None
+    done = Status.DONE
+    total_estimate_hours = 0
+    items_by_status = defaultdict(list)
+    items_by_priority = defaultdict(list)
+    items_by_assignee = defaultdict(list)
+    
+    # Single pass builds the groupings; every count below is derived from
+    # the group lists so the loop itself carries no per-item branching
+    for item in items:
+        if item.estimate_hours is not None:
+            total_estimate_hours += item.estimate_hours
+        items_by_status[item.status.value].append(item)
+        items_by_priority[item.priority.value].append(item)
+        for assignee in item.assignees or ("Unassigned",):
+            items_by_assignee[assignee].append(item)
+    
+    status_counts = {status: len(group) for status, group in items_by_status.items()}
+    
+    backlog = Status.BACKLOG
+    fire_items = items_by_priority.get(Priority.FIRE.value, ())
+    p0_items = items_by_priority.get(Priority.P0.value, ())
+    
+    unplanned_count = len(fire_items)
+    unplanned_done_count = sum(1 for item in fire_items if item.status == done)
+    active_unplanned_count = unplanned_count - sum(1 for item in fire_items if item.status == backlog)
+    high_priority_not_started = sum(
+        1 for group in (fire_items, p0_items) for item in group
+        if item.status in _NOT_STARTED_STATUSES
     )
     
+    def status_count(status: Status) -> int:
+        return status_counts.get(status.value, 0)
+    
     # Calculate completion percentage
-    done_items = sum(1 for item in items if item.status == Status.DONE)
+    done_items = status_count(done)
     completion_percentage = round((done_items / total_items * 100), 1) if total_items > 0 else 0.0
     
     # Calculate planned vs unplanned
-    unplanned_count = sum(1 for item in items if not item.is_planned)
     planned_count = total_items - unplanned_count
     unplanned_percentage = round((unplanned_count / total_items * 100), 1) if total_items > 0 else 0.0
     
-    # Count high priority items not started
-    high_priority_not_started = sum(
-        1 for item in items
-        if item.priority in [Priority.FIRE, Priority.P0]
-        and item.status in [Status.BACKLOG, Status.TODO]
-    )
-    
-    # Group items by status, priority, and assignee
-    items_by_status = group_by_status(items)
-    items_by_priority = group_by_priority(items)
-    items_by_assignee = group_by_assignee(items)
-    
-    # Calculate active work metrics (excluding Backlog)
-    active_items_list = [
-        item for item in items 
-        if item.status != Status.BACKLOG
-    ]
-    active_items = len(active_items_list)
-    
-    # Active completion: Done / (Total - Backlog)
-    active_done = sum(1 for item in active_items_list if item.status == Status.DONE)
-    active_completion_percentage = round((active_done / active_items * 100), 1) if active_items > 0 else 0.0
+    # Active work metrics (excluding Backlog); Done items are never Backlog
+    active_items = total_items - status_count(backlog)
+    active_completion_percentage = round((done_items / active_items * 100), 1) if active_items > 0 else 0.0
+    active_unplanned_percentage = round((active_unplanned_count / active_items * 100), 1) if active_items > 0 else 0.0
     
     # Count pending and in-progress
-    pending_items = sum(1 for item in items if item.status == Status.PENDING)
-    in_progress_items = sum(1 for item in items if item.status == Status.IN_PROGRESS)
+    pending_items = status_count(Status.PENDING)
+    in_progress_items = status_count(Status.IN_PROGRESS)
     
-    # Calculate unplanned work in active tasks
-    active_unplanned_count = sum(1 for item in active_items_list if not item.is_planned)
-    active_unplanned_percentage = round((active_unplanned_count / active_items * 100), 1) if active_items > 0 else 0.0
-    
-    # NEW: Calculate enhanced metrics
-    todo_items = calculate_todo_count(items)
-    done_active_items = calculate_done_active_count(items)
-    unplanned_done_percentage, unplanned_done_count = calculate_unplanned_done_stats(items)
+    # Enhanced metrics
+    todo_items = status_count(Status.TODO)
+    done_active_items = done_items
+    unplanned_done_percentage = round((unplanned_done_count / done_items * 100), 1) if done_items > 0 else 0.0
     
     return ProjectMetrics(
         total_items=total_items,
@@ -162,9 +146,9 @@ def calculate_metrics(items: List[ProjectItem]) -> ProjectMetrics:
         unplanned_count=unplanned_count,
         unplanned_percentage=unplanned_percentage,
         high_priority_not_started=high_priority_not_started,
-        items_by_status=items_by_status,
-        items_by_priority=items_by_priority,
-        items_by_assignee=items_by_assignee,
+        items_by_status=dict(items_by_status),
+        items_by_priority=dict(items_by_priority),
+        items_by_assignee=dict(items_by_assignee),
         active_items=active_items,
         active_completion_percentage=active_completion_percentage,
         pending_items=pending_items,
@@ -189,13 +173,10 @@ def group_by_status(items: List[ProjectItem]) -> Dict[str, List[ProjectItem]]:
     Returns:
         Dictionary mapping status to list of items
     """
-    grouped = {}
+    grouped = defaultdict(list)
     for item in items:
-        status_name = item.status.value
-        if status_name not in grouped:
-            grouped[status_name] = []
-        grouped[status_name].append(item)
-    return grouped
+        grouped[item.status.value].append(item)
+    return dict(grouped)
 
 
 def group_by_priority(items: List[ProjectItem]) -> Dict[str, List[ProjectItem]]:
@@ -208,13 +189,10 @@ def group_by_priority(items: List[ProjectItem]) -> Dict[str, List[ProjectItem]]:
     Returns:
         Dictionary mapping priority to list of items
     """
-    grouped = {}
+    grouped = defaultdict(list)
     for item in items:
-        priority_name = item.priority.value
-        if priority_name not in grouped:
-            grouped[priority_name] = []
-        grouped[priority_name].append(item)
-    return grouped
+        grouped[item.priority.value].append(item)
+    return dict(grouped)
 
 
 def group_by_assignee(items: List[ProjectItem]) -> Dict[str, List[ProjectItem]]:
@@ -230,20 +208,16 @@ def group_by_assignee(items: List[ProjectItem]) -> Dict[str, List[ProjectItem]]:
     Returns:
         Dictionary mapping assignee name to list of items
     """
-    grouped = {}
+    grouped = defaultdict(list)
     for item in items:
         if not item.assignees:
             # Unassigned items
-            if "Unassigned" not in grouped:
-                grouped["Unassigned"] = []
             grouped["Unassigned"].append(item)
         else:
             # Add item to each assignee's group
             for assignee in item.assignees:
-                if assignee not in grouped:
-                    grouped[assignee] = []
                 grouped[assignee].append(item)
-    return grouped
+    return dict(grouped)
 
 
 
@@ -295,12 +269,7 @@ def get_workload_color(item_count: int) -> str:
     Returns:
         Color name: 'green', 'yellow', or 'red'
     """
-    if item_count > 10:
-        return "red"
-    elif item_count >= 6:
-        return "yellow"
-    else:
-        return "green"
+    return _WORKLOAD_COLOR_NAMES[bisect_right(WORKLOAD_THRESHOLDS, item_count)]
 
 
 def get_high_priority_color(count: int) -> str:
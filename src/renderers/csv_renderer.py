@@ -1,6 +1,7 @@
 """CSV report renderer."""
 
 import csv
+import io
 from pathlib import Path
 from typing import List
 
@@ -34,33 +35,38 @@ class CSVRenderer(Renderer):
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Open file with UTF-8 BOM for Excel compatibility
-        with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            writer.writerow([
-                'Title',
-                'Status',
-                'Priority',
-                'Assignees',
-                'Estimate',
-                'Labels',
-                'URL',
-                'Repository',
-                'Issue Number'
-            ])
-            
-            # Write data rows
-            for item in items:
-                writer.writerow([
-                    item.title,
-                    item.status.value,
-                    item.priority.value,
-                    ', '.join(item.assignees) if item.assignees else '',
-                    item.estimate_hours if item.estimate_hours is not None else '',
-                    ', '.join(item.labels) if item.labels else '',
-                    item.url,
-                    item.repository,
-                    item.issue_number if item.issue_number is not None else ''
-                ])
+        # Build the whole document in memory and write it with one call
+        buffer = io.StringIO(newline='')
+        writer = csv.writer(buffer)
+        
+        # Write header
+        writer.writerow([
+            'Title',
+            'Status',
+            'Priority',
+            'Assignees',
+            'Estimate',
+            'Labels',
+            'URL',
+            'Repository',
+            'Issue Number'
+        ])
+        
+        # Write data rows; csv writes None as an empty field
+        writer.writerows(
+            (
+                item.title,
+                item.status.value,
+                item.priority.value,
+                ', '.join(item.assignees or ()),
+                item.estimate_hours,
+                ', '.join(item.labels or ()),
+                item.url,
+                item.repository,
+                item.issue_number
+            )
+            for item in items
+        )
+        
+        # Encode with UTF-8 BOM for Excel compatibility
+        output_file.write_bytes(buffer.getvalue().encode('utf-8-sig'))
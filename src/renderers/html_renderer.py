@@ -1,9 +1,10 @@
 """HTML report renderer using Jinja2."""
 
+import functools
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
 
 from src.models import ProjectItem, ProjectMetrics, Priority
 from src.charts.chart_builder import ChartBuilder
@@ -13,6 +14,68 @@ from src.processor import (
     get_high_priority_color
 )
 
+_HIGH_PRIORITIES = frozenset({Priority.FIRE, Priority.P0})
+_by_title = attrgetter('title')
+
+
+def _collect_high_priority_items(items: List[ProjectItem]) -> List[ProjectItem]:
+    """Collect P🔥 items and then P0 items, each sorted by title."""
+    fire = Priority.FIRE
+    fire_items = []
+    p0_items = []
+    for item in items:
+        if item.priority in _HIGH_PRIORITIES:
+            if item.priority == fire:
+                fire_items.append(item)
+            else:
+                p0_items.append(item)
+    fire_items.sort(key=_by_title)
+    p0_items.sort(key=_by_title)
+    return fire_items + p0_items
+
+
+TEMPLATE_DIR = Path(__file__).parent.parent / 'templates'
+_CHART_BUILDER = ChartBuilder()
+
+
+@functools.cache
+def _get_environment(bytecode_cache_dir: Optional[Path] = None):
+    """
+    Build the shared Jinja2 environment on first use.
+    
+    Jinja2 is imported here so creating a renderer, or importing this
+    module, does not pay for it until a template is actually needed.
+    Compiled templates are cached on disk so later processes skip parse and
+    compile. By default Jinja2 picks a per-user directory and refuses one it
+    does not own with mode 0o700; if no safe directory is available the
+    environment runs without a bytecode cache.
+    Templates do not change while a report is generated, so auto-reload is
+    off and later lookups skip re-checking report.html on disk.
+    
+    Args:
+        bytecode_cache_dir: Directory for compiled templates (default: the
+            per-user Jinja2 cache directory)
+    
+    Returns:
+        Jinja2 Environment loading from TEMPLATE_DIR
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+    
+    try:
+        if bytecode_cache_dir is None:
+            bytecode_cache = FileSystemBytecodeCache()
+        else:
+            bytecode_cache = FileSystemBytecodeCache(directory=str(bytecode_cache_dir))
+    except (OSError, RuntimeError):
+        bytecode_cache = None
+    
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=bytecode_cache
+    )
+
 
 def get_unplanned_done_color(percentage: float) -> str:
     """
@@ -37,16 +100,32 @@ def get_unplanned_done_color(percentage: float) -> str:
 class HTMLRenderer:
     """Renderer for generating HTML reports."""
     
-    def __init__(self):
-        """Initialize HTMLRenderer with Jinja2 environment."""
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent.parent / 'templates'
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=True
-        )
-        self.template = self.env.get_template('report.html')
-        self.chart_builder = ChartBuilder()
+    def __init__(self, env=None):
+        """
+        Initialize HTMLRenderer; the template is loaded on first use.
+        
+        Args:
+            env: Jinja2 Environment providing report.html (default: the
+                shared process-wide environment)
+        """
+        self.chart_builder = _CHART_BUILDER
+        if env is not None:
+            self.env = env
+    
+    @functools.cached_property
+    def env(self):
+        """Jinja2 environment, the shared one unless given to __init__."""
+        return _get_environment()
+    
+    @functools.cached_property
+    def template(self):
+        """
+        Compiled report template.
+        
+        The environment caches the compiled template, so later renderers
+        in the same process reuse it instead of re-parsing report.html.
+        """
+        return self.env.get_template('report.html')
     
     def render(
         self,
@@ -68,46 +147,63 @@ class HTMLRenderer:
             owner: GitHub organization/user
             project_number: Project number
         """
-        # Filter high priority items (P🔥 and P0)
-        high_priority_items = [
-            item for item in items
-            if item.priority in [Priority.FIRE, Priority.P0]
-        ]
-        
-        # Sort high priority items by priority (FIRE first, then P0)
-        high_priority_items.sort(
-            key=lambda x: (0 if x.priority == Priority.FIRE else 1, x.title)
-        )
+        context = self._build_context(items, metrics, project_name, owner, project_number)
         
-        # Generate charts
-        status_counts = {
-            status: len(items_list)
-            for status, items_list in metrics.items_by_status.items()
-        }
-        
-        priority_counts = {
-            priority: len(items_list)
-            for priority, items_list in metrics.items_by_priority.items()
-        }
+        # Stream the rendered template into the file chunk by chunk rather
+        # than building the whole document as one str first
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'wb') as f:
+            self.template.stream(**context).dump(f, encoding='utf-8')
+    
+    def render_to_string(
+        self,
+        items: List[ProjectItem],
+        metrics: ProjectMetrics,
+        project_name: str = "GitHub Project",
+        owner: str = "",
+        project_number: int = 0
+    ) -> str:
+        """
+        Render the HTML report in memory without touching the filesystem.
         
-        # Count active items per assignee for workload (exclude MansourM - TPM)
-        assignee_workload = {}
-        for assignee, assignee_items in metrics.items_by_assignee.items():
-            # Skip MansourM (TPM - not a developer)
-            if assignee == "MansourM":
-                continue
-            active_count = sum(1 for item in assignee_items if item.is_active)
-            if active_count > 0:  # Only include assignees with active items
-                assignee_workload[assignee] = active_count
+        Args:
+            items: List of all project items
+            metrics: Calculated project metrics
+            project_name: Name of the project
+            owner: GitHub organization/user
+            project_number: Project number
+            
+        Returns:
+            The rendered HTML document
+        """
+        context = self._build_context(items, metrics, project_name, owner, project_number)
+        return self.template.render(**context)
+    
+    def _build_context(
+        self,
+        items: List[ProjectItem],
+        metrics: ProjectMetrics,
+        project_name: str,
+        owner: str,
+        project_number: int
+    ) -> dict:
+        """
+        Build the template context shared by render and render_to_string.
         
-        # Generate chart JSON
-        status_pie_chart = self.chart_builder.create_status_pie_chart(status_counts)
-        priority_chart = self.chart_builder.create_priority_chart(priority_counts)
-        planned_unplanned_chart = self.chart_builder.create_planned_vs_unplanned_chart(
-            metrics.planned_count,
-            metrics.unplanned_count
-        )
-        team_workload_chart = self.chart_builder.create_team_workload_chart(assignee_workload)
+        Args:
+            items: List of all project items
+            metrics: Calculated project metrics
+            project_name: Name of the project
+            owner: GitHub organization/user
+            project_number: Project number
+            
+        Returns:
+            Template variables for report.html
+        """
+        # Empty projects skip the item scan; charts and colors come from
+        # metrics, so they are built even when there are no items
+        high_priority_items = _collect_high_priority_items(items) if items else []
         
         # Determine colors for metrics
         completion_color = get_completion_color(metrics.active_completion_percentage)
@@ -117,7 +213,7 @@ class HTMLRenderer:
         unplanned_done_color = get_unplanned_done_color(metrics.unplanned_done_percentage)
         
         # Prepare template context
-        context = {
+        return {
             'project_name': project_name,
             'owner': owner,
             'project_number': project_number,
@@ -131,16 +227,36 @@ class HTMLRenderer:
             'high_priority_items': high_priority_items,
             'items_by_status': metrics.items_by_status,
             'all_items': items,
-            'status_pie_chart': status_pie_chart,
-            'priority_chart': priority_chart,
-            'planned_unplanned_chart': planned_unplanned_chart,
-            'team_workload_chart': team_workload_chart
+            **self._build_chart_payload(metrics)
         }
+    
+    def _build_chart_payload(self, metrics: ProjectMetrics) -> dict:
+        """
+        Serialize every chart for the template in one place.
         
-        # Render template
-        html_content = self.template.render(**context)
+        Charts come out of ChartBuilder as ready-made JSON (orjson when
+        available), so the template only interpolates them with ``|safe``.
         
-        # Write to file
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(html_content, encoding='utf-8')
+        Args:
+            metrics: Calculated project metrics
+            
+        Returns:
+            Template variables mapped to chart JSON strings
+        """
+        # Active items per assignee for workload (exclude MansourM - TPM)
+        assignee_workload = {
+            assignee: count
+            for assignee, count in metrics.assignee_active_counts.items()
+            if assignee != "MansourM"
+        }
+        
+        chart_builder = self.chart_builder
+        return {
+            'status_pie_chart': chart_builder.create_status_pie_chart(metrics.status_counts),
+            'priority_chart': chart_builder.create_priority_chart(metrics.priority_counts),
+            'planned_unplanned_chart': chart_builder.create_planned_vs_unplanned_chart(
+                metrics.planned_count,
+                metrics.unplanned_count
+            ),
+            'team_workload_chart': chart_builder.create_team_workload_chart(assignee_workload)
+        }
@@ -1,17 +1,50 @@
 """JSON report renderer."""
 
 import json
+from operator import attrgetter
 from pathlib import Path
 from typing import List
-from datetime import datetime
+from datetime import datetime, timezone
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
 
 from src.renderers.base import Renderer
 from src.models import ProjectItem, ProjectMetrics
 
+WRITE_BUFFER_SIZE = 64 * 1024
+UTC_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+# Fetch every serialized attribute in one C-level call per item
+_item_fields = attrgetter(
+    'id', 'title', 'status', 'priority', 'assignees', 'estimate_hours', 'labels',
+    'url', 'repository', 'issue_number', 'is_planned', 'is_active'
+)
+
+# Stdlib fallback encoders, configured once; payloads are freshly built and
+# acyclic, so the circular-reference check is skipped
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), check_circular=False)
+_INDENTED_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2, check_circular=False)
+
+# Document framing: (key opener, key closer, item indent, items closer, end)
+_INDENTED_LAYOUT = (b'\n  "', b'": ', b'\n    ', b'\n  ', b'\n}\n')
+_COMPACT_LAYOUT = (b'"', b'":', b'', b'', b'}\n')
+
 
 class JSONRenderer(Renderer):
     """Renderer for generating JSON reports."""
     
+    def __init__(self, compact: bool = False):
+        """
+        Initialize JSONRenderer.
+        
+        Args:
+            compact: Write the report without indentation or line breaks
+        """
+        self.compact = compact
+    
     def render(
         self,
         items: List[ProjectItem],
@@ -32,60 +65,93 @@ class JSONRenderer(Renderer):
             owner: GitHub organization/user
             project_number: Project number
         """
-        # Prepare data structure
-        data = {
-            'metadata': {
-                'project_name': project_name,
-                'owner': owner,
-                'project_number': project_number,
-                'generation_timestamp': datetime.now().isoformat() + 'Z',
-                'total_items': metrics.total_items
-            },
-            'metrics': {
-                'total_items': metrics.total_items,
-                'total_estimate_hours': metrics.total_estimate_hours,
-                'completion_percentage': metrics.completion_percentage,
-                'planned_count': metrics.planned_count,
-                'unplanned_count': metrics.unplanned_count,
-                'unplanned_percentage': metrics.unplanned_percentage,
-                'high_priority_not_started': metrics.high_priority_not_started
-            },
-            'items': [
-                {
-                    'id': item.id,
-                    'title': item.title,
-                    'status': item.status.value,
-                    'priority': item.priority.value,
-                    'assignees': item.assignees,
-                    'estimate_hours': item.estimate_hours,
-                    'labels': item.labels,
-                    'url': item.url,
-                    'repository': item.repository,
-                    'issue_number': item.issue_number,
-                    'is_planned': item.is_planned,
-                    'is_active': item.is_active
-                }
-                for item in items
-            ],
-            'grouped_data': {
-                'by_status': {
-                    status: len(items_list)
-                    for status, items_list in metrics.items_by_status.items()
-                },
-                'by_priority': {
-                    priority: len(items_list)
-                    for priority, items_list in metrics.items_by_priority.items()
-                },
-                'by_assignee': {
-                    assignee: len(items_list)
-                    for assignee, items_list in metrics.items_by_assignee.items()
-                }
-            }
+        metadata = {
+            'project_name': project_name,
+            'owner': owner,
+            'project_number': project_number,
+            'generation_timestamp': datetime.now(timezone.utc).strftime(UTC_TIMESTAMP_FORMAT),
+            'total_items': metrics.total_items
+        }
+        metrics_data = {
+            'total_items': metrics.total_items,
+            'total_estimate_hours': metrics.total_estimate_hours,
+            'completion_percentage': metrics.completion_percentage,
+            'planned_count': metrics.planned_count,
+            'unplanned_count': metrics.unplanned_count,
+            'unplanned_percentage': metrics.unplanned_percentage,
+            'high_priority_not_started': metrics.high_priority_not_started
+        }
+        grouped_data = {
+            'by_status': metrics.status_counts,
+            'by_priority': metrics.priority_counts,
+            'by_assignee': metrics.assignee_counts
         }
         
         # Write to file
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Stream the document so only one item is ever held in encoded form;
+        # in the indented layout items still go one per line
+        if self.compact:
+            encode_section = _encode
+            open_key, close_key, item_indent, items_close, end = _COMPACT_LAYOUT
+        else:
+            encode_section = _encode_section
+            open_key, close_key, item_indent, items_close, end = _INDENTED_LAYOUT
+        
+        with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(b'{' + open_key + b'metadata' + close_key + encode_section(metadata))
+            f.write(b',' + open_key + b'metrics' + close_key + encode_section(metrics_data))
+            f.write(b',' + open_key + b'items' + close_key + b'[')
+            separator = item_indent
+            for item in items:
+                f.write(separator + _encode(_serialize_item(item)))
+                separator = b',' + item_indent
+            f.write((items_close if items else b'') + b']')
+            f.write(b',' + open_key + b'grouped_data' + close_key + encode_section(grouped_data) + end)
+
+
+def _serialize_item(item: ProjectItem) -> dict:
+    """
+    Serialize a ProjectItem for the JSON report.
+    
+    Args:
+        item: ProjectItem to serialize
+        
+    Returns:
+        Dictionary representation of the item
+    """
+    (item_id, title, status, priority, assignees, estimate_hours, labels,
+     url, repository, issue_number, is_planned, is_active) = _item_fields(item)
+    return {
+        'id': item_id,
+        'title': title,
+        'status': status.value,
+        'priority': priority.value,
+        'assignees': assignees,
+        'estimate_hours': estimate_hours,
+        'labels': labels,
+        'url': url,
+        'repository': repository,
+        'issue_number': issue_number,
+        'is_planned': is_planned,
+        'is_active': is_active
+    }
+
+
+def _encode(obj) -> bytes:
+    """Encode a value as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _COMPACT_ENCODER.encode(obj).encode('utf-8')
+
+
+def _encode_section(obj: dict) -> bytes:
+    """Encode a top-level section indented to sit one level inside the document."""
+    if orjson is not None:
+        encoded = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = _INDENTED_ENCODER.encode(obj).encode('utf-8')
+    # JSON strings never contain raw newlines, so this only shifts the layout
+    return encoded.replace(b'\n', b'\n  ')
@@ -1,5 +1,7 @@
 """Markdown report renderer."""
 
+import io
+from itertools import starmap
 from pathlib import Path
 from typing import List
 from datetime import datetime
@@ -12,6 +14,13 @@ from src.processor import (
     get_high_priority_color
 )
 
+_HIGH_PRIORITIES = frozenset({Priority.FIRE, Priority.P0})
+_COLOR_EMOJI = {'green': '✅', 'yellow': '⚠️', 'red': '❌'}
+
+# Bound row formatters for the tables, fed by starmap
+_DISTRIBUTION_ROW = "| {} | {} | {:.1f}% |\n".format
+_TABLE_ROW = "| {} | {} | {} | {} | {} | {} |\n".format
+
 
 class MarkdownRenderer(Renderer):
     """Renderer for generating Markdown reports."""
@@ -36,101 +45,131 @@ class MarkdownRenderer(Renderer):
             owner: GitHub organization/user
             project_number: Project number
         """
-        lines = []
+        markdown = self.render_to_string(items, metrics, project_name, owner, project_number)
         
-        # Header
-        lines.append(f"# گزارش پروژه: {project_name}\n")
-        lines.append(f"**سازمان:** {owner} | **شماره پروژه:** {project_number}\n")
-        lines.append(f"**تاریخ تولید:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        lines.append("\n---\n")
-        
-        # Summary Statistics
-        lines.append("## خلاصه آمار\n")
-        lines.append(f"- **تعداد کل آیتم‌ها:** {metrics.total_items}\n")
-        lines.append(f"- **تخمین کل ساعت:** {metrics.total_estimate_hours}\n")
+        # Write to file
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_bytes(markdown.encode('utf-8'))
+    
+    def render_to_string(
+        self,
+        items: List[ProjectItem],
+        metrics: ProjectMetrics,
+        project_name: str = "GitHub Project",
+        owner: str = "",
+        project_number: int = 0
+    ) -> str:
+        """
+        Render the Markdown report in memory without touching the filesystem.
         
-        completion_color = get_completion_color(metrics.completion_percentage)
-        completion_emoji = self._get_emoji_for_color(completion_color)
-        lines.append(f"- **درصد تکمیل:** {metrics.completion_percentage:.1f}% {completion_emoji}\n")
+        Args:
+            items: List of all project items
+            metrics: Calculated project metrics
+            project_name: Name of the project
+            owner: GitHub organization/user
+            project_number: Project number
+            
+        Returns:
+            The rendered Markdown document
+        """
+        buf = io.StringIO()
+        write = buf.write
         
-        unplanned_color = get_unplanned_color(metrics.unplanned_percentage)
-        unplanned_emoji = self._get_emoji_for_color(unplanned_color)
-        lines.append(f"- **برنامه‌ریزی نشده:** {metrics.unplanned_percentage:.1f}% {unplanned_emoji}\n")
+        completion_emoji = _COLOR_EMOJI.get(get_completion_color(metrics.completion_percentage), '')
+        unplanned_emoji = _COLOR_EMOJI.get(get_unplanned_color(metrics.unplanned_percentage), '')
+        high_priority_emoji = _COLOR_EMOJI.get(get_high_priority_color(metrics.high_priority_not_started), '')
         
-        high_priority_color = get_high_priority_color(metrics.high_priority_not_started)
-        high_priority_emoji = self._get_emoji_for_color(high_priority_color)
-        lines.append(f"- **اولویت بالا شروع نشده:** {metrics.high_priority_not_started} {high_priority_emoji}\n")
-        lines.append("\n")
+        # Header and Summary Statistics
+        write(
+            f"# گزارش پروژه: {project_name}\n"
+            f"**سازمان:** {owner} | **شماره پروژه:** {project_number}\n"
+            f"**تاریخ تولید:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            "\n---\n"
+            "## خلاصه آمار\n"
+            f"- **تعداد کل آیتم‌ها:** {metrics.total_items}\n"
+            f"- **تخمین کل ساعت:** {metrics.total_estimate_hours}\n"
+            f"- **درصد تکمیل:** {metrics.completion_percentage:.1f}% {completion_emoji}\n"
+            f"- **برنامه‌ریزی نشده:** {metrics.unplanned_percentage:.1f}% {unplanned_emoji}\n"
+            f"- **اولویت بالا شروع نشده:** {metrics.high_priority_not_started} {high_priority_emoji}\n"
+            "\n"
+        )
         
-        # Status Distribution
-        lines.append("## توزیع وضعیت\n")
-        lines.append("| وضعیت | تعداد | درصد |\n")
-        lines.append("|-------|-------|------|\n")
-        for status, status_items in metrics.items_by_status.items():
-            count = len(status_items)
-            percentage = (count / metrics.total_items * 100) if metrics.total_items > 0 else 0
-            lines.append(f"| {status} | {count} | {percentage:.1f}% |\n")
-        lines.append("\n")
+        # Status Distribution; one division serves every table row
+        percent_per_item = 100.0 / metrics.total_items if metrics.total_items > 0 else 0.0
+        write(
+            "## توزیع وضعیت\n"
+            "| وضعیت | تعداد | درصد |\n"
+            "|-------|-------|------|\n"
+        )
+        write("".join(starmap(_DISTRIBUTION_ROW, (
+            (status, count, count * percent_per_item)
+            for status, count in metrics.status_counts.items()
+        ))))
+        write("\n")
         
         # Priority Distribution
-        lines.append("## توزیع اولویت\n")
-        lines.append("| اولویت | تعداد | درصد |\n")
-        lines.append("|--------|-------|------|\n")
-        for priority, priority_items in metrics.items_by_priority.items():
-            count = len(priority_items)
-            percentage = (count / metrics.total_items * 100) if metrics.total_items > 0 else 0
-            lines.append(f"| {priority} | {count} | {percentage:.1f}% |\n")
-        lines.append("\n")
+        write(
+            "## توزیع اولویت\n"
+            "| اولویت | تعداد | درصد |\n"
+            "|--------|-------|------|\n"
+        )
+        write("".join(starmap(_DISTRIBUTION_ROW, (
+            (priority, count, count * percent_per_item)
+            for priority, count in metrics.priority_counts.items()
+        ))))
+        write("\n")
         
-        # High Priority Items
-        high_priority_items = [
-            item for item in items
-            if item.priority in [Priority.FIRE, Priority.P0]
+        # Project each item once for the high-priority list and the full
+        # table. Assignees and labels are joined here once ('' when empty)
+        # and each section substitutes its own placeholder
+        rows = [
+            (
+                item,
+                item.status.value,
+                item.priority.value,
+                f"[{item.title}]({item.url})",
+                ", ".join(item.assignees) if item.assignees else "",
+                ", ".join(item.labels) if item.labels else ""
+            )
+            for item in items
         ]
         
-        if high_priority_items:
-            lines.append("## آیتم‌های با اولویت بالا (P🔥 و P0)\n")
-            for item in high_priority_items:
-                assignees = ", ".join(item.assignees) if item.assignees else "بدون مسئول"
-                estimate = f"{item.estimate_hours} ساعت" if item.estimate_hours else "-"
-                lines.append(f"- **[{item.priority.value}]** [{item.title}]({item.url})\n")
-                lines.append(f"  - وضعیت: {item.status.value}\n")
-                lines.append(f"  - مسئولین: {assignees}\n")
-                lines.append(f"  - تخمین: {estimate}\n")
-            lines.append("\n")
+        # High Priority Items; the section is only written when it has rows
+        high_priority_rows = "".join(
+            f"- **[{priority}]** {link}\n"
+            f"  - وضعیت: {status}\n"
+            f"  - مسئولین: {assignees or 'بدون مسئول'}\n"
+            f"  - تخمین: {f'{item.estimate_hours} ساعت' if item.estimate_hours else '-'}\n"
+            for item, status, priority, link, assignees, _ in rows
+            if item.priority in _HIGH_PRIORITIES
+        )
+        if high_priority_rows:
+            write("## آیتم‌های با اولویت بالا (P🔥 و P0)\n")
+            write(high_priority_rows)
+            write("\n")
         
-        # Items by Status
-        lines.append("## آیتم‌ها بر اساس وضعیت\n")
+        # Items by Status; grouped from metrics like the status table above,
+        # so metrics built without an item list still fill this section
+        write("## آیتم‌ها بر اساس وضعیت\n")
         for status, status_items in metrics.items_by_status.items():
-            lines.append(f"### {status} ({len(status_items)})\n")
-            for item in status_items:
-                assignees = ", ".join(item.assignees) if item.assignees else "بدون مسئول"
-                lines.append(f"- **[{item.priority.value}]** [{item.title}]({item.url}) - {assignees}\n")
-            lines.append("\n")
+            write(f"### {status} ({len(status_items)})\n")
+            write("".join(
+                f"- **[{item.priority.value}]** [{item.title}]({item.url}) - "
+                f"{', '.join(item.assignees) if item.assignees else 'بدون مسئول'}\n"
+                for item in status_items
+            ))
+            write("\n")
         
         # Detailed Items Table
-        lines.append("## جدول کامل آیتم‌ها\n")
-        lines.append("| عنوان | وضعیت | اولویت | مسئولین | تخمین | برچسب‌ها |\n")
-        lines.append("|-------|-------|--------|---------|-------|----------|\n")
-        for item in items:
-            title = f"[{item.title}]({item.url})"
-            assignees = ", ".join(item.assignees) if item.assignees else "-"
-            estimate = str(item.estimate_hours) if item.estimate_hours else "-"
-            labels = ", ".join(item.labels) if item.labels else "-"
-            lines.append(f"| {title} | {item.status.value} | {item.priority.value} | {assignees} | {estimate} | {labels} |\n")
+        write(
+            "## جدول کامل آیتم‌ها\n"
+            "| عنوان | وضعیت | اولویت | مسئولین | تخمین | برچسب‌ها |\n"
+            "|-------|-------|--------|---------|-------|----------|\n"
+        )
+        write("".join(starmap(_TABLE_ROW, (
+            (link, status, priority, assignees or '-', item.estimate_hours or '-', labels or '-')
+            for item, status, priority, link, assignees, labels in rows
+        ))))
         
-        # Write to file
-        content = "".join(lines)
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(content, encoding='utf-8')
-    
-    def _get_emoji_for_color(self, color: str) -> str:
-        """Get emoji representation for color."""
-        if color == 'green':
-            return '✅'
-        elif color == 'yellow':
-            return '⚠️'
-        elif color == 'red':
-            return '❌'
-        return ''
+        return buf.getvalue()
@@ -1,11 +1,37 @@
 """Snapshot management for weekly tracking."""
 
+import functools
 import json
+import os
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from datetime import datetime
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Tuple
 
-from src.models import ProjectItem
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+from src.models import ProjectItem, Priority, Status
+
+WRITE_BUFFER_SIZE = 64 * 1024
+_STATUS_BY_VALUE = {status.value: status for status in Status}
+_PRIORITY_BY_VALUE = {priority.value: priority for priority in Priority}
+UTC_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Snapshot keys, which are also the ProjectItem fields in declaration order
+_SNAPSHOT_FIELDS = (
+    'id', 'title', 'status', 'priority', 'assignees', 'estimate_hours', 'labels',
+    'url', 'repository', 'issue_number'
+)
+
+# Fetch every serialized attribute (or stored key) in one C-level call per item
+_item_fields = attrgetter(*_SNAPSHOT_FIELDS)
+_item_values = itemgetter(*_SNAPSHOT_FIELDS)
+
+# Stdlib fallback encoder, configured once
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), check_circular=False)
 
 
 def save_snapshot(items: List[ProjectItem], snapshot_dir: str = "snapshots") -> str:
@@ -27,20 +53,29 @@ def save_snapshot(items: List[ProjectItem], snapshot_dir: str = "snapshots") ->
     timestamp = datetime.now()
     filename = timestamp.strftime("snapshot-%Y%m%d-%H%M%S.json")
     filepath = snapshot_path / filename
+    utc_timestamp = timestamp.astimezone(timezone.utc).strftime(UTC_TIMESTAMP_FORMAT)
     
-    # Prepare snapshot data
-    snapshot_data = {
-        "timestamp": timestamp.isoformat() + "Z",
-        "items": [_serialize_item(item) for item in items]
-    }
-    
-    # Save to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(snapshot_data, f, ensure_ascii=False, indent=2)
+    # Stream one compact item per line so a snapshot is written without
+    # holding the whole encoded document, while staying a single JSON object
+    with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(b'{\n  "timestamp": ' + _encode(utc_timestamp))
+        f.write(b',\n  "items": [')
+        separator = b'\n    '
+        for item in items:
+            f.write(separator + _encode(_serialize_item(item)))
+            separator = b',\n    '
+        f.write(b'\n  ]\n}\n' if items else b']\n}\n')
     
     return str(filepath)
 
 
+def _encode(obj) -> bytes:
+    """Encode a value as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _COMPACT_ENCODER.encode(obj).encode('utf-8')
+
+
 def _serialize_item(item: ProjectItem) -> dict:
     """
     Serialize a ProjectItem to a dictionary.
@@ -51,17 +86,19 @@ def _serialize_item(item: ProjectItem) -> dict:
     Returns:
         Dictionary representation of the item
     """
+    (item_id, title, status, priority, assignees, estimate_hours, labels,
+     url, repository, issue_number) = _item_fields(item)
     return {
-        "id": item.id,
-        "title": item.title,
-        "status": item.status.value,
-        "priority": item.priority.value,
-        "assignees": item.assignees,
-        "estimate_hours": item.estimate_hours,
-        "labels": item.labels,
-        "url": item.url,
-        "repository": item.repository,
-        "issue_number": item.issue_number
+        "id": item_id,
+        "title": title,
+        "status": status.value,
+        "priority": priority.value,
+        "assignees": assignees,
+        "estimate_hours": estimate_hours,
+        "labels": labels,
+        "url": url,
+        "repository": repository,
+        "issue_number": issue_number
     }
 
 
@@ -76,26 +113,68 @@ def load_latest_snapshot(snapshot_dir: str = "snapshots") -> List[ProjectItem] |
     Returns:
         List of ProjectItem objects from the latest snapshot, or None if no snapshots exist
     """
-    snapshot_path = Path(snapshot_dir)
+    # Scan the directory once and keep the newest name (filenames embed the
+    # timestamp); a missing directory simply means there is no snapshot yet
+    try:
+        with os.scandir(snapshot_dir) as entries:
+            latest_name = max(
+                (
+                    entry.name for entry in entries
+                    if entry.name.startswith("snapshot-") and entry.name.endswith(".json")
+                ),
+                default=None
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
     
-    # Check if directory exists
-    if not snapshot_path.exists():
+    if latest_name is None:
         return None
     
-    # Find all snapshot files
-    snapshot_files = list(snapshot_path.glob("snapshot-*.json"))
+    return load_snapshot_file(Path(snapshot_dir) / latest_name)
+
+
+def load_snapshot_file(snapshot_file: Path) -> List[ProjectItem]:
+    """
+    Load project items from a single snapshot file.
     
-    if not snapshot_files:
-        return None
+    Parsed items are cached per file until its mtime or size changes, so
+    repeated loads of the same snapshot share ProjectItem objects; treat
+    them as read-only.
+    
+    Args:
+        snapshot_file: Path to a snapshot JSON file
+        
+    Returns:
+        List of ProjectItem objects stored in the snapshot
+    """
+    path = os.path.abspath(snapshot_file)
+    stat = os.stat(path)
     
-    # Get the most recent snapshot (sort by filename which includes timestamp)
-    latest_snapshot = max(snapshot_files, key=lambda p: p.name)
+    return list(_read_snapshot_items(path, stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=8)
+def _read_snapshot_items(path: str, mtime_ns: int, size: int) -> Tuple[ProjectItem, ...]:
+    """
+    Read and parse a snapshot file, cached until the file changes.
     
-    # Load and deserialize
-    with open(latest_snapshot, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    Args:
+        path: Absolute path to the snapshot file
+        mtime_ns: File modification time; only used as part of the cache key
+        size: File size in bytes; only used as part of the cache key
+        
+    Returns:
+        ProjectItem objects stored in the snapshot
+    """
+    raw = Path(path).read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     
-    return [_deserialize_item(item_data) for item_data in data["items"]]
+    return tuple(_deserialize_item(item_data) for item_data in data["items"])
+
+
+def clear_snapshot_cache() -> None:
+    """Drop cached snapshot files so the next load re-reads from disk."""
+    _read_snapshot_items.cache_clear()
 
 
 def _deserialize_item(data: dict) -> ProjectItem:
@@ -107,20 +186,23 @@ def _deserialize_item(data: dict) -> ProjectItem:
         
     Returns:
         ProjectItem instance
+        
+    Raises:
+        ValueError: If the status or priority is not a known value, as
+            Status(...) and Priority(...) would
     """
-    from src.models import Priority, Status
-    
+    (item_id, title, status, priority, assignees, estimate_hours, labels,
+     url, repository, issue_number) = _item_values(data)
+    status_member = _STATUS_BY_VALUE.get(status)
+    if status_member is None:
+        raise ValueError(f"{status!r} is not a valid Status")
+    priority_member = _PRIORITY_BY_VALUE.get(priority)
+    if priority_member is None:
+        raise ValueError(f"{priority!r} is not a valid Priority")
+    # Positional arguments follow the ProjectItem field order
     return ProjectItem(
-        id=data["id"],
-        title=data["title"],
-        status=Status(data["status"]),
-        priority=Priority(data["priority"]),
-        assignees=data["assignees"],
-        estimate_hours=data["estimate_hours"],
-        labels=data["labels"],
-        url=data["url"],
-        repository=data["repository"],
-        issue_number=data["issue_number"]
+        item_id, title, status_member, priority_member,
+        assignees, estimate_hours, labels, url, repository, issue_number
     )
 
 
@@ -145,34 +227,32 @@ def compare_snapshots(current: List[ProjectItem], previous: List[ProjectItem] |
             "status_changes": []
         }
     
-    # Create lookup dictionaries
-    previous_by_id = {item.id: item for item in previous}
-    current_by_id = {item.id: item for item in current}
+    # Only (id, status) pairs matter for the diff
+    previous_status = {item.id: item.status for item in previous}
     
-    # Calculate items completed (moved to Done)
+    # Single pass over the current items: new ids, status changes and
+    # completions all come from the same lookup. The change check stays an
+    # equality test so plain-string statuses match their Status members (and
+    # are reported as-is when they differ); only the Done check uses
+    # identity, since item.status is always a member
     items_completed = 0
-    for item in current:
-        if item.id in previous_by_id:
-            prev_item = previous_by_id[item.id]
-            from src.models import Status
-            if prev_item.status != Status.DONE and item.status == Status.DONE:
-                items_completed += 1
-    
-    # Calculate new items added
-    items_added = sum(1 for item_id in current_by_id if item_id not in previous_by_id)
-    
-    # Track status changes
+    items_added = 0
     status_changes = []
+    done = Status.DONE
     for item in current:
-        if item.id in previous_by_id:
-            prev_item = previous_by_id[item.id]
-            if prev_item.status != item.status:
-                status_changes.append({
-                    "id": item.id,
-                    "title": item.title,
-                    "from_status": prev_item.status.value,
-                    "to_status": item.status.value
-                })
+        prev_status = previous_status.get(item.id)
+        if prev_status is None:
+            items_added += 1
+            continue
+        if prev_status != item.status:
+            status_changes.append({
+                "id": item.id,
+                "title": item.title,
+                "from_status": getattr(prev_status, 'value', prev_status),
+                "to_status": item.status.value
+            })
+            if item.status is done:
+                items_completed += 1
     
     return {
         "items_completed": items_completed,
@@ -1,7 +1,128 @@
 """Shared test fixtures for pytest."""
 
+import copy
+
 import pytest
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from unittest.mock import MagicMock
+
+
+def pytest_addoption(parser):
+    """Register command-line options for the test suite."""
+    parser.addoption(
+        "--dataset-scale",
+        type=int,
+        default=100,
+        help="Number of items in the large_dataset fixture (default: 100)"
+    )
+    parser.addoption(
+        "--skip-slow",
+        action="store_true",
+        default=False,
+        help="Skip tests marked slow (full report renders) for quick feedback"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests when --skip-slow is given."""
+    if not config.getoption("--skip-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="skipped with --skip-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def _raw_item(number: int, fields: Dict) -> Dict:
+    """
+    Build a raw gh item for issue ``number`` in the test/repo repository.
+    
+    Args:
+        number: Issue number, also used as the item id
+        fields: Remaining item fields (title, status, priority, ...)
+    
+    Returns:
+        Raw item dictionary in the gh item-list format
+    """
+    return {
+        "id": str(number),
+        **fields,
+        "content": {
+            "url": f"https://github.com/test/repo/issues/{number}",
+            "repository": "test/repo",
+            "number": number
+        }
+    }
+
+
+@pytest.fixture
+def gh_mock(monkeypatch) -> MagicMock:
+    """
+    Replace subprocess.run so no real gh process is started.
+    
+    Tests set ``return_value`` (or ``side_effect``) to a MagicMock with
+    bytes ``stdout``/``stderr`` and a ``returncode``.
+    """
+    mock = MagicMock()
+    monkeypatch.setattr('subprocess.run', mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def jinja_env(tmp_path_factory):
+    """
+    Provide the Jinja2 environment with report.html compiled once per session.
+    
+    Bytecode goes to a session temp directory, not the user's real cache.
+    """
+    from src.renderers.html_renderer import _get_environment
+    
+    env = _get_environment(tmp_path_factory.mktemp("jinja_bytecode"))
+    env.get_template('report.html')
+    return env
+
+
+@pytest.fixture
+def make_item():
+    """
+    Provide a factory for ProjectItem objects with placeholder defaults.
+    
+    Keyword arguments override individual fields, e.g.
+    ``make_item(priority=Priority.FIRE)``.
+    """
+    from src.models import ProjectItem, Priority, Status
+    
+    def _make(**overrides):
+        fields = dict(
+            id="1", title="Test", status=Status.TODO, priority=Priority.P1,
+            assignees=[], estimate_hours=None, labels=[],
+            url="", repository="", issue_number=None
+        )
+        fields.update(overrides)
+        return ProjectItem(**fields)
+    
+    return _make
+
+
+@pytest.fixture
+def make_raw_item():
+    """
+    Provide a factory for raw gh items with placeholder defaults.
+    
+    Keyword arguments override individual keys, e.g.
+    ``make_raw_item(priority="P🔥")``; keys that are not identifiers go
+    through a dict, e.g. ``make_raw_item(**{"estimate (Hrs)": 3.0})``.
+    """
+    def _make(**overrides):
+        raw = {
+            "id": "1", "title": "Test", "status": "Todo", "priority": "P1",
+            "assignees": [], "estimate (Hrs)": None, "labels": [],
+            "content": {"url": "https://github.com/test/repo/issues/1"}
+        }
+        raw.update(overrides)
+        return raw
+    
+    return _make
 
 
 @pytest.fixture
@@ -23,9 +144,9 @@ def sample_raw_item() -> Dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_raw_items() -> List[Dict]:
-    """Provide multiple sample raw items."""
+    """Provide multiple sample raw items, built once per session (read-only)."""
     return [
         {
             "id": "1",
@@ -58,3 +179,84 @@ def sample_raw_items() -> List[Dict]:
             "content": {"url": "https://github.com/test/repo/issues/3"}
         }
     ]
+
+
+@pytest.fixture(scope="session")
+def parsed_sample_items(sample_raw_items) -> List:
+    """Provide sample_raw_items parsed once per session (read-only)."""
+    from src.processor import parse_items
+    
+    return parse_items(sample_raw_items)
+
+
+@pytest.fixture(scope="session")
+def sample_metrics(parsed_sample_items):
+    """Provide metrics for parsed_sample_items, computed once per session (read-only)."""
+    from src.processor import calculate_metrics
+    
+    return calculate_metrics(parsed_sample_items)
+
+
+@pytest.fixture(scope="session")
+def sample_project_data_base() -> Tuple[Dict, ...]:
+    """
+    Provide sample project data for integration tests, built once per session.
+    
+    Shared by every test that requests it, so consumers must not mutate it;
+    deep-copy it first if a test needs to change the raw data.
+    """
+    return tuple(_raw_item(number, fields) for number, fields in enumerate((
+        {"title": "Implement user authentication", "status": "In Progress",
+         "priority": "P0", "assignees": ["user1"], "estimate (Hrs)": 8.0,
+         "labels": ["feature", "security"]},
+        {"title": "Fix critical bug", "status": "Todo",
+         "priority": "P🔥", "assignees": ["user2"], "estimate (Hrs)": 3.0,
+         "labels": ["bug", "urgent"]},
+        {"title": "Update documentation", "status": "Done",
+         "priority": "P2", "assignees": ["user1", "user3"], "estimate (Hrs)": 2.0,
+         "labels": ["docs"]},
+    ), start=1))
+
+
+@pytest.fixture(scope="session")
+def parsed_items(sample_project_data_base) -> List:
+    """Provide the sample project data parsed once per session (read-only)."""
+    from src.processor import parse_items
+    
+    return parse_items(copy.deepcopy(list(sample_project_data_base)))
+
+
+@pytest.fixture(scope="session")
+def computed_metrics(parsed_items):
+    """Provide metrics for the parsed sample items, computed once per session."""
+    from src.processor import calculate_metrics
+    
+    return calculate_metrics(parsed_items)
+
+
+@pytest.fixture(scope="session")
+def empty_metrics():
+    """Provide metrics for a project with no items, computed once per session (read-only)."""
+    from src.processor import calculate_metrics
+    
+    return calculate_metrics([])
+
+
+@pytest.fixture(scope="module")
+def large_dataset(request) -> List[Dict]:
+    """Provide ``--dataset-scale`` raw items, built once per module (read-only)."""
+    # Cyclic fields come from lookup tables built once, not per-item work
+    statuses = ("Todo", "In Progress", "Done")
+    users = tuple(f"user{u}" for u in range(5))
+    estimates = tuple(float(e + 1) for e in range(10))
+    return [
+        _raw_item(i, {
+            "title": f"Task {i}",
+            "status": statuses[i % 3],
+            "priority": "P1",
+            "assignees": [users[i % 5]],
+            "estimate (Hrs)": estimates[i % 10],
+            "labels": ["test"],
+        })
+        for i in range(request.config.getoption("--dataset-scale"))
+    ]
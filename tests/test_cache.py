@@ -0,0 +1,132 @@
+"""Tests for the on-disk gh response cache."""
+
+import os
+import time
+
+import pytest
+
+
+class TestGetOrFetch:
+    """Tests for get_or_fetch."""
+
+    def test_should_fetch_every_time_when_ttl_is_zero(self, tmp_path):
+        """A non-positive TTL should bypass the cache entirely."""
+        from src.cache import get_or_fetch
+        
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            return b'{}'
+        
+        get_or_fetch("key", 0, fetch, cache_dir=tmp_path)
+        get_or_fetch("key", 0, fetch, cache_dir=tmp_path)
+        
+        assert len(calls) == 2
+        assert list(tmp_path.iterdir()) == []
+
+    def test_should_serve_fresh_entry_from_disk(self, tmp_path):
+        """A second call within the TTL should not fetch again."""
+        from src.cache import get_or_fetch
+        
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            return b'{"title": "Board"}'
+        
+        first = get_or_fetch("key", 60, fetch, cache_dir=tmp_path)
+        second = get_or_fetch("key", 60, fetch, cache_dir=tmp_path)
+        
+        assert first == second == b'{"title": "Board"}'
+        assert len(calls) == 1
+
+    def test_should_refetch_expired_entry(self, tmp_path):
+        """Entries older than the TTL should be fetched and rewritten."""
+        from src.cache import get_or_fetch
+        
+        get_or_fetch("key", 60, lambda: b'old', cache_dir=tmp_path)
+        (entry,) = tmp_path.iterdir()
+        stale = time.time() - 120
+        os.utime(entry, (stale, stale))
+        
+        assert get_or_fetch("key", 60, lambda: b'new', cache_dir=tmp_path) == b'new'
+        assert entry.read_bytes() == b'new'
+
+    def test_should_not_store_failed_fetch(self, tmp_path):
+        """Errors from the fetch should propagate and leave no entry."""
+        from src.cache import get_or_fetch
+        
+        def fetch():
+            raise RuntimeError("gh failed")
+        
+        with pytest.raises(RuntimeError):
+            get_or_fetch("key", 60, fetch, cache_dir=tmp_path)
+        
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.skipif(os.name != 'posix', reason="POSIX permission bits")
+    def test_should_keep_entries_private(self, tmp_path):
+        """The cache directory should be 0700 and each entry 0600."""
+        from src.cache import get_or_fetch
+        
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir(mode=0o755)
+        os.chmod(cache_dir, 0o755)
+        
+        get_or_fetch("key", 60, lambda: b'{}', cache_dir=cache_dir)
+        (entry,) = cache_dir.iterdir()
+        
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        assert entry.stat().st_mode & 0o777 == 0o600
+
+
+class TestGhAccount:
+    """Tests for gh_account."""
+
+    @pytest.fixture
+    def gh_config(self, tmp_path, monkeypatch):
+        """Point gh at an isolated config directory with no token set."""
+        monkeypatch.setenv("GH_CONFIG_DIR", str(tmp_path))
+        monkeypatch.delenv("GH_HOST", raising=False)
+        for name in ("GH_TOKEN", "GITHUB_TOKEN", "GH_ENTERPRISE_TOKEN", "GITHUB_ENTERPRISE_TOKEN"):
+            monkeypatch.delenv(name, raising=False)
+        return tmp_path
+
+    def test_should_read_active_user_for_host(self, gh_config):
+        """Should pick the host's own user entry from hosts.yml."""
+        from src.cache import _gh_user
+        
+        (gh_config / "hosts.yml").write_text(
+            "github.com:\n"
+            "    users:\n"
+            "        other:\n"
+            "            user: nested\n"
+            "        alice:\n"
+            "    git_protocol: https\n"
+            "    user: alice\n"
+            "ghe.example.com:\n"
+            "    user: bob\n",
+            encoding='utf-8'
+        )
+        
+        assert _gh_user("github.com") == "alice"
+        assert _gh_user("ghe.example.com") == "bob"
+        assert _gh_user("missing.example.com") == ""
+
+    def test_should_separate_accounts(self, gh_config, monkeypatch):
+        """Different logins, hosts or tokens should yield different identities."""
+        from src.cache import gh_account
+        
+        hosts = gh_config / "hosts.yml"
+        hosts.write_text("github.com:\n    user: alice\n", encoding='utf-8')
+        alice = gh_account()
+        hosts.write_text("github.com:\n    user: bob\n", encoding='utf-8')
+        bob = gh_account()
+        monkeypatch.setenv("GH_TOKEN", "token-1")
+        with_token = gh_account()
+        monkeypatch.setenv("GH_HOST", "ghe.example.com")
+        other_host = gh_account()
+        
+        assert len({alice, bob, with_token, other_host}) == 4
+        assert "token-1" not in with_token
@@ -25,6 +25,54 @@ class TestChartBuilder:
         assert 'font' in rtl_config
         assert rtl_config['font']['family'] == 'Vazir'
 
+    def test_should_not_escape_persian_text_in_chart_json(self):
+        """Should emit Persian titles as raw UTF-8, not \\u escapes."""
+        from src.charts.chart_builder import ChartBuilder
+        
+        builder = ChartBuilder()
+        
+        chart_json = builder.create_status_pie_chart({"Todo": 1})
+        
+        assert 'توزیع وضعیت' in chart_json
+
+
+    def test_should_reuse_cached_json_for_identical_data(self):
+        """Should serve repeated identical charts from the cache."""
+        from src.charts.chart_builder import ChartBuilder
+        
+        builder = ChartBuilder()
+        
+        first = builder.create_status_pie_chart({"Todo": 1, "Done": 2})
+        second = builder.create_status_pie_chart({"Todo": 1, "Done": 2})
+        
+        assert first == second
+        assert builder._render_bytes.cache_info().hits == 1
+
+    def test_should_keep_label_order_when_cached(self):
+        """Should not share cached output between differently ordered data."""
+        from src.charts.chart_builder import ChartBuilder
+        
+        builder = ChartBuilder()
+        
+        builder.create_status_pie_chart({"Todo": 1, "Done": 2})
+        chart_config = json.loads(builder.create_status_pie_chart({"Done": 2, "Todo": 1}))
+        
+        assert chart_config['data'][0]['labels'] == ["Done", "Todo"]
+
+
+    def test_should_write_chart_json_to_binary_stream(self):
+        """Should write the same JSON as create_* as UTF-8 bytes."""
+        from src.charts.chart_builder import ChartBuilder
+        import io
+        
+        builder = ChartBuilder()
+        data = {"Todo": 3, "Done": 1}
+        buffer = io.BytesIO()
+        
+        builder.write_status_pie_chart(data, buffer)
+        
+        assert buffer.getvalue().decode('utf-8') == builder.create_status_pie_chart(data)
+
 
 class TestStatusDistributionCharts:
     """Tests for status distribution chart generation."""
@@ -199,6 +247,20 @@ class TestTeamWorkloadChart:
         assert 'marker' in chart_config['data'][0]
         assert 'color' in chart_config['data'][0]['marker']
 
+    def test_should_bucket_workload_colors_at_thresholds(self):
+        """Should switch colors at 6 (yellow) and 11 (red) items."""
+        from src.charts.chart_builder import ChartBuilder
+        
+        builder = ChartBuilder()
+        data = {"a": 5, "b": 6, "c": 10, "d": 11}
+        
+        chart_json = builder.create_team_workload_chart(data)
+        chart_config = json.loads(chart_json)
+        
+        assert chart_config['data'][0]['marker']['color'] == [
+            '#22c55e', '#eab308', '#eab308', '#ef4444'
+        ]
+
 
 class TestChartInteractivity:
     """Tests for chart interactivity configuration."""
@@ -69,6 +69,17 @@ class TestConfig:
         assert config.project_number == 2
         assert config.default_format == "html"
 
+    def test_should_use_defaults_when_config_file_is_malformed(self, tmp_path):
+        """Should fall back to defaults when the JSON cannot be parsed."""
+        from src.config import Config
+        
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"owner": ', encoding='utf-8')
+        
+        config = Config.load(str(config_file))
+        
+        assert config.owner == "TechBurst-Pro"
+
     def test_should_merge_with_cli_arguments(self):
         """Should merge config with CLI arguments, args take precedence."""
         from src.config import Config
@@ -110,6 +121,46 @@ class TestConfig:
         assert config.project_number == 2  # default
         assert config.default_format == "html"  # default
 
+    def test_should_reload_config_when_file_changes(self, tmp_path):
+        """Should not serve a cached config after the file is modified."""
+        from src.config import Config
+        import os
+        
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"owner": "FirstOrg"}), encoding='utf-8')
+        assert Config.load(str(config_file)).owner == "FirstOrg"
+        
+        config_file.write_text(json.dumps({"owner": "SecondOrg"}), encoding='utf-8')
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert Config.load(str(config_file)).owner == "SecondOrg"
+
+    def test_should_reuse_parsed_config_until_cache_cleared(self, tmp_path, monkeypatch):
+        """Should parse an unchanged file once and re-read after clear_cache."""
+        from src.config import Config
+        
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"owner": "CachedOrg"}), encoding='utf-8')
+        Config.clear_cache()
+        
+        reads = []
+        original_read_bytes = Path.read_bytes
+        
+        def counting_read_bytes(self):
+            reads.append(self)
+            return original_read_bytes(self)
+        
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        
+        assert Config.load(str(config_file)).owner == "CachedOrg"
+        assert Config.load(str(config_file)).owner == "CachedOrg"
+        assert len(reads) == 1
+        
+        Config.clear_cache()
+        Config.load(str(config_file))
+        assert len(reads) == 2
+
 
 
 class TestConfigValidation:
@@ -142,6 +193,15 @@ class TestConfigValidation:
         with pytest.raises(ConfigValidationError, match="project_number must be positive"):
             config.validate()
 
+    def test_should_validate_project_number_type(self):
+        """Should report a non-integer project_number instead of crashing."""
+        from src.config import Config, ConfigValidationError
+        
+        config = Config(owner="Test", project_number="2")
+        
+        with pytest.raises(ConfigValidationError, match="project_number must be positive"):
+            config.validate()
+
     def test_should_validate_format_choices(self):
         """Should raise error if format is not valid."""
         from src.config import Config, ConfigValidationError
@@ -174,3 +234,18 @@ class TestConfigValidation:
         
         with pytest.raises(ConfigValidationError, match="output_directory cannot be empty"):
             config.validate()
+
+    def test_should_report_all_validation_errors_together(self):
+        """Should list every failing field in a single error."""
+        from src.config import Config, ConfigValidationError
+        
+        config = Config(owner="", project_number=0, default_format="pdf", output_directory=" ")
+        
+        with pytest.raises(ConfigValidationError) as exc_info:
+            config.validate()
+        
+        message = str(exc_info.value)
+        assert "owner cannot be empty" in message
+        assert "project_number must be positive" in message
+        assert "format must be one of" in message
+        assert "output_directory cannot be empty" in message
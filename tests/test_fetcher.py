@@ -2,7 +2,7 @@
 
 import pytest
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 
 class TestGitHubFetcher:
@@ -17,31 +17,29 @@ class TestGitHubFetcher:
         assert fetcher.owner == "TestOrg"
         assert fetcher.project_number == 5
 
-    @patch('subprocess.run')
-    def test_should_run_gh_command_successfully(self, mock_run):
+    def test_should_run_gh_command_successfully(self, gh_mock):
         """Should execute gh CLI command and return output."""
         from src.fetcher import GitHubFetcher
         
         # Mock successful command
-        mock_run.return_value = MagicMock(
-            stdout='{"test": "data"}',
+        gh_mock.return_value = MagicMock(
+            stdout=b'{"test": "data"}',
             returncode=0
         )
         
         fetcher = GitHubFetcher("TestOrg", 5)
         result = fetcher._run_gh_command(['project', 'view', '5'])
         
-        assert result == '{"test": "data"}'
-        mock_run.assert_called_once()
+        assert result == b'{"test": "data"}'
+        gh_mock.assert_called_once()
 
-    @patch('subprocess.run')
-    def test_should_raise_error_when_gh_command_fails(self, mock_run):
+    def test_should_raise_error_when_gh_command_fails(self, gh_mock):
         """Should raise error when gh command fails."""
         from src.fetcher import GitHubFetcher, GitHubCLIError
         
         # Mock failed command
-        mock_run.return_value = MagicMock(
-            stderr='Error: not found',
+        gh_mock.return_value = MagicMock(
+            stderr=b'Error: not found',
             returncode=1
         )
         
@@ -50,26 +48,72 @@ class TestGitHubFetcher:
         with pytest.raises(GitHubCLIError, match="GitHub CLI command failed"):
             fetcher._run_gh_command(['project', 'view', '5'])
 
-    @patch('subprocess.run')
-    def test_should_raise_error_when_gh_not_installed(self, mock_run):
+    def test_should_report_text_stderr_in_error(self, gh_mock):
+        """Should build the error message whether stderr is bytes or str."""
+        from src.fetcher import GitHubFetcher, GitHubCLIError
+        
+        gh_mock.return_value = MagicMock(
+            stderr='Error: rate limited',
+            returncode=1
+        )
+        
+        fetcher = GitHubFetcher("TestOrg", 5)
+        
+        with pytest.raises(GitHubCLIError, match="rate limited"):
+            fetcher._run_gh_command(['project', 'view', '5'])
+
+    def test_should_raise_error_when_gh_not_installed(self, gh_mock):
         """Should raise error when gh CLI is not installed."""
         from src.fetcher import GitHubFetcher, GitHubCLIError
         
         # Mock FileNotFoundError (gh not found)
-        mock_run.side_effect = FileNotFoundError()
+        gh_mock.side_effect = FileNotFoundError()
         
         fetcher = GitHubFetcher("TestOrg", 5)
         
         with pytest.raises(GitHubCLIError, match="GitHub CLI.*not installed"):
             fetcher._run_gh_command(['project', 'view', '5'])
 
+    def test_should_cache_repeated_gh_commands(self, gh_mock):
+        """Should run identical gh commands only once until cache is cleared."""
+        from src.fetcher import GitHubFetcher
+        
+        gh_mock.return_value = MagicMock(
+            stdout=b'{"test": "data"}',
+            returncode=0
+        )
+        
+        fetcher = GitHubFetcher("TestOrg", 5)
+        fetcher._run_gh_command(['project', 'view', '5'])
+        fetcher._run_gh_command(['project', 'view', '5'])
+        
+        assert gh_mock.call_count == 1
+        
+        fetcher.clear_cache()
+        fetcher._run_gh_command(['project', 'view', '5'])
+        
+        assert gh_mock.call_count == 2
+
 
 
 class TestGitHubFetcherDataMethods:
     """Tests for data fetching methods."""
 
-    @patch('subprocess.run')
-    def test_should_fetch_project_details(self, mock_run):
+    def test_should_reuse_disk_cache_across_fetchers(self, gh_mock, tmp_path, monkeypatch):
+        """With cache_ttl set, a new fetcher should not re-run gh for fresh data."""
+        from src import cache
+        from src.fetcher import GitHubFetcher
+        
+        monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+        gh_mock.return_value = MagicMock(stdout=b'{"title": "Board"}', returncode=0)
+        
+        GitHubFetcher("TestOrg", 5, cache_ttl=300).fetch_project_details()
+        details = GitHubFetcher("TestOrg", 5, cache_ttl=300).fetch_project_details()
+        
+        assert details == {"title": "Board"}
+        assert gh_mock.call_count == 1
+
+    def test_should_fetch_project_details(self, gh_mock):
         """Should fetch project metadata."""
         from src.fetcher import GitHubFetcher
         
@@ -78,8 +122,8 @@ class TestGitHubFetcherDataMethods:
             "title": "Test Project",
             "number": 5
         }
-        mock_run.return_value = MagicMock(
-            stdout=json.dumps(project_data),
+        gh_mock.return_value = MagicMock(
+            stdout=json.dumps(project_data).encode('utf-8'),
             returncode=0
         )
         
@@ -88,13 +132,12 @@ class TestGitHubFetcherDataMethods:
         
         assert result == project_data
         # Verify correct command was called
-        call_args = mock_run.call_args[0][0]
+        call_args = gh_mock.call_args[0][0]
         assert 'gh' in call_args
         assert 'project' in call_args
         assert 'view' in call_args
 
-    @patch('subprocess.run')
-    def test_should_fetch_project_items(self, mock_run):
+    def test_should_fetch_project_items(self, gh_mock):
         """Should fetch all project items with limit 100."""
         from src.fetcher import GitHubFetcher
         
@@ -104,8 +147,8 @@ class TestGitHubFetcherDataMethods:
                 {"id": "2", "title": "Item 2"}
             ]
         }
-        mock_run.return_value = MagicMock(
-            stdout=json.dumps(items_data),
+        gh_mock.return_value = MagicMock(
+            stdout=json.dumps(items_data).encode('utf-8'),
             returncode=0
         )
         
@@ -114,12 +157,11 @@ class TestGitHubFetcherDataMethods:
         
         assert result == items_data["items"]
         # Verify limit 100 was used
-        call_args = mock_run.call_args[0][0]
+        call_args = gh_mock.call_args[0][0]
         assert '--limit' in call_args
         assert '100' in call_args
 
-    @patch('subprocess.run')
-    def test_should_fetch_project_fields(self, mock_run):
+    def test_should_fetch_project_fields(self, gh_mock):
         """Should fetch project field definitions."""
         from src.fetcher import GitHubFetcher
         
@@ -129,8 +171,8 @@ class TestGitHubFetcherDataMethods:
                 {"id": "f2", "name": "Priority"}
             ]
         }
-        mock_run.return_value = MagicMock(
-            stdout=json.dumps(fields_data),
+        gh_mock.return_value = MagicMock(
+            stdout=json.dumps(fields_data).encode('utf-8'),
             returncode=0
         )
         
@@ -139,41 +181,39 @@ class TestGitHubFetcherDataMethods:
         
         assert result == fields_data["fields"]
         # Verify correct command
-        call_args = mock_run.call_args[0][0]
+        call_args = gh_mock.call_args[0][0]
         assert 'field-list' in call_args
 
-    @patch('subprocess.run')
-    def test_should_use_owner_and_project_number_in_commands(self, mock_run):
+    def test_should_use_owner_and_project_number_in_commands(self, gh_mock):
         """Should include owner and project number in gh commands."""
         from src.fetcher import GitHubFetcher
         
-        mock_run.return_value = MagicMock(
-            stdout='{"id": "test"}',
+        gh_mock.return_value = MagicMock(
+            stdout=b'{"id": "test"}',
             returncode=0
         )
         
         fetcher = GitHubFetcher("MyOrg", 10)
         fetcher.fetch_project_details()
         
-        call_args = mock_run.call_args[0][0]
+        call_args = gh_mock.call_args[0][0]
         assert '--owner' in call_args
         assert 'MyOrg' in call_args
         assert '10' in call_args
 
-    @patch('subprocess.run')
-    def test_should_request_json_format(self, mock_run):
+    def test_should_request_json_format(self, gh_mock):
         """Should request JSON format from gh CLI."""
         from src.fetcher import GitHubFetcher
         
-        mock_run.return_value = MagicMock(
-            stdout='{"test": "data"}',
+        gh_mock.return_value = MagicMock(
+            stdout=b'{"test": "data"}',
             returncode=0
         )
         
         fetcher = GitHubFetcher("TestOrg", 5)
         fetcher.fetch_project_details()
         
-        call_args = mock_run.call_args[0][0]
+        call_args = gh_mock.call_args[0][0]
         assert '--format' in call_args
         assert 'json' in call_args
 
@@ -182,13 +222,12 @@ class TestGitHubFetcherDataMethods:
 class TestGitHubFetcherErrorHandling:
     """Tests for error handling."""
 
-    @patch('subprocess.run')
-    def test_should_handle_invalid_json_response(self, mock_run):
+    def test_should_handle_invalid_json_response(self, gh_mock):
         """Should raise error when response is not valid JSON."""
         from src.fetcher import GitHubFetcher
         
-        mock_run.return_value = MagicMock(
-            stdout='invalid json{',
+        gh_mock.return_value = MagicMock(
+            stdout=b'invalid json{',
             returncode=0
         )
         
@@ -197,13 +236,26 @@ class TestGitHubFetcherErrorHandling:
         with pytest.raises(json.JSONDecodeError):
             fetcher.fetch_project_details()
 
-    @patch('subprocess.run')
-    def test_should_handle_authentication_error(self, mock_run):
+    def test_should_expose_decode_error_alias(self, gh_mock):
+        """Malformed output should be catchable via the module's JSONDecodeError."""
+        from src.fetcher import GitHubFetcher, JSONDecodeError
+        
+        gh_mock.return_value = MagicMock(
+            stdout=b'{"items": [',
+            returncode=0
+        )
+        
+        fetcher = GitHubFetcher("TestOrg", 5)
+        
+        with pytest.raises(JSONDecodeError):
+            fetcher.fetch_project_items()
+
+    def test_should_handle_authentication_error(self, gh_mock):
         """Should raise error with authentication message."""
         from src.fetcher import GitHubFetcher, GitHubCLIError
         
-        mock_run.return_value = MagicMock(
-            stderr='Error: authentication required',
+        gh_mock.return_value = MagicMock(
+            stderr=b'Error: authentication required',
             returncode=1
         )
         
@@ -212,13 +264,12 @@ class TestGitHubFetcherErrorHandling:
         with pytest.raises(GitHubCLIError, match="authentication"):
             fetcher.fetch_project_details()
 
-    @patch('subprocess.run')
-    def test_should_handle_project_not_found(self, mock_run):
+    def test_should_handle_project_not_found(self, gh_mock):
         """Should raise error when project doesn't exist."""
         from src.fetcher import GitHubFetcher, GitHubCLIError
         
-        mock_run.return_value = MagicMock(
-            stderr='Error: project not found',
+        gh_mock.return_value = MagicMock(
+            stderr=b'Error: project not found',
             returncode=1
         )
         
@@ -226,3 +277,93 @@ class TestGitHubFetcherErrorHandling:
         
         with pytest.raises(GitHubCLIError, match="not found"):
             fetcher.fetch_project_details()
+
+
+
+class TestGitHubFetcherV2Pagination:
+    """Tests for cursor pagination in GitHubFetcherV2."""
+
+    @staticmethod
+    def _page(node_ids, has_next, cursor=None):
+        """Build a canned GraphQL items page."""
+        page = {
+            "data": {"organization": {"projectV2": {"items": {
+                "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                "nodes": [
+                    {"id": node_id, "content": {"title": node_id}}
+                    for node_id in node_ids
+                ]
+            }}}}
+        }
+        return MagicMock(stdout=json.dumps(page).encode('utf-8'), returncode=0)
+
+    def test_should_raise_error_when_organization_is_null(self, gh_mock):
+        """A non-org owner comes back as a null organization and should raise GitHubCLIError."""
+        from src.fetcher_v2 import GitHubFetcherV2
+        from src.fetcher import GitHubCLIError
+        
+        gh_mock.return_value = MagicMock(
+            stdout=b'{"data": {"organization": null}}', returncode=0
+        )
+        
+        with pytest.raises(GitHubCLIError, match="not found"):
+            GitHubFetcherV2("some-user", 5).fetch_all()
+
+    def test_should_follow_cursor_until_last_page(self, gh_mock):
+        """Should request pages by cursor and combine all nodes."""
+        from src.fetcher_v2 import GitHubFetcherV2
+        
+        gh_mock.side_effect = [
+            self._page(["1", "2"], has_next=True, cursor="CURSOR1"),
+            self._page(["3"], has_next=False)
+        ]
+        
+        fetcher = GitHubFetcherV2("TestOrg", 5)
+        items = fetcher.fetch_project_items_with_timestamps(limit=500)
+        
+        assert [item['id'] for item in items] == ["1", "2", "3"]
+        assert gh_mock.call_count == 2
+        second_call_args = gh_mock.call_args_list[1][0][0]
+        assert 'after=CURSOR1' in second_call_args
+
+    def test_should_cap_page_size_at_remaining_limit(self, gh_mock):
+        """Should never ask for more than the remaining limit or 100 per page."""
+        from src.fetcher_v2 import GitHubFetcherV2
+        
+        gh_mock.return_value = self._page(["1"], has_next=False)
+        
+        fetcher = GitHubFetcherV2("TestOrg", 5)
+        fetcher.fetch_project_items_with_timestamps(limit=30)
+        
+        call_args = gh_mock.call_args[0][0]
+        assert 'first=30' in call_args
+        assert not any(arg.startswith('after=') for arg in call_args)
+
+    def test_should_fetch_details_items_and_fields_in_one_call(self, gh_mock):
+        """Should return project details, items and fields from a single gh call."""
+        from src.fetcher_v2 import GitHubFetcherV2
+        
+        response = self._page(["1"], has_next=False)
+        payload = json.loads(response.stdout)
+        project = payload["data"]["organization"]["projectV2"]
+        project.update({
+            "id": "PVT_1", "number": 5, "title": "Board", "url": "https://example.com",
+            "fields": {"nodes": [
+                {"__typename": "ProjectV2Field", "id": "F1", "name": "Title"},
+                {"__typename": "ProjectV2SingleSelectField", "id": "F2", "name": "Status",
+                 "options": [{"id": "O1", "name": "Todo"}]}
+            ]}
+        })
+        gh_mock.return_value = MagicMock(
+            stdout=json.dumps(payload).encode('utf-8'), returncode=0
+        )
+        
+        fetcher = GitHubFetcherV2("TestOrg", 5)
+        details, items, fields = fetcher.fetch_all()
+        
+        assert gh_mock.call_count == 1
+        assert 'withMetadata=true' in gh_mock.call_args[0][0]
+        assert details['title'] == "Board"
+        assert [item['id'] for item in items] == ["1"]
+        assert [field['name'] for field in fields] == ["Title", "Status"]
+        assert fields[1]['options'] == [{"id": "O1", "name": "Todo"}]
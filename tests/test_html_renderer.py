@@ -23,6 +23,75 @@ class TestHTMLRenderer:
         
         assert renderer.template is not None
 
+    def test_should_defer_template_loading_until_first_use(self):
+        """Should not load the template when the renderer is created."""
+        from src.renderers.html_renderer import HTMLRenderer
+        
+        renderer = HTMLRenderer()
+        
+        assert 'template' not in vars(renderer)
+        assert renderer.template is not None
+        assert 'template' in vars(renderer)
+
+    def test_should_reuse_compiled_template_across_renderers(self):
+        """Should share one compiled template and chart builder per process."""
+        from src.renderers.html_renderer import HTMLRenderer
+
+        first = HTMLRenderer()
+        second = HTMLRenderer()
+
+        assert first.template is second.template
+        assert first.chart_builder is second.chart_builder
+
+    def test_should_render_with_injected_environment(self, tmp_path):
+        """Should load report.html from an environment passed to the constructor."""
+        from jinja2 import DictLoader, Environment
+        from src.renderers.html_renderer import HTMLRenderer
+        from src.models import ProjectMetrics
+        
+        env = Environment(loader=DictLoader({'report.html': '<p>{{ project_name }}</p>'}))
+        renderer = HTMLRenderer(env=env)
+        
+        html = renderer.render_to_string(items=[], metrics=ProjectMetrics(), project_name="Injected")
+        
+        assert renderer.env is env
+        assert html == '<p>Injected</p>'
+
+    def test_should_share_one_environment_without_auto_reload(self):
+        """Should build the Jinja2 environment once and skip template reload checks."""
+        from src.renderers.html_renderer import HTMLRenderer
+        
+        first = HTMLRenderer()
+        second = HTMLRenderer()
+        
+        assert first.env is second.env
+        assert first.env.auto_reload is False
+
+    def test_should_persist_compiled_template_bytecode(self, tmp_path):
+        """Should write compiled templates to the bytecode cache directory."""
+        from jinja2 import FileSystemBytecodeCache
+        from src.renderers.html_renderer import HTMLRenderer, _get_environment
+        
+        renderer = HTMLRenderer(env=_get_environment(tmp_path))
+        renderer.template
+        
+        assert isinstance(renderer.env.bytecode_cache, FileSystemBytecodeCache)
+        assert any(tmp_path.iterdir())
+
+    def test_should_default_to_per_user_bytecode_cache(self):
+        """The shared environment should use Jinja2's per-user, owner-only cache directory."""
+        import os
+        import stat
+        from src.renderers.html_renderer import _get_environment
+        
+        bytecode_cache = _get_environment().bytecode_cache
+        if bytecode_cache is None:
+            pytest.skip("no safe per-user bytecode cache directory here")
+        
+        mode = os.stat(bytecode_cache.directory).st_mode
+        assert stat.S_IMODE(mode) == 0o700
+        assert os.stat(bytecode_cache.directory).st_uid == os.getuid()
+
     def test_should_render_html_with_basic_data(self, tmp_path):
         """Should render HTML with project data."""
         from src.renderers.html_renderer import HTMLRenderer
@@ -67,6 +136,32 @@ class TestHTMLRenderer:
         assert 'Test Project' in content
         assert 'Test Item' in content
 
+    def test_should_render_same_html_in_memory_and_to_file(self, tmp_path):
+        """render_to_string should return exactly what render writes."""
+        from src.renderers.html_renderer import HTMLRenderer
+        from src.models import ProjectMetrics
+        
+        renderer = HTMLRenderer()
+        output_file = tmp_path / "test_report.html"
+        
+        renderer.render(
+            items=[], metrics=ProjectMetrics(), output_path=str(output_file),
+            project_name="Test", owner="Test", project_number=1
+        )
+        in_memory = renderer.render_to_string(
+            items=[], metrics=ProjectMetrics(),
+            project_name="Test", owner="Test", project_number=1
+        )
+        
+        # Only the generation timestamp may differ between the two renders
+        def without_dates(html):
+            return [
+                line for line in html.splitlines()
+                if 'generation-date' not in line and 'report-date' not in line
+            ]
+        
+        assert without_dates(in_memory) == without_dates(output_file.read_text(encoding='utf-8'))
+
     def test_should_include_rtl_direction(self, tmp_path):
         """Should include RTL direction in HTML."""
         from src.renderers.html_renderer import HTMLRenderer
@@ -95,6 +190,23 @@ class TestHTMLRenderer:
         assert 'dir="rtl"' in content
         assert 'lang="fa"' in content
 
+    def test_should_skip_item_scan_without_items(self, monkeypatch, make_item):
+        """An empty item list should skip the high-priority scan but keep the charts."""
+        import json
+        from src.renderers import html_renderer
+        from src.models import ProjectMetrics
+        
+        def fail(items):
+            raise AssertionError("scanned an empty item list")
+        
+        monkeypatch.setattr(html_renderer, '_collect_high_priority_items', fail)
+        metrics = ProjectMetrics(items_by_status={"Todo": [make_item()]})
+        
+        context = html_renderer.HTMLRenderer()._build_context([], metrics, "Test", "Test", 1)
+        
+        assert context['high_priority_items'] == []
+        assert json.loads(context['status_pie_chart'])['data'][0]['labels'] == ["Todo"]
+
     def test_should_include_charts_data(self, tmp_path):
         """Should include chart data in rendered HTML."""
         from src.renderers.html_renderer import HTMLRenderer
@@ -208,6 +320,44 @@ class TestHTMLRenderer:
         assert 'Fire Item' in content
         assert 'P0 Item' in content
 
+    def test_should_list_fire_items_before_p0_sorted_by_title(self, tmp_path):
+        """Should order high priority items P🔥 first, each group by title."""
+        from src.renderers.html_renderer import HTMLRenderer
+        from src.models import ProjectItem, ProjectMetrics, Priority, Status
+        
+        renderer = HTMLRenderer()
+        
+        def make_item(item_id, title, priority):
+            return ProjectItem(
+                id=item_id, title=title, status=Status.TODO, priority=priority,
+                assignees=[], estimate_hours=None, labels=[],
+                url="", repository="", issue_number=None
+            )
+        
+        items = [
+            make_item("1", "Zeta P0", Priority.P0),
+            make_item("2", "Beta Fire", Priority.FIRE),
+            make_item("3", "Alpha P0", Priority.P0),
+            make_item("4", "Omega Fire", Priority.FIRE)
+        ]
+        
+        output_file = tmp_path / "test_report.html"
+        renderer.render(
+            items=items,
+            metrics=ProjectMetrics(),
+            output_path=str(output_file),
+            project_name="Test",
+            owner="Test",
+            project_number=1
+        )
+        
+        content = output_file.read_text(encoding='utf-8')
+        positions = [
+            content.index(title)
+            for title in ("Beta Fire", "Omega Fire", "Alpha P0", "Zeta P0")
+        ]
+        assert positions == sorted(positions)
+
     def test_should_use_utf8_encoding(self, tmp_path):
         """Should use UTF-8 encoding for Persian text."""
         from src.renderers.html_renderer import HTMLRenderer
@@ -244,3 +394,66 @@ class TestHTMLRenderer:
         assert 'تسک تست' in content
         assert 'پروژه تست' in content
         assert 'charset="UTF-8"' in content
+
+    def test_should_chart_active_workload_without_tpm(self, tmp_path, make_item):
+        """Should chart active items per assignee and leave out the TPM."""
+        from src.renderers.html_renderer import HTMLRenderer
+        from src.models import ProjectMetrics, Status
+
+        renderer = HTMLRenderer()
+        active = make_item(status=Status.IN_PROGRESS)
+        finished = make_item(status=Status.DONE)
+
+        metrics = ProjectMetrics(
+            total_items=0, total_estimate_hours=0.0, completion_percentage=0.0,
+            planned_count=0, unplanned_count=0, unplanned_percentage=0.0,
+            high_priority_not_started=0,
+            items_by_status={}, items_by_priority={},
+            items_by_assignee={
+                "MansourM": [active], "developer1": [active, finished], "developer2": [finished]
+            }
+        )
+
+        output_file = tmp_path / "test_report.html"
+        renderer.render(
+            items=[],
+            metrics=metrics,
+            output_path=str(output_file),
+            project_name="Test",
+            owner="Test",
+            project_number=1
+        )
+
+        content = output_file.read_text(encoding='utf-8')
+        workload_line = next(
+            line for line in content.splitlines() if 'teamWorkload:' in line
+        )
+        assert 'developer1' in workload_line
+        assert 'developer2' not in workload_line
+        assert 'MansourM' not in workload_line
+
+    def test_should_build_chart_payload_as_json(self, make_item):
+        """Should precompute every chart from the groupings as JSON strings."""
+        import json
+        from src.renderers.html_renderer import HTMLRenderer
+        from src.models import ProjectMetrics, Priority
+        
+        renderer = HTMLRenderer()
+        first = make_item(priority=Priority.P0)
+        second = make_item(priority=Priority.FIRE)
+        metrics = ProjectMetrics(
+            total_items=2, planned_count=1, unplanned_count=1,
+            items_by_status={"Todo": [first, second]},
+            items_by_priority={"P0": [first], "P🔥": [second]}
+        )
+        
+        payload = renderer._build_chart_payload(metrics)
+        
+        assert set(payload) == {
+            'status_pie_chart', 'priority_chart',
+            'planned_unplanned_chart', 'team_workload_chart'
+        }
+        status_pie = json.loads(payload['status_pie_chart'])
+        assert status_pie['data'][0]['labels'] == ["Todo"]
+        assert json.loads(payload['planned_unplanned_chart'])['data'][0]['values'] == [1, 1]
+
@@ -1,9 +1,16 @@
 """Integration tests for end-to-end workflows."""
 
+import dataclasses
+import gc
 import pytest
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 from src.models import ProjectItem, Priority, Status
 from src.processor import parse_items, calculate_metrics
 from src.snapshot import save_snapshot, load_latest_snapshot, compare_snapshots
@@ -12,135 +19,86 @@ from src.renderers.md_renderer import MarkdownRenderer
 from src.renderers.csv_renderer import CSVRenderer
 from src.renderers.json_renderer import JSONRenderer
 
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope="module")
+def reports_dir(tmp_path_factory):
+    """Provide one output directory for all report renders in this module."""
+    return tmp_path_factory.mktemp("reports")
+
+
+def _check_html_report(content: bytes) -> None:
+    """Assert the HTML report carries the project name and RTL layout."""
+    html = content.decode('utf-8')
+    assert 'Test Project' in html
+    assert 'dir="rtl"' in html
 
-@pytest.fixture
-def sample_project_data():
-    """Provide sample project data for integration tests."""
-    return [
-        {
-            "id": "1",
-            "title": "Implement user authentication",
-            "status": "In Progress",
-            "priority": "P0",
-            "assignees": ["user1"],
-            "estimate (Hrs)": 8.0,
-            "labels": ["feature", "security"],
-            "content": {
-                "url": "https://github.com/test/repo/issues/1",
-                "repository": "test/repo",
-                "number": 1
-            }
-        },
-        {
-            "id": "2",
-            "title": "Fix critical bug",
-            "status": "Todo",
-            "priority": "P🔥",
-            "assignees": ["user2"],
-            "estimate (Hrs)": 3.0,
-            "labels": ["bug", "urgent"],
-            "content": {
-                "url": "https://github.com/test/repo/issues/2",
-                "repository": "test/repo",
-                "number": 2
-            }
-        },
-        {
-            "id": "3",
-            "title": "Update documentation",
-            "status": "Done",
-            "priority": "P2",
-            "assignees": ["user1", "user3"],
-            "estimate (Hrs)": 2.0,
-            "labels": ["docs"],
-            "content": {
-                "url": "https://github.com/test/repo/issues/3",
-                "repository": "test/repo",
-                "number": 3
-            }
-        }
-    ]
+
+def _check_markdown_report(content: bytes) -> None:
+    """Assert the Markdown report has its Persian heading."""
+    assert '# گزارش پروژه' in content.decode('utf-8')
+
+
+def _check_csv_report(content: bytes) -> None:
+    """Assert the CSV report has a row per item after the header."""
+    assert len(content.decode('utf-8-sig').strip().splitlines()) == 4
+
+
+def _check_json_report(content: bytes) -> None:
+    """Assert the JSON report carries metadata and metrics."""
+    # Parse the UTF-8 bytes directly rather than decoding to str first
+    json_data = orjson.loads(content) if orjson is not None else json.loads(content)
+    assert json_data['metadata']['project_name'] == 'Test Project'
+    assert json_data['metrics']['total_items'] == 3
 
 
 class TestEndToEndWorkflow:
     """Test complete end-to-end workflow."""
 
-    def test_should_process_and_generate_all_formats(self, tmp_path, sample_project_data):
-        """Should process data and generate reports in all formats."""
-        # Parse items
-        items = parse_items(sample_project_data)
-        assert len(items) == 3
-        
-        # Calculate metrics
-        metrics = calculate_metrics(items)
-        assert metrics.total_items == 3
-        assert metrics.completion_percentage == pytest.approx(33.33, rel=0.1)
-        assert metrics.unplanned_count == 1
-        
-        # Generate HTML report
-        html_path = tmp_path / "report.html"
-        html_renderer = HTMLRenderer()
-        html_renderer.render(
-            items=items,
-            metrics=metrics,
-            output_path=str(html_path),
-            project_name="Test Project",
-            owner="TestOrg",
-            project_number=1
-        )
-        assert html_path.exists()
-        html_content = html_path.read_text(encoding='utf-8')
-        assert 'Test Project' in html_content
-        assert 'dir="rtl"' in html_content
-        
-        # Generate Markdown report
-        md_path = tmp_path / "report.md"
-        md_renderer = MarkdownRenderer()
-        md_renderer.render(
-            items=items,
-            metrics=metrics,
-            output_path=str(md_path),
-            project_name="Test Project",
-            owner="TestOrg",
-            project_number=1
-        )
-        assert md_path.exists()
-        md_content = md_path.read_text(encoding='utf-8')
-        assert '# گزارش پروژه' in md_content
-        
-        # Generate CSV report
-        csv_path = tmp_path / "report.csv"
-        csv_renderer = CSVRenderer()
-        csv_renderer.render(
-            items=items,
-            metrics=metrics,
-            output_path=str(csv_path),
+    @pytest.fixture(autouse=True)
+    def _collect_after_slow_tests(self, request):
+        """Free the items and rendered reports of a slow test before the next starts."""
+        yield
+        if request.node.get_closest_marker("slow") is not None:
+            gc.collect()
+
+    def test_should_parse_items_and_compute_metrics(self, parsed_items, computed_metrics):
+        """Should parse the sample data and calculate its metrics."""
+        assert len(parsed_items) == 3
+        assert computed_metrics.total_items == 3
+        assert computed_metrics.completion_percentage == pytest.approx(33.33, rel=0.1)
+        assert computed_metrics.unplanned_count == 1
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("renderer_cls, extension, check", [
+        (HTMLRenderer, "html", _check_html_report),
+        (MarkdownRenderer, "md", _check_markdown_report),
+        (CSVRenderer, "csv", _check_csv_report),
+        (JSONRenderer, "json", _check_json_report),
+    ], ids=["html", "md", "csv", "json"])
+    def test_should_generate_report_in_each_format(
+        self, reports_dir, parsed_items, computed_metrics, renderer_cls, extension, check
+    ):
+        """Should generate a report from the processed data in every format."""
+        # Each format writes its own file, so one directory serves them all
+        output_path = reports_dir / f"report.{extension}"
+        renderer_cls().render(
+            items=parsed_items,
+            metrics=computed_metrics,
+            output_path=str(output_path),
             project_name="Test Project",
             owner="TestOrg",
             project_number=1
         )
-        assert csv_path.exists()
         
-        # Generate JSON report
-        json_path = tmp_path / "report.json"
-        json_renderer = JSONRenderer()
-        json_renderer.render(
-            items=items,
-            metrics=metrics,
-            output_path=str(json_path),
-            project_name="Test Project",
-            owner="TestOrg",
-            project_number=1
-        )
-        assert json_path.exists()
-        json_data = json.loads(json_path.read_text(encoding='utf-8'))
-        assert json_data['metadata']['project_name'] == 'Test Project'
-        assert json_data['metrics']['total_items'] == 3
+        assert output_path.exists()
+        check(output_path.read_bytes())
 
-    def test_should_handle_snapshot_workflow(self, tmp_path, sample_project_data):
+    def test_should_handle_snapshot_workflow(self, tmp_path, parsed_items):
         """Should save and compare snapshots."""
-        # Parse items
-        items = parse_items(sample_project_data)
+        # Items parsed from the unmodified sample data
+        items = parsed_items
         
         # Save first snapshot
         snapshot_dir = tmp_path / "snapshots"
@@ -152,16 +110,19 @@ class TestEndToEndWorkflow:
         assert loaded_items is not None
         assert len(loaded_items) == 3
         
-        # Modify data (complete an item)
-        sample_project_data[0]['status'] = 'Done'
-        items_updated = parse_items(sample_project_data)
+        # Complete one item, reusing the other parsed items unchanged
+        items_updated = list(items)
+        items_updated[0] = dataclasses.replace(items[0], status=Status.DONE)
         
         # Compare snapshots
         comparison = compare_snapshots(items_updated, items)
         assert comparison['items_completed'] == 1
         assert comparison['items_added'] == 0
+        assert [(change['id'], change['to_status']) for change in comparison['status_changes']] == [
+            (items[0].id, Status.DONE.value)
+        ]
 
-    def test_should_handle_persian_text_throughout(self, tmp_path):
+    def test_should_handle_persian_text_throughout(self, jinja_env):
         """Should handle Persian text in all components."""
         # Create items with Persian text
         persian_data = [
@@ -185,81 +146,78 @@ class TestEndToEndWorkflow:
         metrics = calculate_metrics(items)
         
         # Test HTML rendering with Persian
-        html_path = tmp_path / "persian_report.html"
-        html_renderer = HTMLRenderer()
-        html_renderer.render(
+        html_content = HTMLRenderer(env=jinja_env).render_to_string(
             items=items,
             metrics=metrics,
-            output_path=str(html_path),
             project_name="پروژه تست",
             owner="سازمان",
             project_number=1
         )
         
-        html_content = html_path.read_text(encoding='utf-8')
         assert 'پیاده‌سازی احراز هویت کاربر' in html_content
         assert 'پروژه تست' in html_content
         assert 'کاربر۱' in html_content
+        
+        # Test Markdown rendering with Persian
+        md_content = MarkdownRenderer().render_to_string(
+            items=items,
+            metrics=metrics,
+            project_name="پروژه تست",
+            owner="سازمان",
+            project_number=1
+        )
+        
+        assert 'پیاده‌سازی احراز هویت کاربر' in md_content
+        assert '# گزارش پروژه: پروژه تست' in md_content
 
-    def test_should_handle_empty_project(self, tmp_path):
+    def test_should_list_markdown_status_groups_from_metrics(self, make_item):
+        """Items by Status should follow metrics.items_by_status, not the item list."""
+        item = make_item(title="Grouped only", url="https://example.com/1", assignees=["user1"])
+        metrics = dataclasses.replace(
+            calculate_metrics([]), total_items=1, items_by_status={"Todo": [item]}
+        )
+        
+        md_content = MarkdownRenderer().render_to_string(items=[], metrics=metrics)
+        
+        status_section = md_content.split("## آیتم‌ها بر اساس وضعیت\n", 1)[1]
+        assert status_section.startswith(
+            "### Todo (1)\n- **[P1]** [Grouped only](https://example.com/1) - user1\n"
+        )
+
+    def test_should_handle_empty_project(self, jinja_env, empty_metrics):
         """Should handle project with no items."""
         items = []
-        metrics = calculate_metrics(items)
+        metrics = empty_metrics
         
         assert metrics.total_items == 0
         assert metrics.completion_percentage == 0.0
         
         # Should still generate reports
-        html_path = tmp_path / "empty_report.html"
-        html_renderer = HTMLRenderer()
-        html_renderer.render(
+        html_content = HTMLRenderer(env=jinja_env).render_to_string(
             items=items,
             metrics=metrics,
-            output_path=str(html_path),
             project_name="Empty Project",
             owner="TestOrg",
             project_number=1
         )
         
-        assert html_path.exists()
+        assert 'Empty Project' in html_content
 
-    def test_should_handle_large_dataset(self, tmp_path):
+    @pytest.mark.slow
+    def test_should_handle_large_dataset(self, large_dataset, jinja_env):
         """Should handle projects with many items."""
-        # Create 100 items
-        large_dataset = []
-        for i in range(100):
-            large_dataset.append({
-                "id": str(i),
-                "title": f"Task {i}",
-                "status": "Todo" if i % 3 == 0 else "In Progress" if i % 3 == 1 else "Done",
-                "priority": "P1",
-                "assignees": [f"user{i % 5}"],
-                "estimate (Hrs)": float(i % 10 + 1),
-                "labels": ["test"],
-                "content": {
-                    "url": f"https://github.com/test/repo/issues/{i}",
-                    "repository": "test/repo",
-                    "number": i
-                }
-            })
-        
         items = parse_items(large_dataset)
         metrics = calculate_metrics(items)
         
-        assert metrics.total_items == 100
+        assert metrics.total_items == len(large_dataset)
         
         # Generate report
-        html_path = tmp_path / "large_report.html"
-        html_renderer = HTMLRenderer()
-        html_renderer.render(
+        html_content = HTMLRenderer(env=jinja_env).render_to_string(
             items=items,
             metrics=metrics,
-            output_path=str(html_path),
             project_name="Large Project",
             owner="TestOrg",
             project_number=1
         )
         
-        assert html_path.exists()
-        # File should be reasonably sized
-        assert html_path.stat().st_size > 0
+        assert f"Task {len(large_dataset) - 1}" in html_content
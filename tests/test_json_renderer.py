@@ -0,0 +1,82 @@
+"""Tests for JSON renderer."""
+
+import json
+
+import pytest
+
+
+class TestJSONRenderer:
+    """Tests for JSONRenderer class."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_should_stream_valid_json_with_items(self, tmp_path, monkeypatch, use_orjson):
+        """Should write a valid document with every item, with or without orjson."""
+        from src.renderers import json_renderer
+        from src.processor import parse_items, calculate_metrics
+
+        if not use_orjson:
+            monkeypatch.setattr(json_renderer, 'orjson', None)
+        elif json_renderer.orjson is None:
+            pytest.skip("orjson is not installed")
+
+        items = parse_items([
+            {"id": "1", "title": "تسک \"اول\"\nخط دوم", "status": "Todo", "priority": "P🔥"},
+            {"id": "2", "title": "Second", "status": "Done", "assignees": ["user1"]},
+        ])
+        output_file = tmp_path / "report.json"
+
+        json_renderer.JSONRenderer().render(
+            items=items,
+            metrics=calculate_metrics(items),
+            output_path=str(output_file)
+        )
+
+        data = json.loads(output_file.read_text(encoding='utf-8'))
+        assert [item['id'] for item in data['items']] == ["1", "2"]
+        assert data['items'][0]['title'] == "تسک \"اول\"\nخط دوم"
+        assert data['items'][0]['is_planned'] is False
+        assert data['grouped_data']['by_status'] == {"Todo": 1, "Done": 1}
+
+    def test_should_write_empty_item_list(self, tmp_path):
+        """Should produce a valid document when there are no items."""
+        from src.renderers.json_renderer import JSONRenderer
+        from src.processor import calculate_metrics
+
+        output_file = tmp_path / "report.json"
+
+        JSONRenderer().render(items=[], metrics=calculate_metrics([]), output_path=str(output_file))
+
+        data = json.loads(output_file.read_text(encoding='utf-8'))
+        assert data['items'] == []
+        assert data['metrics']['total_items'] == 0
+
+    def test_should_stamp_generation_time_in_utc(self, tmp_path):
+        """Should record the generation time as a UTC ISO timestamp."""
+        from datetime import datetime, timezone, timedelta
+        from src.renderers.json_renderer import JSONRenderer
+        from src.processor import calculate_metrics
+
+        output_file = tmp_path / "report.json"
+
+        JSONRenderer().render(items=[], metrics=calculate_metrics([]), output_path=str(output_file))
+
+        stamp = json.loads(output_file.read_text(encoding='utf-8'))['metadata']['generation_timestamp']
+        assert stamp.endswith('Z')
+        generated = datetime.fromisoformat(stamp.replace('Z', '+00:00'))
+        assert abs(datetime.now(timezone.utc) - generated) < timedelta(minutes=1)
+
+    def test_should_write_compact_report_on_request(self, tmp_path):
+        """Should emit a single-line document when compact output is requested."""
+        from src.renderers.json_renderer import JSONRenderer
+        from src.processor import parse_items, calculate_metrics
+
+        items = parse_items([{"id": "1", "title": "Task", "status": "Todo"}])
+        output_file = tmp_path / "report.json"
+
+        JSONRenderer(compact=True).render(
+            items=items, metrics=calculate_metrics(items), output_path=str(output_file)
+        )
+
+        content = output_file.read_text(encoding='utf-8')
+        assert content.count('\n') == 1
+        assert json.loads(content)['items'][0]['id'] == "1"
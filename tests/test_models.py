@@ -1,71 +1,49 @@
 """Tests for data models."""
 
 import pytest
-from src.models import Priority, Status
+from src.models import Priority, ProjectItem, ProjectMetrics, Status
 
 
 class TestPriorityEnum:
     """Tests for Priority enum."""
 
-    def test_should_have_fire_priority(self):
-        """P🔥 represents unplanned urgent work."""
-        assert Priority.FIRE.value == "P🔥"
+    @pytest.mark.parametrize("member, string", [
+        (Priority.FIRE, "P🔥"),  # Unplanned urgent work
+        (Priority.P0, "P0"),     # Critical priority
+        (Priority.P1, "P1"),     # High priority
+        (Priority.P2, "P2"),     # Medium priority
+    ])
+    def test_should_map_value_and_create_from_string(self, member, string):
+        """Each Priority should carry its string value and round-trip from it."""
+        assert member.value == string
+        assert Priority(string) is member
 
-    def test_should_have_p0_priority(self):
-        """P0 represents critical priority."""
-        assert Priority.P0.value == "P0"
-
-    def test_should_have_p1_priority(self):
-        """P1 represents high priority."""
-        assert Priority.P1.value == "P1"
-
-    def test_should_have_p2_priority(self):
-        """P2 represents medium priority."""
-        assert Priority.P2.value == "P2"
-
-    def test_should_create_from_string(self):
-        """Should be able to create Priority from string value."""
-        assert Priority("P🔥") == Priority.FIRE
-        assert Priority("P0") == Priority.P0
-        assert Priority("P1") == Priority.P1
-        assert Priority("P2") == Priority.P2
+    def test_should_compare_equal_to_raw_string(self):
+        """Priority members should compare equal to their string values."""
+        assert Priority.FIRE == "P🔥"
+        assert {"P0": 1}[Priority.P0] == 1
 
 
 class TestStatusEnum:
     """Tests for Status enum."""
 
-    def test_should_have_backlog_status(self):
-        """Backlog represents items not yet started."""
-        assert Status.BACKLOG.value == "Backlog"
-
-    def test_should_have_todo_status(self):
-        """Todo represents items ready to start."""
-        assert Status.TODO.value == "Todo"
-
-    def test_should_have_pending_status(self):
-        """Pending represents blocked items."""
-        assert Status.PENDING.value == "Pending"
-
-    def test_should_have_in_progress_status(self):
-        """In Progress represents active work."""
-        assert Status.IN_PROGRESS.value == "In Progress"
-
-    def test_should_have_in_review_status(self):
-        """In Review represents items under review."""
-        assert Status.IN_REVIEW.value == "In Review"
+    @pytest.mark.parametrize("member, string", [
+        (Status.BACKLOG, "Backlog"),          # Not yet started
+        (Status.TODO, "Todo"),                # Ready to start
+        (Status.PENDING, "Pending"),          # Blocked
+        (Status.IN_PROGRESS, "In Progress"),  # Active work
+        (Status.IN_REVIEW, "In Review"),      # Under review
+        (Status.DONE, "Done"),                # Completed
+    ])
+    def test_should_map_value_and_create_from_string(self, member, string):
+        """Each Status should carry its string value and round-trip from it."""
+        assert member.value == string
+        assert Status(string) is member
 
-    def test_should_have_done_status(self):
-        """Done represents completed items."""
-        assert Status.DONE.value == "Done"
-
-    def test_should_create_from_string(self):
-        """Should be able to create Status from string value."""
-        assert Status("Backlog") == Status.BACKLOG
-        assert Status("Todo") == Status.TODO
-        assert Status("Pending") == Status.PENDING
-        assert Status("In Progress") == Status.IN_PROGRESS
-        assert Status("In Review") == Status.IN_REVIEW
-        assert Status("Done") == Status.DONE
+    def test_should_compare_equal_to_raw_string(self):
+        """Status members should compare equal to their string values."""
+        assert Status.DONE == "Done"
+        assert Status.IN_PROGRESS != "Done"
 
 
 
@@ -74,8 +52,6 @@ class TestProjectItem:
 
     def test_should_create_project_item_with_all_fields(self):
         """Should create ProjectItem with all required fields."""
-        from src.models import ProjectItem
-        
         item = ProjectItem(
             id="PVTI_123",
             title="تسک تست",
@@ -102,8 +78,6 @@ class TestProjectItem:
 
     def test_should_handle_optional_fields(self):
         """Should handle None values for optional fields."""
-        from src.models import ProjectItem
-        
         item = ProjectItem(
             id="PVTI_123",
             title="تسک تست",
@@ -122,69 +96,25 @@ class TestProjectItem:
         assert item.assignees == []
         assert item.labels == []
 
-    def test_is_planned_should_return_true_for_planned_priorities(self):
-        """Items with P0, P1, P2 should be considered planned."""
-        from src.models import ProjectItem
-        
-        p0_item = ProjectItem(
-            id="1", title="Test", status=Status.TODO, priority=Priority.P0,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        )
-        p1_item = ProjectItem(
-            id="2", title="Test", status=Status.TODO, priority=Priority.P1,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        )
-        p2_item = ProjectItem(
-            id="3", title="Test", status=Status.TODO, priority=Priority.P2,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        )
-        
-        assert p0_item.is_planned is True
-        assert p1_item.is_planned is True
-        assert p2_item.is_planned is True
-
-    def test_is_planned_should_return_false_for_fire_priority(self):
-        """Items with P🔥 should be considered unplanned."""
-        from src.models import ProjectItem
-        
-        fire_item = ProjectItem(
-            id="1", title="Test", status=Status.TODO, priority=Priority.FIRE,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        )
-        
-        assert fire_item.is_planned is False
+    @pytest.mark.parametrize("priority, expected_planned", [
+        (Priority.P0, True),
+        (Priority.P1, True),
+        (Priority.P2, True),
+        (Priority.FIRE, False),
+    ])
+    def test_is_planned_should_reflect_priority(self, make_item, priority, expected_planned):
+        """P0, P1 and P2 items are planned; P🔥 items are unplanned."""
+        assert make_item(priority=priority).is_planned is expected_planned
 
-    def test_is_active_should_return_true_for_non_done_items(self):
-        """Items not in Done status should be considered active."""
-        from src.models import ProjectItem
-        
-        backlog_item = ProjectItem(
-            id="1", title="Test", status=Status.BACKLOG, priority=Priority.P1,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        )
-        todo_item = ProjectItem(
-            id="2", title="Test", status=Status.TODO, priority=Priority.P1,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        )
-        in_progress_item = ProjectItem(
-            id="3", title="Test", status=Status.IN_PROGRESS, priority=Priority.P1,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        )
-        
-        assert backlog_item.is_active is True
-        assert todo_item.is_active is True
-        assert in_progress_item.is_active is True
-
-    def test_is_active_should_return_false_for_done_items(self):
-        """Items in Done status should not be considered active."""
-        from src.models import ProjectItem
-        
-        done_item = ProjectItem(
-            id="1", title="Test", status=Status.DONE, priority=Priority.P1,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        )
-        
-        assert done_item.is_active is False
+    @pytest.mark.parametrize("status, expected_active", [
+        (Status.BACKLOG, True),
+        (Status.TODO, True),
+        (Status.IN_PROGRESS, True),
+        (Status.DONE, False),
+    ])
+    def test_is_active_should_reflect_status(self, make_item, status, expected_active):
+        """Items not in Done status are active; Done items are not."""
+        assert make_item(status=status).is_active is expected_active
 
 
 
@@ -193,8 +123,6 @@ class TestProjectMetrics:
 
     def test_should_create_project_metrics_with_all_fields(self):
         """Should create ProjectMetrics with all required fields."""
-        from src.models import ProjectMetrics
-        
         metrics = ProjectMetrics(
             total_items=76,
             total_estimate_hours=142.5,
@@ -221,8 +149,6 @@ class TestProjectMetrics:
 
     def test_should_handle_zero_values(self):
         """Should handle zero values correctly."""
-        from src.models import ProjectMetrics
-        
         metrics = ProjectMetrics(
             total_items=0,
             total_estimate_hours=0.0,
@@ -238,3 +164,69 @@ class TestProjectMetrics:
         
         assert metrics.total_items == 0
         assert metrics.unplanned_percentage == 0.0
+
+    def test_should_default_to_empty_metrics(self):
+        """Should build zeroed metrics with fresh empty groupings."""
+
+        metrics = ProjectMetrics()
+        other = ProjectMetrics()
+
+        assert metrics.total_items == 0
+        assert metrics.total_estimate_hours == 0.0
+        assert metrics.items_by_status == {}
+        assert metrics.items_by_status is not other.items_by_status
+
+    def test_should_derive_group_counts_from_groupings(self, make_item):
+        """Counts should follow items_by_* when built without a processor."""
+        first, second = make_item(id="1"), make_item(id="2", priority=Priority.FIRE)
+        metrics = ProjectMetrics(
+            items_by_status={"Todo": [first, second]},
+            items_by_priority={"P1": [first], "P🔥": [second]},
+            items_by_assignee={"user1": [first, second]}
+        )
+        
+        assert metrics.status_counts == {"Todo": 2}
+        assert metrics.priority_counts == {"P1": 1, "P🔥": 1}
+        assert metrics.assignee_counts == {"user1": 2}
+
+
+class TestModelEnums:
+    """Tests that v1 and v2 models share enum types."""
+
+    def test_should_share_priority_and_status_with_v2(self):
+        """models_v2 should reuse the v1 enum classes, not copies."""
+        from src import models, models_v2
+
+        assert models_v2.Priority is models.Priority
+        assert models_v2.Status is models.Status
+
+    def test_should_share_metrics_class_with_v2(self):
+        """models_v2 should reuse the v1 ProjectMetrics rather than a copy."""
+        from src import models, models_v2
+
+        assert models_v2.ProjectMetrics is models.ProjectMetrics
+
+
+class TestModelSlots:
+    """Tests that item and metrics models stay slotted."""
+
+    def test_should_not_carry_instance_dict(self):
+        """Models should use __slots__ rather than a per-instance __dict__."""
+        from src.models_v2 import ProjectItemV2, ProjectMetrics as ProjectMetricsV2
+
+        for model in (ProjectItem, ProjectMetrics, ProjectItemV2, ProjectMetricsV2):
+            assert hasattr(model, '__slots__')
+            assert '__dict__' not in model.__slots__
+
+    def test_should_reject_unknown_attributes(self):
+        """Assigning an undeclared attribute should fail on slotted items."""
+        from src.models_v2 import ProjectItemV2
+
+        item = ProjectItemV2(
+            id="1", title="Test", status=Status.TODO, priority=Priority.P1,
+            assignees=[], estimate_hours=None, labels=[],
+            url="", repository="", issue_number=None
+        )
+
+        with pytest.raises(AttributeError):
+            item.extra = True
@@ -2,6 +2,21 @@
 
 import pytest
 from src.models import Priority, Status, ProjectItem
+from src.processor import (
+    parse_item,
+    parse_items,
+    calculate_metrics,
+    group_by_status,
+    group_by_priority,
+    group_by_assignee,
+    get_completion_color,
+    get_unplanned_color,
+    get_workload_color,
+    get_high_priority_color,
+    calculate_todo_count,
+    calculate_done_active_count,
+    calculate_unplanned_done_stats,
+)
 
 
 class TestDataParsing:
@@ -9,8 +24,6 @@ class TestDataParsing:
 
     def test_should_parse_raw_item_to_project_item(self, sample_raw_item):
         """Should convert raw JSON item to ProjectItem object."""
-        from src.processor import parse_item
-        
         result = parse_item(sample_raw_item)
         
         assert isinstance(result, ProjectItem)
@@ -23,68 +36,27 @@ class TestDataParsing:
         assert result.labels == ["bug"]
         assert result.url == "https://github.com/test/repo/issues/1"
 
-    def test_should_handle_missing_estimate_hours(self):
+    def test_should_handle_missing_estimate_hours(self, make_raw_item):
         """Should handle None for missing estimate hours."""
-        from src.processor import parse_item
-        
-        raw_item = {
-            "id": "1",
-            "title": "Test",
-            "status": "Todo",
-            "priority": "P1",
-            "assignees": [],
-            "estimate (Hrs)": None,
-            "labels": [],
-            "content": {"url": "https://github.com/test/repo/issues/1"}
-        }
-        
-        result = parse_item(raw_item)
+        result = parse_item(make_raw_item(**{"estimate (Hrs)": None}))
         
         assert result.estimate_hours is None
 
-    def test_should_handle_missing_assignees(self):
+    def test_should_handle_missing_assignees(self, make_raw_item):
         """Should handle empty assignees list."""
-        from src.processor import parse_item
-        
-        raw_item = {
-            "id": "1",
-            "title": "Test",
-            "status": "Todo",
-            "priority": "P1",
-            "assignees": [],
-            "estimate (Hrs)": 5.0,
-            "labels": [],
-            "content": {"url": "https://github.com/test/repo/issues/1"}
-        }
-        
-        result = parse_item(raw_item)
+        result = parse_item(make_raw_item(assignees=[], **{"estimate (Hrs)": 5.0}))
         
         assert result.assignees == []
 
-    def test_should_parse_fire_priority(self):
+    def test_should_parse_fire_priority(self, make_raw_item):
         """Should correctly parse P🔥 priority."""
-        from src.processor import parse_item
-        
-        raw_item = {
-            "id": "1",
-            "title": "Urgent",
-            "status": "In Progress",
-            "priority": "P🔥",
-            "assignees": ["user1"],
-            "estimate (Hrs)": 3.0,
-            "labels": ["urgent"],
-            "content": {"url": "https://github.com/test/repo/issues/1"}
-        }
-        
-        result = parse_item(raw_item)
+        result = parse_item(make_raw_item(title="Urgent", status="In Progress", priority="P🔥"))
         
         assert result.priority == Priority.FIRE
         assert result.is_planned is False
 
     def test_should_parse_multiple_items(self, sample_raw_items):
         """Should parse list of raw items."""
-        from src.processor import parse_items
-        
         results = parse_items(sample_raw_items)
         
         assert len(results) == 3
@@ -93,107 +65,63 @@ class TestDataParsing:
         assert results[1].status == Status.IN_PROGRESS
         assert results[2].status == Status.DONE
 
-    def test_should_extract_repository_from_content(self):
+    def test_should_extract_repository_from_content(self, make_raw_item):
         """Should extract repository info from content field."""
-        from src.processor import parse_item
-        
-        raw_item = {
-            "id": "1",
-            "title": "Test",
-            "status": "Todo",
-            "priority": "P1",
-            "assignees": [],
-            "estimate (Hrs)": None,
-            "labels": [],
-            "content": {
-                "url": "https://github.com/test/repo/issues/1",
-                "repository": "test/repo",
-                "number": 1
-            }
-        }
-        
-        result = parse_item(raw_item)
+        result = parse_item(make_raw_item(content={
+            "url": "https://github.com/test/repo/issues/1",
+            "repository": "test/repo",
+            "number": 1
+        }))
         
         assert result.repository == "test/repo"
         assert result.issue_number == 1
 
-    def test_should_handle_missing_content_fields(self):
+    def test_should_handle_missing_content_fields(self, make_raw_item):
         """Should handle missing repository and issue_number."""
-        from src.processor import parse_item
-        
-        raw_item = {
-            "id": "1",
-            "title": "Test",
-            "status": "Todo",
-            "priority": "P1",
-            "assignees": [],
-            "estimate (Hrs)": None,
-            "labels": [],
-            "content": {"url": "https://github.com/test/repo/issues/1"}
-        }
-        
-        result = parse_item(raw_item)
-        
+        result = parse_item(make_raw_item())
+
         assert result.repository == ""
         assert result.issue_number is None
 
+    def test_should_handle_null_content(self):
+        """Should treat null content (e.g. draft items) as empty."""
+        raw_item = {"id": "1", "title": "Draft", "status": "Todo", "content": None}
+
+        result = parse_item(raw_item)
+
+        assert result.url == ""
+        assert result.repository == ""
+        assert result.priority == Priority.P2
+
 
 
 class TestMetricsCalculation:
     """Tests for metrics calculation."""
 
-    def test_should_calculate_total_items(self, sample_raw_items):
+    def test_should_calculate_total_items(self, sample_metrics):
         """Should count total number of items."""
-        from src.processor import parse_items, calculate_metrics
-        
-        items = parse_items(sample_raw_items)
-        metrics = calculate_metrics(items)
-        
-        assert metrics.total_items == 3
+        assert sample_metrics.total_items == 3
 
-    def test_should_calculate_total_estimate_hours(self, sample_raw_items):
+    def test_should_calculate_total_estimate_hours(self, sample_metrics):
         """Should sum all estimate hours."""
-        from src.processor import parse_items, calculate_metrics
-        
-        items = parse_items(sample_raw_items)
-        metrics = calculate_metrics(items)
-        
-        assert metrics.total_estimate_hours == 10.0  # 3 + 5 + 2
+        assert sample_metrics.total_estimate_hours == 10.0  # 3 + 5 + 2
 
-    def test_should_calculate_completion_percentage(self, sample_raw_items):
+    def test_should_calculate_completion_percentage(self, sample_metrics):
         """Should calculate percentage of done items."""
-        from src.processor import parse_items, calculate_metrics
-        
-        items = parse_items(sample_raw_items)
-        metrics = calculate_metrics(items)
-        
-        assert metrics.completion_percentage == pytest.approx(33.3, rel=0.1)  # 1/3
+        assert sample_metrics.completion_percentage == pytest.approx(33.3, rel=0.1)  # 1/3
 
-    def test_should_calculate_planned_vs_unplanned(self, sample_raw_items):
+    def test_should_calculate_planned_vs_unplanned(self, sample_metrics):
         """Should count planned and unplanned items."""
-        from src.processor import parse_items, calculate_metrics
-        
-        items = parse_items(sample_raw_items)
-        metrics = calculate_metrics(items)
-        
-        assert metrics.planned_count == 2  # P1 items
-        assert metrics.unplanned_count == 1  # P🔥 item
-        assert metrics.unplanned_percentage == pytest.approx(33.3, rel=0.1)
+        assert sample_metrics.planned_count == 2  # P1 items
+        assert sample_metrics.unplanned_count == 1  # P🔥 item
+        assert sample_metrics.unplanned_percentage == pytest.approx(33.3, rel=0.1)
 
-    def test_should_count_high_priority_not_started(self):
+    def test_should_count_high_priority_not_started(self, make_raw_item):
         """Should count P🔥 and P0 items in Backlog or Todo."""
-        from src.processor import parse_items, calculate_metrics
-        
         raw_items = [
-            {"id": "1", "title": "Fire Todo", "status": "Todo", "priority": "P🔥",
-             "assignees": [], "estimate (Hrs)": None, "labels": [],
-             "content": {"url": "https://github.com/test/repo/issues/1"}},
-            {"id": "2", "title": "P0 Backlog", "status": "Backlog", "priority": "P0",
-             "assignees": [], "estimate (Hrs)": None, "labels": [],
-             "content": {"url": "https://github.com/test/repo/issues/2"}},
-            {"id": "3", "title": "P0 In Progress", "status": "In Progress", "priority": "P0",
-             "assignees": [], "estimate (Hrs)": None, "labels": [],
-             "content": {"url": "https://github.com/test/repo/issues/3"}},
+            make_raw_item(id="1", title="Fire Todo", status="Todo", priority="P🔥"),
+            make_raw_item(id="2", title="P0 Backlog", status="Backlog", priority="P0"),
+            make_raw_item(id="3", title="P0 In Progress", status="In Progress", priority="P0"),
         ]
         
         items = parse_items(raw_items)
@@ -201,26 +129,26 @@ class TestMetricsCalculation:
         
         assert metrics.high_priority_not_started == 2  # Fire Todo + P0 Backlog
 
-    def test_should_handle_zero_items(self):
-        """Should handle empty items list."""
-        from src.processor import calculate_metrics
-        
-        metrics = calculate_metrics([])
-        
-        assert metrics.total_items == 0
-        assert metrics.total_estimate_hours == 0.0
-        assert metrics.completion_percentage == 0.0
-        assert metrics.unplanned_percentage == 0.0
-
-    def test_should_handle_items_without_estimates(self):
+    def test_should_handle_zero_items(self, empty_metrics):
+        """Should zero every total and leave every grouping empty for no items."""
+        expected = (
+            ("total_items", 0),
+            ("total_estimate_hours", 0.0),
+            ("completion_percentage", 0.0),
+            ("unplanned_percentage", 0.0),
+            ("items_by_status", {}),
+            ("items_by_priority", {}),
+            ("items_by_assignee", {}),
+            ("status_counts", {}),
+            ("assignee_active_counts", {}),
+        )
+        
+        for attr, value in expected:
+            assert getattr(empty_metrics, attr) == value, attr
+
+    def test_should_handle_items_without_estimates(self, make_raw_item):
         """Should handle None estimate hours."""
-        from src.processor import parse_items, calculate_metrics
-        
-        raw_items = [
-            {"id": "1", "title": "No estimate", "status": "Todo", "priority": "P1",
-             "assignees": [], "estimate (Hrs)": None, "labels": [],
-             "content": {"url": "https://github.com/test/repo/issues/1"}},
-        ]
+        raw_items = [make_raw_item(title="No estimate", **{"estimate (Hrs)": None})]
         
         items = parse_items(raw_items)
         metrics = calculate_metrics(items)
@@ -232,12 +160,9 @@ class TestMetricsCalculation:
 class TestDataGrouping:
     """Tests for data grouping functions."""
 
-    def test_should_group_items_by_status(self, sample_raw_items):
+    def test_should_group_items_by_status(self, parsed_sample_items):
         """Should group items by their status."""
-        from src.processor import parse_items, group_by_status
-        
-        items = parse_items(sample_raw_items)
-        grouped = group_by_status(items)
+        grouped = group_by_status(parsed_sample_items)
         
         assert "Todo" in grouped
         assert "In Progress" in grouped
@@ -246,41 +171,29 @@ class TestDataGrouping:
         assert len(grouped["In Progress"]) == 1
         assert len(grouped["Done"]) == 1
 
-    def test_should_group_items_by_priority(self, sample_raw_items):
+    def test_should_group_items_by_priority(self, parsed_sample_items):
         """Should group items by their priority."""
-        from src.processor import parse_items, group_by_priority
-        
-        items = parse_items(sample_raw_items)
-        grouped = group_by_priority(items)
+        grouped = group_by_priority(parsed_sample_items)
         
         assert "P🔥" in grouped
         assert "P1" in grouped
         assert len(grouped["P🔥"]) == 1
         assert len(grouped["P1"]) == 2
 
-    def test_should_group_items_by_assignee(self, sample_raw_items):
+    def test_should_group_items_by_assignee(self, parsed_sample_items):
         """Should group items by assignees."""
-        from src.processor import parse_items, group_by_assignee
-        
-        items = parse_items(sample_raw_items)
-        grouped = group_by_assignee(items)
+        grouped = group_by_assignee(parsed_sample_items)
         
         assert "user1" in grouped
         assert "user2" in grouped
         assert len(grouped["user1"]) == 2  # Items 1 and 3
         assert len(grouped["user2"]) == 1  # Item 2
 
-    def test_should_handle_unassigned_items(self):
+    def test_should_handle_unassigned_items(self, make_raw_item):
         """Should group unassigned items separately."""
-        from src.processor import parse_items, group_by_assignee
-        
         raw_items = [
-            {"id": "1", "title": "Assigned", "status": "Todo", "priority": "P1",
-             "assignees": ["user1"], "estimate (Hrs)": None, "labels": [],
-             "content": {"url": "https://github.com/test/repo/issues/1"}},
-            {"id": "2", "title": "Unassigned", "status": "Todo", "priority": "P1",
-             "assignees": [], "estimate (Hrs)": None, "labels": [],
-             "content": {"url": "https://github.com/test/repo/issues/2"}},
+            make_raw_item(id="1", title="Assigned", assignees=["user1"]),
+            make_raw_item(id="2", title="Unassigned", assignees=[]),
         ]
         
         items = parse_items(raw_items)
@@ -289,15 +202,9 @@ class TestDataGrouping:
         assert "Unassigned" in grouped
         assert len(grouped["Unassigned"]) == 1
 
-    def test_should_handle_items_with_multiple_assignees(self):
+    def test_should_handle_items_with_multiple_assignees(self, make_raw_item):
         """Should include item in each assignee's group."""
-        from src.processor import parse_items, group_by_assignee
-        
-        raw_items = [
-            {"id": "1", "title": "Multi", "status": "Todo", "priority": "P1",
-             "assignees": ["user1", "user2"], "estimate (Hrs)": None, "labels": [],
-             "content": {"url": "https://github.com/test/repo/issues/1"}},
-        ]
+        raw_items = [make_raw_item(title="Multi", assignees=["user1", "user2"])]
         
         items = parse_items(raw_items)
         grouped = group_by_assignee(items)
@@ -309,359 +216,145 @@ class TestDataGrouping:
         assert grouped["user1"][0].id == "1"
         assert grouped["user2"][0].id == "1"
 
-    def test_should_return_empty_dict_for_empty_items(self):
+    @pytest.mark.parametrize("group_by", [group_by_status, group_by_priority, group_by_assignee])
+    def test_should_return_empty_dict_for_empty_items(self, group_by):
         """Should return empty dict when no items."""
-        from src.processor import group_by_status, group_by_priority, group_by_assignee
-        
-        assert group_by_status([]) == {}
-        assert group_by_priority([]) == {}
-        assert group_by_assignee([]) == {}
+        assert group_by([]) == {}
 
 
 
 class TestColorCoding:
     """Tests for color coding logic."""
 
-    def test_should_return_green_for_high_completion(self):
-        """Should return green when completion > 70%."""
-        from src.processor import get_completion_color
-        
-        assert get_completion_color(75.0) == "green"
-        assert get_completion_color(100.0) == "green"
-        assert get_completion_color(71.0) == "green"
-
-    def test_should_return_red_for_low_completion(self):
-        """Should return red when completion < 30%."""
-        from src.processor import get_completion_color
-        
-        assert get_completion_color(25.0) == "red"
-        assert get_completion_color(0.0) == "red"
-        assert get_completion_color(29.0) == "red"
-
-    def test_should_return_yellow_for_medium_completion(self):
-        """Should return yellow when completion between 30-70%."""
-        from src.processor import get_completion_color
-        
-        assert get_completion_color(50.0) == "yellow"
-        assert get_completion_color(30.0) == "yellow"
-        assert get_completion_color(70.0) == "yellow"
-
-    def test_should_return_green_for_low_unplanned(self):
-        """Should return green when unplanned < 10%."""
-        from src.processor import get_unplanned_color
-        
-        assert get_unplanned_color(5.0) == "green"
-        assert get_unplanned_color(0.0) == "green"
-        assert get_unplanned_color(9.0) == "green"
-
-    def test_should_return_red_for_high_unplanned(self):
-        """Should return red when unplanned > 20%."""
-        from src.processor import get_unplanned_color
-        
-        assert get_unplanned_color(25.0) == "red"
-        assert get_unplanned_color(50.0) == "red"
-        assert get_unplanned_color(21.0) == "red"
-
-    def test_should_return_yellow_for_medium_unplanned(self):
-        """Should return yellow when unplanned between 10-20%."""
-        from src.processor import get_unplanned_color
-        
-        assert get_unplanned_color(15.0) == "yellow"
-        assert get_unplanned_color(10.0) == "yellow"
-        assert get_unplanned_color(20.0) == "yellow"
-
-    def test_should_return_red_for_high_workload(self):
-        """Should return red when workload > 10 items."""
-        from src.processor import get_workload_color
-        
-        assert get_workload_color(11) == "red"
-        assert get_workload_color(20) == "red"
-
-    def test_should_return_yellow_for_medium_workload(self):
-        """Should return yellow when workload 6-10 items."""
-        from src.processor import get_workload_color
-        
-        assert get_workload_color(8) == "yellow"
-        assert get_workload_color(6) == "yellow"
-        assert get_workload_color(10) == "yellow"
-
-    def test_should_return_green_for_low_workload(self):
-        """Should return green when workload <= 5 items."""
-        from src.processor import get_workload_color
-        
-        assert get_workload_color(5) == "green"
-        assert get_workload_color(3) == "green"
-        assert get_workload_color(0) == "green"
-
-    def test_should_return_red_for_many_high_priority_not_started(self):
-        """Should return red when high priority not started > 5."""
-        from src.processor import get_high_priority_color
-        
-        assert get_high_priority_color(6) == "red"
-        assert get_high_priority_color(10) == "red"
-
-    def test_should_return_yellow_for_some_high_priority_not_started(self):
-        """Should return yellow when high priority not started 1-5."""
-        from src.processor import get_high_priority_color
-        
-        assert get_high_priority_color(3) == "yellow"
-        assert get_high_priority_color(1) == "yellow"
-        assert get_high_priority_color(5) == "yellow"
-
-    def test_should_return_green_for_no_high_priority_not_started(self):
-        """Should return green when high priority not started = 0."""
-        from src.processor import get_high_priority_color
-        
-        assert get_high_priority_color(0) == "green"
-
+    @pytest.mark.parametrize("completion, expected", [
+        (75.0, "green"), (100.0, "green"), (71.0, "green"),  # > 70%
+        (25.0, "red"), (0.0, "red"), (29.0, "red"),          # < 30%
+        (50.0, "yellow"), (30.0, "yellow"), (70.0, "yellow"),
+    ])
+    def test_should_color_completion_percentage(self, completion, expected):
+        """Completion is green above 70%, red below 30%, yellow between."""
+        assert get_completion_color(completion) == expected
+
+    @pytest.mark.parametrize("unplanned, expected", [
+        (5.0, "green"), (0.0, "green"), (9.0, "green"),        # < 10%
+        (25.0, "red"), (50.0, "red"), (21.0, "red"),           # > 20%
+        (15.0, "yellow"), (10.0, "yellow"), (20.0, "yellow"),
+    ])
+    def test_should_color_unplanned_percentage(self, unplanned, expected):
+        """Unplanned work is green below 10%, red above 20%, yellow between."""
+        assert get_unplanned_color(unplanned) == expected
+
+    @pytest.mark.parametrize("workload, expected", [
+        (11, "red"), (20, "red"),                     # > 10 items
+        (8, "yellow"), (6, "yellow"), (10, "yellow"),
+        (5, "green"), (3, "green"), (0, "green"),     # <= 5 items
+    ])
+    def test_should_color_workload(self, workload, expected):
+        """Workload is red above 10 items, yellow for 6-10, green up to 5."""
+        assert get_workload_color(workload) == expected
+
+    @pytest.mark.parametrize("not_started, expected", [
+        (6, "red"), (10, "red"),                      # > 5
+        (3, "yellow"), (1, "yellow"), (5, "yellow"),
+        (0, "green"),
+    ])
+    def test_should_color_high_priority_not_started(self, not_started, expected):
+        """High priority not started is red above 5, yellow for 1-5, green at 0."""
+        assert get_high_priority_color(not_started) == expected
 
 
 class TestMetricsWithGrouping:
     """Tests for metrics calculation with grouped data."""
 
-    def test_should_populate_items_by_status_in_metrics(self, sample_raw_items):
+    def test_should_populate_items_by_status_in_metrics(self, sample_metrics):
         """Metrics should include items grouped by status."""
-        from src.processor import parse_items, calculate_metrics
-        
-        items = parse_items(sample_raw_items)
-        metrics = calculate_metrics(items)
-        
-        assert "Todo" in metrics.items_by_status
-        assert "In Progress" in metrics.items_by_status
-        assert "Done" in metrics.items_by_status
-        assert len(metrics.items_by_status["Todo"]) == 1
-        assert len(metrics.items_by_status["In Progress"]) == 1
-        assert len(metrics.items_by_status["Done"]) == 1
-
-    def test_should_populate_items_by_priority_in_metrics(self, sample_raw_items):
+        assert "Todo" in sample_metrics.items_by_status
+        assert "In Progress" in sample_metrics.items_by_status
+        assert "Done" in sample_metrics.items_by_status
+        assert len(sample_metrics.items_by_status["Todo"]) == 1
+        assert len(sample_metrics.items_by_status["In Progress"]) == 1
+        assert len(sample_metrics.items_by_status["Done"]) == 1
+
+    def test_should_populate_items_by_priority_in_metrics(self, sample_metrics):
         """Metrics should include items grouped by priority."""
-        from src.processor import parse_items, calculate_metrics
-        
-        items = parse_items(sample_raw_items)
-        metrics = calculate_metrics(items)
-        
-        assert "P🔥" in metrics.items_by_priority
-        assert "P1" in metrics.items_by_priority
-        assert len(metrics.items_by_priority["P🔥"]) == 1
-        assert len(metrics.items_by_priority["P1"]) == 2
+        assert "P🔥" in sample_metrics.items_by_priority
+        assert "P1" in sample_metrics.items_by_priority
+        assert len(sample_metrics.items_by_priority["P🔥"]) == 1
+        assert len(sample_metrics.items_by_priority["P1"]) == 2
 
-    def test_should_populate_items_by_assignee_in_metrics(self, sample_raw_items):
+    def test_should_populate_items_by_assignee_in_metrics(self, sample_metrics):
         """Metrics should include items grouped by assignee."""
-        from src.processor import parse_items, calculate_metrics
-        
-        items = parse_items(sample_raw_items)
-        metrics = calculate_metrics(items)
-        
-        assert "user1" in metrics.items_by_assignee
-        assert "user2" in metrics.items_by_assignee
-        assert len(metrics.items_by_assignee["user1"]) == 2
-        assert len(metrics.items_by_assignee["user2"]) == 1
-
-    def test_should_handle_empty_items_list_with_grouping(self):
-        """Metrics should handle empty items list gracefully."""
-        from src.processor import calculate_metrics
-        
-        metrics = calculate_metrics([])
-        
-        assert metrics.items_by_status == {}
-        assert metrics.items_by_priority == {}
-        assert metrics.items_by_assignee == {}
+        assert "user1" in sample_metrics.items_by_assignee
+        assert "user2" in sample_metrics.items_by_assignee
+        assert len(sample_metrics.items_by_assignee["user1"]) == 2
+        assert len(sample_metrics.items_by_assignee["user2"]) == 1
+
+    def test_should_populate_group_counts_in_metrics(self, sample_metrics):
+        """Metrics should carry group sizes and active counts per assignee."""
+        assert sample_metrics.status_counts == {"Todo": 1, "In Progress": 1, "Done": 1}
+        assert sample_metrics.priority_counts == {"P🔥": 1, "P1": 2}
+        assert sample_metrics.assignee_counts == {"user1": 2, "user2": 1}
+        assert sample_metrics.assignee_active_counts == {"user1": 1, "user2": 1}
 
 
 
 class TestInvalidDataHandling:
     """Tests for handling invalid or malformed data."""
 
-    def test_should_handle_invalid_priority_value(self):
-        """Should default to P2 for truly invalid priority values."""
-        from src.processor import parse_item
-        
-        raw_item = {
-            "id": "1",
-            "title": "Test",
-            "status": "Todo",
-            "priority": "InvalidPriority",  # Doesn't start with P
-            "assignees": [],
-            "estimate (Hrs)": None,
-            "labels": [],
-            "content": {"url": ""}
-        }
-        
-        item = parse_item(raw_item)
-        
-        assert item.priority.value == "P2"
-
-    def test_should_handle_invalid_status_value(self):
+    @pytest.mark.parametrize("priority, expected", [
+        ("InvalidPriority", Priority.P2),  # Doesn't start with P
+        ("", Priority.P2),
+        (None, Priority.P2),
+        # Corrupted P🔥 encodings seen in real data
+        ("P≡ا¤ح", Priority.FIRE),
+        ("Pًں\"¥", Priority.FIRE),
+        ("P🔥corrupted", Priority.FIRE),
+        ("P█î", Priority.FIRE),
+    ])
+    def test_should_normalize_bad_priority_values(self, make_raw_item, priority, expected):
+        """Corrupted P-something priorities become FIRE; anything else falls back to P2."""
+        assert parse_item(make_raw_item(priority=priority)).priority is expected
+
+    @pytest.mark.parametrize("status", ["InvalidStatus", "", None])
+    def test_should_default_bad_status_values_to_backlog(self, make_raw_item, status):
         """Should default to Backlog for invalid status values."""
-        from src.processor import parse_item
-        
-        raw_item = {
-            "id": "1",
-            "title": "Test",
-            "status": "InvalidStatus",
-            "priority": "P1",
-            "assignees": [],
-            "estimate (Hrs)": None,
-            "labels": [],
-            "content": {"url": ""}
-        }
-        
-        item = parse_item(raw_item)
-        
-        assert item.status.value == "Backlog"
-
-    def test_should_handle_corrupted_fire_emoji(self):
-        """Should recognize corrupted P🔥 emoji as FIRE priority."""
-        from src.processor import parse_item
-        
-        raw_item = {
-            "id": "1",
-            "title": "Test",
-            "status": "Todo",
-            "priority": "P≡ا¤ح",  # Corrupted P🔥 from real data
-            "assignees": [],
-            "estimate (Hrs)": None,
-            "labels": [],
-            "content": {"url": ""}
-        }
-        
-        item = parse_item(raw_item)
-        
-        assert item.priority.value == "P🔥"
-    
-    def test_should_handle_various_corrupted_fire_formats(self):
-        """Should handle various corrupted fire emoji formats."""
-        from src.processor import parse_item
-        from src.models import Priority
-        
-        corrupted_values = ["Pًں\"¥", "P≡ا¤ح", "P🔥corrupted", "P█î"]
-        
-        for corrupted in corrupted_values:
-            raw_item = {
-                "id": "1",
-                "title": "Test",
-                "status": "Todo",
-                "priority": corrupted,
-                "assignees": [],
-                "estimate (Hrs)": None,
-                "labels": [],
-                "content": {"url": ""}
-            }
-            
-            item = parse_item(raw_item)
-            
-            # All corrupted P-something should be treated as FIRE
-            assert item.priority == Priority.FIRE, f"Failed for: {corrupted}"
-
-    def test_should_handle_empty_priority(self):
-        """Should handle empty priority value."""
-        from src.processor import parse_item
-        
-        raw_item = {
-            "id": "1",
-            "title": "Test",
-            "status": "Todo",
-            "priority": "",
-            "assignees": [],
-            "estimate (Hrs)": None,
-            "labels": [],
-            "content": {"url": ""}
-        }
-        
-        item = parse_item(raw_item)
-        
-        assert item.priority.value == "P2"
-
-    def test_should_handle_none_priority(self):
-        """Should handle None priority value."""
-        from src.processor import parse_item
-        
-        raw_item = {
-            "id": "1",
-            "title": "Test",
-            "status": "Todo",
-            "priority": None,
-            "assignees": [],
-            "estimate (Hrs)": None,
-            "labels": [],
-            "content": {"url": ""}
-        }
-        
-        item = parse_item(raw_item)
-        
-        assert item.priority.value == "P2"
+        assert parse_item(make_raw_item(status=status)).status is Status.BACKLOG
 
 
 # Tests for enhanced metrics (Task 1.4)
 
-def test_calculate_todo_count():
+def test_calculate_todo_count(make_item):
     """Test todo count calculation."""
-    from src.processor import calculate_todo_count
-    
     items = [
-        ProjectItem(
-            id="1", title="Task 1", status=Status.TODO, priority=Priority.P1,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="2", title="Task 2", status=Status.TODO, priority=Priority.P2,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="3", title="Task 3", status=Status.IN_PROGRESS, priority=Priority.P1,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="4", title="Task 4", status=Status.DONE, priority=Priority.P2,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
+        make_item(id="1", status=Status.TODO, priority=Priority.P1),
+        make_item(id="2", status=Status.TODO, priority=Priority.P2),
+        make_item(id="3", status=Status.IN_PROGRESS, priority=Priority.P1),
+        make_item(id="4", status=Status.DONE, priority=Priority.P2),
     ]
     
     result = calculate_todo_count(items)
     assert result == 2, f"Expected 2 todo items, got {result}"
 
 
-def test_calculate_done_active_count():
+def test_calculate_done_active_count(make_item):
     """Test done active count excludes backlog."""
-    from src.processor import calculate_done_active_count
-    
     items = [
-        ProjectItem(
-            id="1", title="Task 1", status=Status.DONE, priority=Priority.P1,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="2", title="Task 2", status=Status.DONE, priority=Priority.P2,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="3", title="Task 3", status=Status.TODO, priority=Priority.P1,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
+        make_item(id="1", status=Status.DONE, priority=Priority.P1),
+        make_item(id="2", status=Status.DONE, priority=Priority.P2),
+        make_item(id="3", status=Status.TODO, priority=Priority.P1),
     ]
     
     result = calculate_done_active_count(items)
     assert result == 2, f"Expected 2 done items, got {result}"
 
 
-def test_calculate_unplanned_done_percentage():
+def test_calculate_unplanned_done_percentage(make_item):
     """Test unplanned done percentage with various ratios."""
-    from src.processor import calculate_unplanned_done_stats
-    
     # Test with 50% unplanned done
     items = [
-        ProjectItem(
-            id="1", title="Task 1", status=Status.DONE, priority=Priority.FIRE,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="2", title="Task 2", status=Status.DONE, priority=Priority.P1,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="3", title="Task 3", status=Status.TODO, priority=Priority.FIRE,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
+        make_item(id="1", status=Status.DONE, priority=Priority.FIRE),
+        make_item(id="2", status=Status.DONE, priority=Priority.P1),
+        make_item(id="3", status=Status.TODO, priority=Priority.FIRE),
     ]
     
     percentage, count = calculate_unplanned_done_stats(items)
@@ -669,19 +362,11 @@ def test_calculate_unplanned_done_percentage():
     assert count == 1, f"Expected 1 unplanned done, got {count}"
 
 
-def test_calculate_unplanned_done_percentage_zero_done():
+def test_calculate_unplanned_done_percentage_zero_done(make_item):
     """Test unplanned done percentage when no done items exist."""
-    from src.processor import calculate_unplanned_done_stats
-    
     items = [
-        ProjectItem(
-            id="1", title="Task 1", status=Status.TODO, priority=Priority.FIRE,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="2", title="Task 2", status=Status.IN_PROGRESS, priority=Priority.P1,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
+        make_item(id="1", status=Status.TODO, priority=Priority.FIRE),
+        make_item(id="2", status=Status.IN_PROGRESS, priority=Priority.P1),
     ]
     
     percentage, count = calculate_unplanned_done_stats(items)
@@ -689,23 +374,12 @@ def test_calculate_unplanned_done_percentage_zero_done():
     assert count == 0, f"Expected 0 unplanned done, got {count}"
 
 
-def test_calculate_unplanned_done_percentage_all_unplanned():
+def test_calculate_unplanned_done_percentage_all_unplanned(make_item):
     """Test unplanned done percentage when all done items are unplanned."""
-    from src.processor import calculate_unplanned_done_stats
-    
     items = [
-        ProjectItem(
-            id="1", title="Task 1", status=Status.DONE, priority=Priority.FIRE,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="2", title="Task 2", status=Status.DONE, priority=Priority.FIRE,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="3", title="Task 3", status=Status.DONE, priority=Priority.FIRE,
-            assignees=[], estimate_hours=None, labels=[], url="", repository="", issue_number=None
-        ),
+        make_item(id="1", status=Status.DONE, priority=Priority.FIRE),
+        make_item(id="2", status=Status.DONE, priority=Priority.FIRE),
+        make_item(id="3", status=Status.DONE, priority=Priority.FIRE),
     ]
     
     percentage, count = calculate_unplanned_done_stats(items)
@@ -713,23 +387,12 @@ def test_calculate_unplanned_done_percentage_all_unplanned():
     assert count == 3, f"Expected 3 unplanned done, got {count}"
 
 
-def test_enhanced_metrics_in_calculate_metrics():
+def test_enhanced_metrics_in_calculate_metrics(make_item):
     """Test that enhanced metrics are included in calculate_metrics output."""
-    from src.processor import calculate_metrics
-    
     items = [
-        ProjectItem(
-            id="1", title="Task 1", status=Status.TODO, priority=Priority.P1,
-            assignees=["Alice"], estimate_hours=5.0, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="2", title="Task 2", status=Status.DONE, priority=Priority.FIRE,
-            assignees=["Bob"], estimate_hours=3.0, labels=[], url="", repository="", issue_number=None
-        ),
-        ProjectItem(
-            id="3", title="Task 3", status=Status.DONE, priority=Priority.P2,
-            assignees=["Alice"], estimate_hours=2.0, labels=[], url="", repository="", issue_number=None
-        ),
+        make_item(id="1", status=Status.TODO, priority=Priority.P1, assignees=["Alice"], estimate_hours=5.0),
+        make_item(id="2", status=Status.DONE, priority=Priority.FIRE, assignees=["Bob"], estimate_hours=3.0),
+        make_item(id="3", status=Status.DONE, priority=Priority.P2, assignees=["Alice"], estimate_hours=2.0),
     ]
     
     metrics = calculate_metrics(items)
@@ -744,3 +407,63 @@ def test_enhanced_metrics_in_calculate_metrics():
     assert metrics.done_active_items == 2, f"Expected 2 done items, got {metrics.done_active_items}"
     assert metrics.unplanned_done_percentage == 50.0, f"Expected 50.0%, got {metrics.unplanned_done_percentage}%"
     assert metrics.unplanned_done_count == 1, f"Expected 1 unplanned done, got {metrics.unplanned_done_count}"
+
+
+class TestDateRangeFiltering:
+    """Tests for filter_by_date_range in processor_v2."""
+
+    @staticmethod
+    def _items():
+        from src.processor_v2 import parse_items_v2
+
+        return parse_items_v2([
+            {"id": "1", "issue_created_at": "2025-01-05T10:00:00Z"},
+            {"id": "2", "issue_created_at": "2025-01-20T10:00:00Z"},
+            {"id": "3", "issue_created_at": "2025-02-02T10:00:00Z"},
+            {"id": "4", "issue_created_at": None},
+        ])
+
+    def test_should_filter_items_between_bounds(self):
+        """Should keep only dated items inside the range."""
+        from src.processor_v2 import filter_by_date_range
+
+        result = filter_by_date_range(self._items(), '2025-01-10', '2025-01-31')
+
+        assert [item.id for item in result] == ["2"]
+
+    def test_should_support_open_ended_ranges(self):
+        """Should apply a single bound when the other one is missing."""
+        from src.processor_v2 import filter_by_date_range
+
+        items = self._items()
+
+        assert [item.id for item in filter_by_date_range(items, start_date='2025-01-10')] == ["2", "3"]
+        assert [item.id for item in filter_by_date_range(items, end_date='2025-01-10')] == ["1"]
+
+    def test_should_filter_out_items_for_unknown_date_field(self):
+        """An unknown date_field should match no items rather than raise."""
+        from src.processor_v2 import filter_by_date_range
+
+        result = filter_by_date_range(self._items(), start_date='2025-01-01', date_field='no_such_field')
+
+        assert result == []
+
+
+class TestMetricsV2:
+    """Tests for calculate_metrics_v2 in processor_v2."""
+
+    def test_should_match_v1_metrics_for_same_items(self, sample_raw_items):
+        """Should aggregate v2 items exactly like v1, into the v2 metrics class."""
+        import dataclasses
+        from src.models_v2 import ProjectMetrics as ProjectMetricsV2
+        from src.processor_v2 import parse_items_v2, calculate_metrics_v2
+
+        v1 = calculate_metrics(parse_items(sample_raw_items))
+        v2 = calculate_metrics_v2(parse_items_v2(sample_raw_items))
+
+        assert isinstance(v2, ProjectMetricsV2)
+        for field in dataclasses.fields(ProjectMetricsV2):
+            if not field.name.startswith('items_by_'):
+                assert getattr(v2, field.name) == getattr(v1, field.name), field.name
+        assert v2.status_counts == v1.status_counts
+        assert v2.assignee_active_counts == v1.assignee_active_counts
@@ -1,9 +1,27 @@
 """Tests for snapshot management."""
 
-import pytest
+import dataclasses
 import json
-from pathlib import Path
+import os
 from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.models import ProjectItem, Priority, Status
+from src.snapshot import (
+    _SNAPSHOT_FIELDS,
+    compare_snapshots,
+    load_latest_snapshot,
+    load_snapshot_file,
+    save_snapshot,
+)
+
+
+@pytest.fixture(scope="module")
+def empty_snapshot_dir(tmp_path_factory):
+    """Provide one empty snapshot directory shared by read-only tests in this module."""
+    return tmp_path_factory.mktemp("empty_snapshots")
 
 
 class TestSnapshotSave:
@@ -11,9 +29,6 @@ class TestSnapshotSave:
 
     def test_should_create_snapshots_directory_if_not_exists(self, tmp_path):
         """Should create snapshots directory when saving."""
-        from src.snapshot import save_snapshot
-        from src.models import ProjectItem, Priority, Status
-        
         items = [
             ProjectItem(
                 id="1", title="Test", status=Status.TODO, priority=Priority.P1,
@@ -29,17 +44,10 @@ class TestSnapshotSave:
         assert snapshot_dir.exists()
         assert snapshot_dir.is_dir()
 
-    def test_should_save_snapshot_with_timestamp_filename(self, tmp_path):
+    def test_should_save_snapshot_with_timestamp_filename(self, tmp_path, make_item):
         """Should save snapshot with format snapshot-YYYYMMDD-HHMMSS.json."""
-        from src.snapshot import save_snapshot
-        from src.models import ProjectItem, Priority, Status
-        
         items = [
-            ProjectItem(
-                id="1", title="Test", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Test", status=Status.TODO, priority=Priority.P1)
         ]
         
         snapshot_dir = tmp_path / "snapshots"
@@ -53,9 +61,6 @@ class TestSnapshotSave:
 
     def test_should_save_items_as_json(self, tmp_path):
         """Should save items data in JSON format."""
-        from src.snapshot import save_snapshot
-        from src.models import ProjectItem, Priority, Status
-        
         items = [
             ProjectItem(
                 id="1", title="Test Item", status=Status.TODO, priority=Priority.P1,
@@ -78,17 +83,10 @@ class TestSnapshotSave:
         assert data["items"][0]["id"] == "1"
         assert data["items"][0]["title"] == "Test Item"
 
-    def test_should_include_timestamp_in_snapshot(self, tmp_path):
+    def test_should_include_timestamp_in_snapshot(self, tmp_path, make_item):
         """Should include ISO format timestamp in snapshot data."""
-        from src.snapshot import save_snapshot
-        from src.models import ProjectItem, Priority, Status
-        
         items = [
-            ProjectItem(
-                id="1", title="Test", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Test", status=Status.TODO, priority=Priority.P1)
         ]
         
         snapshot_dir = tmp_path / "snapshots"
@@ -103,9 +101,6 @@ class TestSnapshotSave:
 
     def test_should_serialize_all_item_fields(self, tmp_path):
         """Should serialize all ProjectItem fields correctly."""
-        from src.snapshot import save_snapshot
-        from src.models import ProjectItem, Priority, Status
-        
         items = [
             ProjectItem(
                 id="PVTI_123",
@@ -139,10 +134,12 @@ class TestSnapshotSave:
         assert item["repository"] == "test/repo"
         assert item["issue_number"] == 42
 
+    def test_should_keep_snapshot_fields_in_project_item_order(self):
+        """Snapshot keys should match ProjectItem fields, since items are rebuilt positionally."""
+        assert _SNAPSHOT_FIELDS == tuple(field.name for field in dataclasses.fields(ProjectItem))
+
     def test_should_handle_empty_items_list(self, tmp_path):
         """Should handle saving empty items list."""
-        from src.snapshot import save_snapshot
-        
         snapshot_dir = tmp_path / "snapshots"
         filepath = save_snapshot([], snapshot_dir=str(snapshot_dir))
         
@@ -152,17 +149,10 @@ class TestSnapshotSave:
         assert data["items"] == []
         assert "timestamp" in data
 
-    def test_should_return_filepath(self, tmp_path):
+    def test_should_return_filepath(self, tmp_path, make_item):
         """Should return the path to saved snapshot file."""
-        from src.snapshot import save_snapshot
-        from src.models import ProjectItem, Priority, Status
-        
         items = [
-            ProjectItem(
-                id="1", title="Test", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Test", status=Status.TODO, priority=Priority.P1)
         ]
         
         snapshot_dir = tmp_path / "snapshots"
@@ -176,17 +166,10 @@ class TestSnapshotSave:
 class TestSnapshotComparison:
     """Tests for snapshot comparison logic."""
 
-    def test_should_load_previous_snapshot(self, tmp_path):
+    def test_should_load_previous_snapshot(self, tmp_path, make_item):
         """Should load the most recent snapshot from directory."""
-        from src.snapshot import save_snapshot, load_latest_snapshot
-        from src.models import ProjectItem, Priority, Status
-        
         items = [
-            ProjectItem(
-                id="1", title="Test", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Test", status=Status.TODO, priority=Priority.P1)
         ]
         
         snapshot_dir = tmp_path / "snapshots"
@@ -198,151 +181,146 @@ class TestSnapshotComparison:
         assert len(loaded_items) == 1
         assert loaded_items[0].id == "1"
 
-    def test_should_return_none_when_no_snapshots_exist(self, tmp_path):
+    def test_should_return_none_when_no_snapshots_exist(self, empty_snapshot_dir):
         """Should return None when no previous snapshots exist."""
-        from src.snapshot import load_latest_snapshot
-        
-        snapshot_dir = tmp_path / "snapshots"
-        snapshot_dir.mkdir()
+        loaded_items = load_latest_snapshot(snapshot_dir=str(empty_snapshot_dir))
         
-        loaded_items = load_latest_snapshot(snapshot_dir=str(snapshot_dir))
+        assert loaded_items is None
+
+    def test_should_return_none_when_snapshot_dir_is_missing(self, empty_snapshot_dir):
+        """Should return None, not raise, before the first snapshot directory exists."""
+        loaded_items = load_latest_snapshot(snapshot_dir=str(empty_snapshot_dir / "missing"))
         
         assert loaded_items is None
 
-    def test_should_load_most_recent_snapshot(self, tmp_path):
+    def test_should_load_most_recent_snapshot(self, tmp_path, make_item, monkeypatch):
         """Should load the most recent snapshot when multiple exist."""
-        from src.snapshot import save_snapshot, load_latest_snapshot
-        from src.models import ProjectItem, Priority, Status
-        import time
+        from src import snapshot
         
         snapshot_dir = tmp_path / "snapshots"
+        clock = iter([datetime(2025, 1, 6, 9, 0, 0), datetime(2025, 1, 13, 9, 0, 0)])
+        
+        class FakeDatetime(datetime):
+            """datetime whose now() returns the next scripted timestamp."""
+            
+            @classmethod
+            def now(cls, tz=None):
+                return next(clock)
+        
+        # Distinct filename timestamps without sleeping past a second boundary
+        monkeypatch.setattr(snapshot, 'datetime', FakeDatetime)
         
         # Save first snapshot
         items1 = [
-            ProjectItem(
-                id="1", title="Old", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Old", status=Status.TODO, priority=Priority.P1)
         ]
         save_snapshot(items1, snapshot_dir=str(snapshot_dir))
         
-        time.sleep(0.1)  # Ensure different timestamp
-        
         # Save second snapshot
         items2 = [
-            ProjectItem(
-                id="2", title="New", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="2", title="New", status=Status.TODO, priority=Priority.P1)
         ]
         save_snapshot(items2, snapshot_dir=str(snapshot_dir))
         
         loaded_items = load_latest_snapshot(snapshot_dir=str(snapshot_dir))
         
+        assert sorted(path.name for path in snapshot_dir.iterdir()) == [
+            "snapshot-20250106-090000.json",
+            "snapshot-20250113-090000.json",
+        ]
         assert loaded_items[0].id == "2"
         assert loaded_items[0].title == "New"
 
-    def test_should_calculate_items_completed_since_last_snapshot(self):
-        """Should count items that moved to Done status."""
-        from src.snapshot import compare_snapshots
-        from src.models import ProjectItem, Priority, Status
-        
-        previous = [
-            ProjectItem(
-                id="1", title="Item 1", status=Status.IN_PROGRESS, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            ),
+    def test_should_load_specific_snapshot_file(self, tmp_path):
+        """Should load items from a given snapshot file path."""
+        items = [
             ProjectItem(
-                id="2", title="Item 2", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
+                id="1", title="تست", status=Status.DONE, priority=Priority.FIRE,
+                assignees=["user1"], estimate_hours=2.0, labels=["bug"],
                 url="", repository="", issue_number=None
             )
         ]
+        filepath = save_snapshot(items, snapshot_dir=str(tmp_path / "snapshots"))
+        
+        loaded_items = load_snapshot_file(Path(filepath))
+        
+        assert loaded_items == items
+
+    @pytest.mark.parametrize("field, value, message", [
+        ("status", "Shipped", "not a valid Status"),
+        ("priority", "P9", "not a valid Priority"),
+    ])
+    def test_should_reject_unknown_enum_values(self, tmp_path, make_item, field, value, message):
+        """Unknown status or priority values should raise ValueError, as the enums do."""
+        filepath = Path(save_snapshot([make_item(id="1")], snapshot_dir=str(tmp_path)))
+        data = json.loads(filepath.read_text(encoding='utf-8'))
+        data["items"][0][field] = value
+        filepath.write_text(json.dumps(data), encoding='utf-8')
+        
+        with pytest.raises(ValueError, match=message):
+            load_snapshot_file(filepath)
+
+    def test_should_reuse_parsed_snapshot_until_file_changes(self, tmp_path, make_item):
+        """Should serve an unchanged snapshot from cache and re-read it once rewritten."""
+        filepath = save_snapshot([make_item(id="1")], snapshot_dir=str(tmp_path))
+        
+        first = load_snapshot_file(filepath)
+        second = load_snapshot_file(filepath)
+        
+        assert second == first
+        assert second is not first
+        assert second[0] is first[0]
+        
+        # Overwrite in place and move the mtime so the cache key changes
+        other = save_snapshot([make_item(id="2")], snapshot_dir=str(tmp_path / "other"))
+        os.replace(other, filepath)
+        stat = os.stat(filepath)
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert [item.id for item in load_snapshot_file(filepath)] == ["2"]
+
+    def test_should_calculate_items_completed_since_last_snapshot(self, make_item):
+        """Should count items that moved to Done status."""
+        previous = [
+            make_item(id="1", title="Item 1", status=Status.IN_PROGRESS, priority=Priority.P1),
+            make_item(id="2", title="Item 2", status=Status.TODO, priority=Priority.P1)
+        ]
         
         current = [
-            ProjectItem(
-                id="1", title="Item 1", status=Status.DONE, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            ),
-            ProjectItem(
-                id="2", title="Item 2", status=Status.DONE, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Item 1", status=Status.DONE, priority=Priority.P1),
+            make_item(id="2", title="Item 2", status=Status.DONE, priority=Priority.P1)
         ]
         
         comparison = compare_snapshots(current, previous)
         
         assert comparison["items_completed"] == 2
 
-    def test_should_calculate_new_items_added(self):
+    def test_should_calculate_new_items_added(self, make_item):
         """Should count items that didn't exist in previous snapshot."""
-        from src.snapshot import compare_snapshots
-        from src.models import ProjectItem, Priority, Status
-        
         previous = [
-            ProjectItem(
-                id="1", title="Item 1", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Item 1", status=Status.TODO, priority=Priority.P1)
         ]
         
         current = [
-            ProjectItem(
-                id="1", title="Item 1", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            ),
-            ProjectItem(
-                id="2", title="Item 2", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            ),
-            ProjectItem(
-                id="3", title="Item 3", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Item 1", status=Status.TODO, priority=Priority.P1),
+            make_item(id="2", title="Item 2", status=Status.TODO, priority=Priority.P1),
+            make_item(id="3", title="Item 3", status=Status.TODO, priority=Priority.P1)
         ]
         
         comparison = compare_snapshots(current, previous)
         
         assert comparison["items_added"] == 2
 
-    def test_should_track_status_changes(self):
+    def test_should_track_status_changes(self, make_item):
         """Should track items that changed status."""
-        from src.snapshot import compare_snapshots
-        from src.models import ProjectItem, Priority, Status
-        
         previous = [
-            ProjectItem(
-                id="1", title="Item 1", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            ),
-            ProjectItem(
-                id="2", title="Item 2", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Item 1", status=Status.TODO, priority=Priority.P1),
+            make_item(id="2", title="Item 2", status=Status.TODO, priority=Priority.P1)
         ]
         
         current = [
-            ProjectItem(
-                id="1", title="Item 1", status=Status.IN_PROGRESS, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            ),
-            ProjectItem(
-                id="2", title="Item 2", status=Status.DONE, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Item 1", status=Status.IN_PROGRESS, priority=Priority.P1),
+            make_item(id="2", title="Item 2", status=Status.DONE, priority=Priority.P1)
         ]
         
         comparison = compare_snapshots(current, previous)
@@ -350,17 +328,32 @@ class TestSnapshotComparison:
         assert "status_changes" in comparison
         assert len(comparison["status_changes"]) == 2
 
-    def test_should_handle_comparison_with_no_previous_snapshot(self):
-        """Should handle comparison when previous is None."""
-        from src.snapshot import compare_snapshots
-        from src.models import ProjectItem, Priority, Status
+    def test_should_match_string_status_to_enum_member(self, make_item):
+        """A previous plain-string status should equal the same Status member."""
+        previous = [make_item(id="1", status="Todo")]
+        current = [make_item(id="1", status=Status.TODO)]
+        
+        comparison = compare_snapshots(current, previous)
+        
+        assert comparison["status_changes"] == []
+        assert comparison["items_completed"] == 0
+
+    def test_should_report_changed_string_status(self, make_item):
+        """A previous plain-string status that differs should be reported, not crash."""
+        previous = [make_item(id="1", title="Item 1", status="Todo")]
+        current = [make_item(id="1", title="Item 1", status=Status.DONE)]
+        
+        comparison = compare_snapshots(current, previous)
         
+        assert comparison["status_changes"] == [
+            {"id": "1", "title": "Item 1", "from_status": "Todo", "to_status": "Done"}
+        ]
+        assert comparison["items_completed"] == 1
+
+    def test_should_handle_comparison_with_no_previous_snapshot(self, make_item):
+        """Should handle comparison when previous is None."""
         current = [
-            ProjectItem(
-                id="1", title="Item 1", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Item 1", status=Status.TODO, priority=Priority.P1)
         ]
         
         comparison = compare_snapshots(current, None)
@@ -369,17 +362,10 @@ class TestSnapshotComparison:
         assert comparison["items_added"] == 0
         assert comparison["status_changes"] == []
 
-    def test_should_handle_empty_current_snapshot(self):
+    def test_should_handle_empty_current_snapshot(self, make_item):
         """Should handle comparison with empty current items."""
-        from src.snapshot import compare_snapshots
-        from src.models import ProjectItem, Priority, Status
-        
         previous = [
-            ProjectItem(
-                id="1", title="Item 1", status=Status.TODO, priority=Priority.P1,
-                assignees=[], estimate_hours=None, labels=[],
-                url="", repository="", issue_number=None
-            )
+            make_item(id="1", title="Item 1", status=Status.TODO, priority=Priority.P1)
         ]
         
         comparison = compare_snapshots([], previous)